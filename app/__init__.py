@@ -1,9 +1,11 @@
 from .elemental.settings import init_settings
 from .elemental.cover import get_cover
+from .elemental.security.passwords import configure_password_hashing
 from .settings import ApplicationSettings
 
 app_settings = ApplicationSettings() # noqa
 init_settings(app_settings)
+configure_password_hashing(app_settings.passwords)
 
 def run(runtime: str):
     VALID_MODES = {"cli", "web"}
@@ -15,7 +17,9 @@ def run(runtime: str):
     )
 
     if runtime == 'cli':
-        ...
+        from .gateways.cli import run_cli
+
+        raise SystemExit(run_cli())
 
     elif runtime == 'web':
         import uvicorn
@@ -28,11 +32,12 @@ def run(runtime: str):
                 reload=True,
                 access_log=False
             )
+        elif app_settings.application.workers.count > 1:
+            from .gateways.web.workers import WorkerSupervisor
+
+            WorkerSupervisor(app_settings.application).run()
         else:
             from .gateways.web import app
+            from .gateways.web.workers import DrainingServer, server_config
 
-            uvicorn.run(
-                app,
-                host=app_settings.application.host,
-                port=app_settings.application.port,
-            )
+            DrainingServer(server_config(app, app_settings.application)).run()
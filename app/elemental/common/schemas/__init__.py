@@ -1 +1,2 @@
-from .elemental import ElementalSchema
\ No newline at end of file
+from .elemental import ElementalSchema
+from .pagination import CursorPageMeta, CursorPageSchema, PageMeta, PageSchema
@@ -0,0 +1,33 @@
+from typing import Generic, List, Optional, TypeVar
+
+from .elemental import ElementalSchema
+
+T = TypeVar("T")
+
+
+class CursorPageMeta(ElementalSchema):
+    """Position of a keyset page: pass `next_cursor` / `prev_cursor` back as `cursor`."""
+    limit: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    has_next: bool = False
+    has_prev: bool = False
+
+
+class CursorPageSchema(ElementalSchema, Generic[T]):
+    items: List[T]
+    page: CursorPageMeta
+
+
+class PageMeta(ElementalSchema):
+    """Position of a numbered page. `total` is None when it was not counted."""
+    page: int
+    page_size: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
+    estimated: bool = False
+
+
+class PageSchema(ElementalSchema, Generic[T]):
+    items: List[T]
+    page: PageMeta
@@ -0,0 +1,19 @@
+from .loop_monitor import (
+    EventLoopMonitor,
+    get_loop_monitor,
+    start_loop_monitor,
+    stop_loop_monitor
+)
+from .profiler import SamplingProfiler, profile
+from .memory import MemoryTracer, get_memory_tracer
+
+__all__ = [
+    'EventLoopMonitor',
+    'get_loop_monitor',
+    'start_loop_monitor',
+    'stop_loop_monitor',
+    'SamplingProfiler',
+    'profile',
+    'MemoryTracer',
+    'get_memory_tracer'
+]
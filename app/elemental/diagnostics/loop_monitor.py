@@ -0,0 +1,159 @@
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from logging import Logger
+from typing import Any, Dict, Optional
+
+from ..logging import get_logger
+from ..metrics import get_metrics_registry
+
+_logger: Optional[Logger] = None
+
+
+def get_loop_monitor_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("event_loop_monitor")
+    return _logger
+
+
+class _Probe:
+    __slots__ = ("sent_at", "acked_at", "event")
+
+    def __init__(self):
+        self.sent_at = time.perf_counter()
+        self.acked_at: Optional[float] = None
+        self.event = threading.Event()
+
+    def ack(self) -> None:
+        self.acked_at = time.perf_counter()
+        self.event.set()
+
+
+class EventLoopMonitor:
+    """
+    Samples event-loop lag from a watchdog thread and reports blocking callbacks.
+
+    Every `interval` seconds the watchdog schedules a no-op on the loop and times
+    how long the loop takes to run it; that lag feeds the `event_loop_lag_seconds`
+    histogram. When the probe is not served within `block_threshold`, the loop is
+    stuck in a callback right now, so the watchdog captures the loop thread's
+    stack and logs it together with the route being served.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        block_threshold: float = 0.1,
+        logger: Optional[Logger] = None
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.logger = logger or get_loop_monitor_logger()
+
+        registry = get_metrics_registry()
+        self.lag_histogram = registry.histogram(
+            "event_loop_lag_seconds",
+            "Delay between scheduling a callback and the event loop running it."
+        )
+        self.blocked_counter = registry.counter(
+            "event_loop_blocked_total",
+            "Number of times the event loop was blocked longer than the threshold."
+        )
+
+        # Task -> ASGI scope of the request it serves, maintained by the route middleware.
+        self.requests: Dict[asyncio.Task, Dict[str, Any]] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the watchdog for the running loop. Must be called from the loop thread."""
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + self.block_threshold + 1)
+        self._thread = None
+        self.requests.clear()
+
+    def _watch(self) -> None:
+        while not self._stop.is_set():
+            probe = _Probe()
+            try:
+                self._loop.call_soon_threadsafe(probe.ack)
+            except RuntimeError:
+                return  # loop closed
+
+            if not probe.event.wait(self.block_threshold):
+                self._report_block()
+                while not probe.event.wait(self.interval):
+                    if self._stop.is_set():
+                        return
+
+            self.lag_histogram.observe(probe.acked_at - probe.sent_at)
+            self._stop.wait(self.interval)
+
+    def _report_block(self) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # noqa
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+
+        route = self._current_route()
+        self.blocked_counter.inc(route=route)
+        self.logger.warning(
+            f"Event loop blocked for more than {self.block_threshold * 1000:.0f}ms "
+            f"while serving {route}. Loop thread stack:\n{stack}"
+        )
+
+    def _current_route(self) -> str:
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+
+        scope = self.requests.get(task) if task is not None else None
+        if scope is None:
+            return "<no request>"
+
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        return f"{scope.get('method', '')} {path}".strip()
+
+
+_monitor: Optional[EventLoopMonitor] = None
+
+
+def get_loop_monitor() -> Optional[EventLoopMonitor]:
+    return _monitor
+
+
+def start_loop_monitor(interval: float = 0.25, block_threshold: float = 0.1) -> EventLoopMonitor:
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+    _monitor = EventLoopMonitor(interval=interval, block_threshold=block_threshold)
+    _monitor.start()
+    return _monitor
+
+
+def stop_loop_monitor() -> None:
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
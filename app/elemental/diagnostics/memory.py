@@ -0,0 +1,183 @@
+import os
+import threading
+import tracemalloc
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..exceptions import ConflictError, NotFoundError, ValidationError
+
+# Root of the `app` package; files below it are reported by their dotted module name.
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_APP_PACKAGE = os.path.basename(_APP_ROOT)
+
+_OTHER = "<other>"
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _module_name(filename: str) -> Optional[str]:
+    """Maps a source file to its `app.*` module name, or None outside the package."""
+    relative = os.path.relpath(filename, _APP_ROOT)
+    if relative.startswith(os.pardir) or not relative.endswith(".py"):
+        return None
+    parts = relative[:-3].split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join([_APP_PACKAGE, *parts])
+
+
+class MemoryTracer:
+    """
+    Named tracemalloc snapshots with results grouped by `app.*` module.
+
+    Each allocation is attributed to the most recent frame inside the `app`
+    package, so memory held by a repository or middleware is reported under
+    that module even when the bytes were allocated by SQLAlchemy or the
+    standard library below it. Allocations with no `app` frame in their
+    traceback are reported as ``<other>``.
+    """
+
+    def __init__(self, max_snapshots: int = 5):
+        self.max_snapshots = max_snapshots
+        self.snapshots: "OrderedDict[str, tracemalloc.Snapshot]" = OrderedDict()
+        self._module_cache: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 10) -> None:
+        if not 1 <= frames <= 100:
+            raise ValidationError(message="Traceback depth must be between 1 and 100 frames.")
+        if tracemalloc.is_tracing():
+            raise ConflictError(
+                message=f"Memory tracing is already running with {tracemalloc.get_traceback_limit()} frames."
+            )
+        tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """Stops tracing. Taken snapshots are kept so they can still be compared."""
+        tracemalloc.stop()
+
+    def clear(self) -> None:
+        self.snapshots.clear()
+
+    def take(self, name: str) -> Dict[str, object]:
+        if not tracemalloc.is_tracing():
+            raise ConflictError(message="Memory tracing is not running.")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        with self._lock:
+            self.snapshots.pop(name, None)
+            self.snapshots[name] = snapshot
+            while len(self.snapshots) > self.max_snapshots:
+                self.snapshots.popitem(last=False)
+
+        current, peak = tracemalloc.get_traced_memory()
+        return {"name": name, "traced_bytes": current, "peak_bytes": peak}
+
+    def _get(self, name: str) -> tracemalloc.Snapshot:
+        snapshot = self.snapshots.get(name)
+        if snapshot is None:
+            raise NotFoundError(message=f"Memory snapshot '{name}' does not exist.")
+        return snapshot
+
+    def _owner(self, traceback: tracemalloc.Traceback) -> Tuple[str, str]:
+        # Traceback frames go from the oldest call to the most recent one.
+        for frame in reversed(traceback):
+            module = self._module_cache.get(frame.filename, _OTHER)
+            if module is _OTHER:
+                module = self._module_cache[frame.filename] = _module_name(frame.filename)
+            if module is not None:
+                return module, f"{module}:{frame.lineno}"
+        frame = traceback[-1]
+        return _OTHER, f"{frame.filename}:{frame.lineno}"
+
+    def _group(self, snapshot: tracemalloc.Snapshot) -> Dict[str, dict]:
+        modules: Dict[str, dict] = {}
+        for stat in snapshot.statistics("traceback"):
+            module, site = self._owner(stat.traceback)
+            entry = modules.get(module)
+            if entry is None:
+                entry = modules[module] = {"size": 0, "count": 0, "sites": {}}
+            entry["size"] += stat.size
+            entry["count"] += stat.count
+            sizes = entry["sites"].get(site, (0, 0))
+            entry["sites"][site] = (sizes[0] + stat.size, sizes[1] + stat.count)
+        return modules
+
+    @staticmethod
+    def _top_sites(sites: Dict[str, Tuple[int, int]], limit: int, key) -> List[dict]:
+        ranked = sorted(sites.items(), key=key, reverse=True)[:limit]
+        return [{"site": site, "size": size, "count": count} for site, (size, count) in ranked]
+
+    def top(self, name: str, limit: int = 20) -> Dict[str, object]:
+        """Returns the `limit` largest modules of a snapshot with their heaviest allocation sites."""
+        modules = self._group(self._get(name))
+        ranked = sorted(modules.items(), key=lambda item: item[1]["size"], reverse=True)[:limit]
+
+        return {
+            "snapshot": name,
+            "total_size": sum(entry["size"] for entry in modules.values()),
+            "modules": [
+                {
+                    "module": module,
+                    "size": entry["size"],
+                    "count": entry["count"],
+                    "sites": self._top_sites(entry["sites"], limit, key=lambda item: item[1][0]),
+                }
+                for module, entry in ranked
+            ],
+        }
+
+    def diff(self, base: str, target: str, limit: int = 20) -> Dict[str, object]:
+        """Returns the modules whose retained memory changed the most from `base` to `target`."""
+        old = self._group(self._get(base))
+        new = self._group(self._get(target))
+
+        changes = []
+        for module in old.keys() | new.keys():
+            before = old.get(module, {"size": 0, "count": 0, "sites": {}})
+            after = new.get(module, {"size": 0, "count": 0, "sites": {}})
+            size_diff = after["size"] - before["size"]
+            if size_diff == 0 and after["count"] == before["count"]:
+                continue
+
+            sites = {}
+            for site in before["sites"].keys() | after["sites"].keys():
+                old_size, old_count = before["sites"].get(site, (0, 0))
+                new_size, new_count = after["sites"].get(site, (0, 0))
+                if new_size != old_size:
+                    sites[site] = (new_size - old_size, new_count - old_count)
+
+            changes.append({
+                "module": module,
+                "size": after["size"],
+                "size_diff": size_diff,
+                "count_diff": after["count"] - before["count"],
+                "sites": self._top_sites(sites, limit, key=lambda item: abs(item[1][0])),
+            })
+
+        changes.sort(key=lambda change: abs(change["size_diff"]), reverse=True)
+        return {
+            "base": base,
+            "target": target,
+            "size_diff": sum(change["size_diff"] for change in changes),
+            "modules": changes[:limit],
+        }
+
+
+_tracer: Optional[MemoryTracer] = None
+
+
+def get_memory_tracer(max_snapshots: int = 5) -> MemoryTracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = MemoryTracer(max_snapshots=max_snapshots)
+    return _tracer
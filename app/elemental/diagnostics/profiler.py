@@ -0,0 +1,132 @@
+import sys
+import asyncio
+import threading
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..exceptions import ConflictError, ValidationError
+
+# Leaf functions that mean "thread is parked", dropped unless idle frames are requested.
+_IDLE_LEAVES = frozenset({"select", "poll", "wait", "_wait_for_tstate_lock", "accept"})
+
+_session_lock = threading.Lock()
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler driven by a timer thread.
+
+    Each tick reads ``sys._current_frames()`` and counts the stack of every
+    sampled thread, keyed by code objects only; frame names are formatted once
+    when the report is built. The output is the collapsed-stack format
+    (``outer;inner;leaf count``) consumed by flamegraph.pl and speedscope.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        thread_ids: Optional[Iterable[int]] = None,
+        include_idle: bool = False
+    ):
+        self.interval = interval
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.include_idle = include_idle
+
+        self.samples: Counter = Counter()
+        self.ticks = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.ticks += 1
+            for thread_id, frame in sys._current_frames().items():  # noqa
+                if thread_id == own_id:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                self.samples[(thread_id, self._stack(frame))] += 1
+
+    @staticmethod
+    def _stack(frame: Optional[FrameType]) -> Tuple[CodeType, ...]:
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    def collapsed(self) -> str:
+        """Renders the collected samples as collapsed stacks, heaviest first."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        labels: Dict[CodeType, str] = {}
+
+        lines = Counter()
+        for (thread_id, stack), count in self.samples.items():
+            if not stack:
+                continue
+            if not self.include_idle and stack[-1].co_name in _IDLE_LEAVES:
+                continue
+
+            parts = [names.get(thread_id, f"thread-{thread_id}")]
+            for code in stack:
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                parts.append(label)
+            lines[";".join(parts)] += count
+
+        return "\n".join(f"{stack} {count}" for stack, count in lines.most_common()) + "\n"
+
+
+async def profile(
+    seconds: float,
+    *,
+    interval: float = 0.01,
+    all_threads: bool = False,
+    include_idle: bool = False,
+    max_seconds: float = 60.0
+) -> str:
+    """
+    Profiles the running process for `seconds` and returns collapsed stacks.
+
+    By default only the event-loop thread is sampled. The loop keeps serving
+    requests meanwhile. Only one session may run per process.
+
+    Raises:
+        ValidationError: If the duration or interval is out of range.
+        ConflictError: If another profiling session is already running.
+    """
+    if not 0 < seconds <= max_seconds:
+        raise ValidationError(message=f"Profiling duration must be between 0 and {max_seconds} seconds.")
+    if not 0.001 <= interval <= 1:
+        raise ValidationError(message="Sampling interval must be between 1ms and 1s.")
+
+    if not _session_lock.acquire(blocking=False):
+        raise ConflictError(message="A profiling session is already running.")
+
+    try:
+        thread_ids = None if all_threads else [threading.get_ident()]
+        profiler = SamplingProfiler(interval=interval, thread_ids=thread_ids, include_idle=include_idle)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        return profiler.collapsed()
+    finally:
+        _session_lock.release()
@@ -1,3 +1,8 @@
 from .roles import *
 from .tokens import *
-from .passwords import *
\ No newline at end of file
+from .passwords import *
+from .throttling import *
+from .rbac import *
+from .policies import *
+from .apikeys import *
+from .principals import *
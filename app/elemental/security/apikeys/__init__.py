@@ -0,0 +1,9 @@
+from .store import (
+    API_KEY_TOKEN_TYPE,
+    APIKeyRecord,
+    APIKeyAuthenticator,
+    get_api_key_authenticator,
+    set_api_key_loader,
+    set_api_key_usage_writer
+)
+from .settings import ElementalAPIKeySettings
@@ -0,0 +1,39 @@
+from typing import Optional
+from pydantic import Field, SecretStr
+
+from ...common.schemas import ElementalSchema
+
+
+class _APIKeyCache(ElementalSchema):
+    ttl: float = Field(default=30.0, ge=0)
+    negative_ttl: float = Field(default=5.0, ge=0)
+    max_entries: int = Field(default=10_000, ge=1)
+
+
+class _APIKeyUsage(ElementalSchema):
+    flush_interval: float = Field(default=15.0, gt=0)
+    batch_size: int = Field(default=500, ge=1)
+
+
+class ElementalAPIKeySettings(ElementalSchema):
+    """
+    API-key authentication for machine clients.
+
+    Keys look like ``<prefix>.<secret>``. Only the prefix (indexed) and an
+    HMAC-SHA256 digest of the secret are stored; `secret` is the HMAC key and
+    falls back to `jwt.secret_key` when unset. Looked-up records are cached
+    for `cache.ttl` seconds (unknown prefixes for `cache.negative_ttl`), so a
+    revoked or changed key takes at most that long to stop working on every
+    worker. Last-used timestamps are collected in memory and written every
+    `usage.flush_interval` seconds in batches of `usage.batch_size`.
+
+    Off by default: enabling it needs a key loader and one of the two secrets.
+    """
+    enabled: bool = False
+    header: str = "X-API-Key"
+    secret: Optional[SecretStr] = Field(default=None, min_length=16, repr=False)
+    prefix_length: int = Field(default=12, ge=8, le=32)
+    secret_length: int = Field(default=32, ge=16, le=64)
+
+    cache: _APIKeyCache = _APIKeyCache()
+    usage: _APIKeyUsage = _APIKeyUsage()
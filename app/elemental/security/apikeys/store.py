@@ -0,0 +1,304 @@
+import hmac
+import time
+import asyncio
+import hashlib
+import secrets
+import threading
+from logging import Logger
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from ..rbac import get_rbac
+from ...logging import get_logger
+from ...metrics import get_metrics_registry
+from ...exceptions import ConfigurationError
+
+API_KEY_TOKEN_TYPE = "api_key"
+
+RoleName = Union[str, int]
+
+_logger: Optional[Logger] = None
+
+
+def get_api_key_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("api_keys")
+    return _logger
+
+
+class APIKeyRecord:
+    """
+    What the database holds for one key: its prefix, the HMAC digest of its
+    secret and the principal it authenticates as.
+
+    The payload handed to route dependencies is built once per record, in the
+    same shape as an access token's (`sub`, `role`, permission mask), so
+    `require_roles` and `require_permission` work unchanged for API keys.
+    """
+
+    __slots__ = ("prefix", "digest", "subject", "role", "expires_at", "payload")
+
+    def __init__(
+        self,
+        prefix: str,
+        digest: bytes,
+        subject: str,
+        role: Optional[RoleName] = None,
+        permissions: Iterable[str] = (),
+        expires_at: Optional[float] = None,
+        claims: Optional[dict] = None
+    ):
+        self.prefix = prefix
+        self.digest = digest
+        self.subject = str(subject)
+        self.role = role
+        self.expires_at = expires_at
+
+        payload = dict(claims or {})
+        if role is not None:
+            payload.update(get_rbac().token_claims(role, permissions))
+        payload.update({"sub": self.subject, "type": API_KEY_TOKEN_TYPE, "api_key": prefix})
+        if expires_at is not None:
+            payload["exp"] = int(expires_at)
+        self.payload = payload
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+# Reads the record stored under a prefix (one indexed lookup), or None.
+APIKeyLoader = Callable[[str], Awaitable[Optional[APIKeyRecord]]]
+# Persists a batch of `prefix -> last used timestamp`.
+APIKeyUsageWriter = Callable[[Dict[str, float]], Awaitable[None]]
+
+
+class APIKeyAuthenticator:
+    """
+    Verifies ``<prefix>.<secret>`` API keys.
+
+    The prefix is public and indexed, so finding the candidate record is a
+    single lookup; the secret is checked by comparing its HMAC-SHA256 digest
+    with `hmac.compare_digest`. Keys are random and long, so a keyed hash is
+    enough - there is no password to protect with a slow hash, and a request
+    costs one HMAC instead of one bcrypt run.
+
+    Records (and misses) stay in a small TTL cache, and concurrent misses on
+    the same prefix share one loader call. Successful authentications only
+    note the time in memory; the background loop hands those timestamps to the
+    usage writer in batches.
+    """
+
+    def __init__(
+        self,
+        secret: Union[str, bytes],
+        loader: Optional[APIKeyLoader] = None,
+        usage_writer: Optional[APIKeyUsageWriter] = None,
+        prefix_length: int = 12,
+        secret_length: int = 32,
+        cache_ttl: float = 30.0,
+        negative_ttl: float = 5.0,
+        max_entries: int = 10_000,
+        flush_interval: float = 15.0,
+        batch_size: int = 500
+    ):
+        self._secret = secret.encode() if isinstance(secret, str) else secret
+        self.loader = loader
+        self.usage_writer = usage_writer
+        self.prefix_length = prefix_length
+        self.secret_length = secret_length
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._entries: "OrderedDict[str, Tuple[float, Optional[APIKeyRecord]]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+        self._usage: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        registry = get_metrics_registry()
+        self.hits = registry.counter("api_key_cache_hits_total", "API key lookups served from the cache.")
+        self.misses = registry.counter("api_key_cache_misses_total", "API key lookups that reached the loader.")
+
+    def digest(self, secret: str) -> bytes:
+        return hmac.new(self._secret, secret.encode(), hashlib.sha256).digest()
+
+    def generate(self) -> Tuple[str, str, bytes]:
+        """
+        Creates a new key. Returns ``(key, prefix, digest)``: show `key` to the
+        client once and store only `prefix` and `digest`.
+        """
+        prefix = secrets.token_hex(self.prefix_length // 2 + 1)[:self.prefix_length]
+        secret = secrets.token_urlsafe(self.secret_length)
+        return f"{prefix}.{secret}", prefix, self.digest(secret)
+
+    def _split(self, key: str) -> Optional[Tuple[str, str]]:
+        prefix, separator, secret = key.partition(".")
+        if not separator or len(prefix) != self.prefix_length or not secret:
+            return None
+        return prefix, secret
+
+    def _cached(self, prefix: str, now: float) -> Tuple[bool, Optional[APIKeyRecord]]:
+        with self._lock:
+            entry = self._entries.get(prefix)
+            if entry is None:
+                return False, None
+            if entry[0] <= now:
+                del self._entries[prefix]
+                return False, None
+            self._entries.move_to_end(prefix)
+            return True, entry[1]
+
+    def _store(self, prefix: str, record: Optional[APIKeyRecord], now: float) -> None:
+        ttl = self.cache_ttl if record is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[prefix] = (now + ttl, record)
+            self._entries.move_to_end(prefix)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def _load(self, prefix: str) -> Optional[APIKeyRecord]:
+        now = time.time()
+        found, record = self._cached(prefix, now)
+        if found:
+            self.hits.inc()
+            return record
+
+        self.misses.inc()
+        pending = self._pending.get(prefix)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        if self.loader is None:
+            raise ConfigurationError("No API key loader is registered.")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[prefix] = future
+        try:
+            record = await self.loader(prefix)
+            self._store(prefix, record, now)
+            future.set_result(record)
+            return record
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved: with no waiters it would otherwise be logged as unhandled.
+            future.exception()
+            raise
+        finally:
+            del self._pending[prefix]
+
+    async def authenticate(self, key: str) -> Optional[dict]:
+        """Returns the key's payload, or None when the key is unknown, wrong or expired."""
+        parts = self._split(key)
+        if parts is None:
+            return None
+        prefix, secret = parts
+
+        record = await self._load(prefix)
+        # The digest is computed even for unknown prefixes, so timing does not tell them apart.
+        digest = self.digest(secret)
+        if record is None or not hmac.compare_digest(digest, record.digest):
+            return None
+
+        now = time.time()
+        if record.expired(now):
+            return None
+
+        self._usage[prefix] = now
+        return dict(record.payload)
+
+    def invalidate(self, prefix: str) -> bool:
+        """Drops a cached record, e.g. right after the key was revoked or rotated."""
+        with self._lock:
+            return self._entries.pop(prefix, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def flush(self) -> None:
+        """Writes the collected last-used timestamps in batches."""
+        if not self._usage:
+            return
+        usage, self._usage = self._usage, {}
+        if self.usage_writer is None:
+            return
+
+        items = list(usage.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = dict(items[start:start + self.batch_size])
+            try:
+                await self.usage_writer(batch)
+            except Exception as e:
+                get_api_key_logger().error(f"API key usage write failed ({len(batch)} keys): {e!r}")
+                # Keep the batch for the next flush unless newer timestamps already replaced it.
+                for prefix, used_at in batch.items():
+                    self._usage.setdefault(prefix, used_at)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        if self.usage_writer is None or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._flush_loop(), name="api-key-usage-flush")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+
+_authenticator: Optional[APIKeyAuthenticator] = None
+
+
+def get_api_key_authenticator() -> APIKeyAuthenticator:
+    global _authenticator
+    if _authenticator is None:
+        from ...settings import get_settings
+
+        settings = get_settings()
+        api_keys = settings.api_keys
+        secret = api_keys.secret or settings.jwt.secret_key
+        if secret is None:
+            raise ConfigurationError("API keys need api_keys.secret (or jwt.secret_key) to be set.")
+
+        _authenticator = APIKeyAuthenticator(
+            secret.get_secret_value(),
+            prefix_length=api_keys.prefix_length,
+            secret_length=api_keys.secret_length,
+            cache_ttl=api_keys.cache.ttl,
+            negative_ttl=api_keys.cache.negative_ttl,
+            max_entries=api_keys.cache.max_entries,
+            flush_interval=api_keys.usage.flush_interval,
+            batch_size=api_keys.usage.batch_size
+        )
+    return _authenticator
+
+
+def set_api_key_loader(loader: APIKeyLoader) -> None:
+    """
+    Registers the coroutine that reads an API key by prefix.
+
+    It must return an `APIKeyRecord` (or None) from a lookup on an indexed,
+    unique prefix column; revoked keys should simply not be returned.
+    """
+    get_api_key_authenticator().loader = loader
+
+
+def set_api_key_usage_writer(writer: APIKeyUsageWriter) -> None:
+    """Registers the coroutine that persists `prefix -> last used` batches."""
+    get_api_key_authenticator().usage_writer = writer
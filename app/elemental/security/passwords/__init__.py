@@ -2,6 +2,18 @@ from .utils import (
     get_password_hash,
     verify_password,
     needs_rehashing,
+    verify_and_upgrade_password,
+    configure_password_hashing,
     validate_password_strength,
     generate_secure_password,
-)
\ No newline at end of file
+)
+from .hasher import (
+    PasswordHasherPool,
+    get_password_hasher,
+    shutdown_password_hasher,
+    async_get_password_hash,
+    async_verify_password,
+    async_verify_and_upgrade_password,
+)
+from .calibration import calibrate
+from .settings import ElementalPasswordSettings
@@ -0,0 +1,95 @@
+import time
+import statistics
+from typing import Callable, Dict, List
+
+from passlib.hash import bcrypt
+
+_SAMPLE_PASSWORD = "Calibration-Sample-Password-42"
+
+
+def _measure(hasher: Callable[[str], str], samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher(_SAMPLE_PASSWORD)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def _pick(measurements: List[Dict[str, float]], target: float) -> Dict[str, float]:
+    # Most expensive cost that stays within the target; the cheapest one if none does.
+    within = [entry for entry in measurements if entry["seconds"] <= target]
+    return within[-1] if within else measurements[0]
+
+
+def calibrate_bcrypt(target_ms: float, samples: int = 3, min_rounds: int = 8, max_rounds: int = 16) -> dict:
+    """
+    Times bcrypt on this machine and picks the highest cost under `target_ms`.
+
+    Each extra round doubles the work, so measuring stops at the first cost
+    over the target.
+    """
+    target = target_ms / 1000
+    measurements: List[Dict[str, float]] = []
+
+    # The first hash pays for backend loading; keep it out of the timings.
+    bcrypt.using(rounds=4).hash(_SAMPLE_PASSWORD)
+
+    for rounds in range(min_rounds, max_rounds + 1):
+        handler = bcrypt.using(rounds=rounds)
+        seconds = _measure(handler.hash, samples)
+        measurements.append({"bcrypt_rounds": rounds, "seconds": seconds})
+        if seconds > target:
+            break
+
+    return {"scheme": "bcrypt", "choice": _pick(measurements, target), "measurements": measurements}
+
+
+def calibrate_argon2(
+    target_ms: float,
+    samples: int = 3,
+    memory_cost: int = 65536,
+    parallelism: int = 1,
+    max_time_cost: int = 10
+) -> dict:
+    """
+    Times argon2id with a fixed memory cost and picks the highest `time_cost`
+    under `target_ms`. Requires the `argon2-cffi` package.
+    """
+    from passlib.hash import argon2
+
+    target = target_ms / 1000
+    measurements: List[Dict[str, float]] = []
+
+    argon2.using(type="ID", time_cost=1, memory_cost=8, parallelism=1).hash(_SAMPLE_PASSWORD)
+
+    for time_cost in range(1, max_time_cost + 1):
+        handler = argon2.using(type="ID", time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        seconds = _measure(handler.hash, samples)
+        measurements.append({
+            "time_cost": time_cost,
+            "memory_cost": memory_cost,
+            "parallelism": parallelism,
+            "seconds": seconds,
+        })
+        if seconds > target:
+            break
+
+    return {"scheme": "argon2", "choice": _pick(measurements, target), "measurements": measurements}
+
+
+def calibrate(
+    scheme: str,
+    target_ms: float,
+    samples: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 1
+) -> dict:
+    """Runs the calibration of `scheme` ("bcrypt" or "argon2")."""
+    if scheme == "argon2":
+        return calibrate_argon2(
+            target_ms, samples,
+            memory_cost=argon2_memory_cost,
+            parallelism=argon2_parallelism
+        )
+    return calibrate_bcrypt(target_ms, samples)
@@ -0,0 +1,143 @@
+import time
+import asyncio
+import multiprocessing
+from logging import Logger
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+from ...logging import get_logger
+from ...metrics import get_metrics_registry
+from .settings import ElementalPasswordSettings
+from .utils import get_password_hash, verify_password, verify_and_upgrade_password
+
+_logger: Optional[Logger] = None
+
+
+def get_hasher_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("password_hasher")
+    return _logger
+
+
+class PasswordHasherPool:
+    """
+    Runs password hashing off the event loop.
+
+    A bcrypt verify costs hundreds of milliseconds of CPU; awaiting it here
+    keeps the loop serving other requests. Work goes to a dedicated process
+    pool so it does not compete for the GIL either, with a thread pool as
+    fallback where child processes cannot be started. A semaphore bounds the
+    hashes running at once per worker; the time spent waiting for it is
+    exported as `password_hash_queue_seconds`.
+    """
+
+    def __init__(self, executor: str = "process", max_workers: int = 2, max_concurrency: int = 2):
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        registry = get_metrics_registry()
+        self.queue_histogram = registry.histogram(
+            "password_hash_queue_seconds",
+            "Time a password hash waited for a free hashing slot."
+        )
+        self.duration_histogram = registry.histogram(
+            "password_hash_seconds",
+            "Wall time of a password hash or verification, queueing included."
+        )
+
+    @classmethod
+    def from_settings(cls, settings: ElementalPasswordSettings) -> "PasswordHasherPool":
+        return cls(
+            executor=settings.pool.executor,
+            max_workers=settings.pool.max_workers,
+            max_concurrency=settings.pool.max_concurrency
+        )
+
+    def _thread_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                except (OSError, NotImplementedError, ImportError) as e:
+                    get_hasher_logger().warning(f"Process pool unavailable ({e!r}); hashing on threads.")
+                    self._executor = self._thread_executor()
+            else:
+                self._executor = self._thread_executor()
+        return self._executor
+
+    async def run(self, operation: str, func: Callable[..., Any], *args) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+
+        async with self._semaphore:
+            self.queue_histogram.observe(time.perf_counter() - started, operation=operation)
+            try:
+                result = await loop.run_in_executor(self._get_executor(), func, *args)
+            except BrokenProcessPool:
+                get_hasher_logger().warning("Password hashing process pool broke; switching to threads.")
+                self._executor = self._thread_executor()
+                result = await loop.run_in_executor(self._executor, func, *args)
+
+        self.duration_histogram.observe(time.perf_counter() - started, operation=operation)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+
+
+_pool: Optional[PasswordHasherPool] = None
+
+
+def get_password_hasher() -> PasswordHasherPool:
+    global _pool
+    if _pool is None:
+        from ...settings import get_settings
+
+        settings = getattr(get_settings(), "passwords", None) or ElementalPasswordSettings()
+        _pool = PasswordHasherPool.from_settings(settings)
+    return _pool
+
+
+def shutdown_password_hasher() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+async def async_get_password_hash(password: str) -> str:
+    """Async counterpart of `get_password_hash` that does not block the event loop."""
+    return await get_password_hasher().run("hash", get_password_hash, password)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Async counterpart of `verify_password` that does not block the event loop."""
+    return await get_password_hasher().run("verify", verify_password, plain_password, hashed_password)
+
+
+async def async_verify_and_upgrade_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Async counterpart of `verify_and_upgrade_password`."""
+    return await get_password_hasher().run(
+        "verify", verify_and_upgrade_password, plain_password, hashed_password
+    )
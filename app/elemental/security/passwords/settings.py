@@ -0,0 +1,40 @@
+from typing import Literal
+
+from pydantic import Field
+
+from ...common.schemas import ElementalSchema
+
+
+class _HashingPool(ElementalSchema):
+    executor: Literal["process", "thread"] = "process"
+    max_workers: int = Field(default=2, ge=1)
+    max_concurrency: int = Field(default=2, ge=1)
+
+
+class _Argon2(ElementalSchema):
+    time_cost: int = Field(default=3, ge=1)
+    memory_cost: int = Field(default=65536, ge=8, description="KiB")
+    parallelism: int = Field(default=1, ge=1)
+
+
+class ElementalPasswordSettings(ElementalSchema):
+    """
+    Password hashing configuration.
+
+    Attributes:
+        scheme: Scheme for new hashes. Hashes of the other scheme, or of the same
+            scheme with a lower cost, are reported by `needs_rehashing` and
+            upgraded by `verify_and_upgrade_password`. "argon2" needs the
+            `argon2-cffi` package.
+        bcrypt_rounds: bcrypt cost factor (log2 of the iterations). Use the
+            `passwords calibrate` CLI command to pick it for the deployment hardware.
+        argon2: argon2id parameters, used when `scheme` is "argon2".
+        pool: Executor used by the async hashing API. Hashing runs in a
+            dedicated process pool (falling back to threads where processes
+            cannot be started) and at most `max_concurrency` hashes run at
+            once per worker; further calls wait in line.
+    """
+    scheme: Literal["bcrypt", "argon2"] = "bcrypt"
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    argon2: _Argon2 = _Argon2()
+    pool: _HashingPool = _HashingPool()
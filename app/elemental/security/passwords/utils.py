@@ -1,9 +1,10 @@
 import re
 import secrets
 import string
+from typing import Optional, Tuple
 from passlib.context import CryptContext
 
-from ...exceptions import InvalidLengthError, ValidationError
+from ...exceptions import ConfigurationError, InvalidLengthError, ValidationError
 
 
 # Specialized error for password rules
@@ -25,6 +26,35 @@ _pwd_context = CryptContext(
 )
 
 
+def configure_password_hashing(settings) -> None:
+    """
+    Applies `ElementalPasswordSettings` to the shared hashing context.
+
+    The configured scheme hashes new passwords; the other scheme stays
+    verifiable but deprecated, and bcrypt hashes below the configured cost
+    count as outdated, so `verify_and_upgrade_password` moves users over.
+    """
+    if settings.scheme == "argon2":
+        try:
+            import argon2  # noqa: F401
+        except ImportError:
+            raise ConfigurationError("passwords.scheme is 'argon2' but the 'argon2-cffi' package is not installed.")
+        schemes = ["argon2", "bcrypt"]
+    else:
+        schemes = ["bcrypt", "argon2"]
+
+    _pwd_context.load(dict(
+        schemes=schemes,
+        deprecated="auto",
+        bcrypt__rounds=settings.bcrypt_rounds,
+        bcrypt__min_rounds=settings.bcrypt_rounds,
+        argon2__type="ID",
+        argon2__time_cost=settings.argon2.time_cost,
+        argon2__memory_cost=settings.argon2.memory_cost,
+        argon2__parallelism=settings.argon2.parallelism,
+    ))
+
+
 def get_password_hash(password: str) -> str:
     return _pwd_context.hash(password)
 
@@ -37,6 +67,18 @@ def needs_rehashing(hashed_password: str) -> bool:
     return _pwd_context.needs_update(hashed_password)
 
 
+def verify_and_upgrade_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies a password and rehashes it when the stored hash is outdated.
+
+    Returns:
+        (valid, new_hash). `new_hash` is None unless the password is valid and
+        the stored hash needs rehashing; callers persist it in the same
+        transaction as the login.
+    """
+    return _pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def validate_password_strength(
         password: str,
         *,
@@ -0,0 +1,12 @@
+from .policy import Policy, CompiledPolicy
+from .rules import (
+    Rule,
+    Always,
+    HasRole,
+    HasPermission,
+    FieldMatchesClaim,
+    Owner,
+    FieldIs,
+    AllOf,
+    AnyOf
+)
@@ -0,0 +1,59 @@
+from typing import Any, Dict, Type
+
+from sqlalchemy.sql.elements import ColumnElement
+
+from ...exceptions import ForbiddenError
+from .rules import Check, Filter, Rule
+
+
+class CompiledPolicy:
+    """A policy bound to one model: per-action closures for objects and queries."""
+
+    def __init__(self, name: str, model: Type, rules: Dict[str, Rule]):
+        self.name = name
+        self.model = model
+        self._checks: Dict[str, Check] = {action: rule.compile_check(model) for action, rule in rules.items()}
+        self._filters: Dict[str, Filter] = {action: rule.compile_filter(model) for action, rule in rules.items()}
+
+    def allows(self, action: str, payload: dict, obj: Any) -> bool:
+        check = self._checks.get(action)
+        return check is not None and check(payload, obj)
+
+    def authorize(self, action: str, payload: dict, obj: Any) -> Any:
+        """Returns `obj` or raises ForbiddenError."""
+        if not self.allows(action, payload, obj):
+            raise ForbiddenError(f"Not allowed to {action} this {self.model.__name__}.")
+        return obj
+
+    def filter(self, action: str, payload: dict) -> ColumnElement:
+        """WHERE condition selecting exactly the rows `payload` may `action`."""
+        build = self._filters.get(action)
+        if build is None:
+            raise ForbiddenError(f"Action '{action}' is not allowed on {self.model.__name__}.")
+        return build(payload)
+
+
+class Policy:
+    """
+    Declarative per-action authorization rules for a model.
+
+        posts_policy = Policy(
+            "posts",
+            read=FieldIs("deleted_at", None) & (Owner() | HasRole("moderator")),
+            update=Owner(),
+        )
+
+    Actions without a rule are denied. Compiling for a model happens once and
+    is cached.
+    """
+
+    def __init__(self, name: str, **rules: Rule):
+        self.name = name
+        self.rules = rules
+        self._compiled: Dict[Type, CompiledPolicy] = {}
+
+    def compile(self, model: Type) -> CompiledPolicy:
+        compiled = self._compiled.get(model)
+        if compiled is None:
+            compiled = self._compiled[model] = CompiledPolicy(self.name, model, self.rules)
+        return compiled
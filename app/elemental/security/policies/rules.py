@@ -0,0 +1,182 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Union
+
+from sqlalchemy import and_, false, or_, true
+from sqlalchemy.sql.elements import ColumnElement
+
+from ...exceptions import ConfigurationError
+from ..rbac import get_rbac
+
+Check = Callable[[dict, Any], bool]
+Filter = Callable[[dict], ColumnElement]
+
+
+def _column(model, field: str):
+    column = getattr(model, field, None)
+    if column is None:
+        raise ConfigurationError(f"Policy references unknown field '{model.__name__}.{field}'.")
+    return column
+
+
+class Rule(ABC):
+    """
+    A declarative authorization condition.
+
+    Rules are compiled against a model once: `compile_check` returns a closure
+    deciding for a loaded object, `compile_filter` one producing the matching
+    SQL condition. Attribute names and columns are resolved at compile time.
+    """
+
+    @abstractmethod
+    def compile_check(self, model) -> Check:
+        pass
+
+    @abstractmethod
+    def compile_filter(self, model) -> Filter:
+        pass
+
+    def __and__(self, other: "Rule") -> "Rule":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Rule") -> "Rule":
+        return AnyOf(self, other)
+
+
+class _PrincipalRule(Rule):
+    """A rule that only looks at the principal: the SQL filter is a constant."""
+
+    @abstractmethod
+    def allows(self, payload: dict) -> bool:
+        pass
+
+    def compile_check(self, model) -> Check:
+        allows = self.allows
+        return lambda payload, obj: allows(payload)
+
+    def compile_filter(self, model) -> Filter:
+        allows = self.allows
+        return lambda payload: true() if allows(payload) else false()
+
+
+class Always(_PrincipalRule):
+    def allows(self, payload: dict) -> bool:
+        return True
+
+
+class HasRole(_PrincipalRule):
+    """The principal's role is one of `roles` or inherits one of them."""
+
+    def __init__(self, *roles: Union[str, int]):
+        self.roles = roles
+        self._mask = None
+
+    def allows(self, payload: dict) -> bool:
+        rbac = get_rbac()
+        if self._mask is None:
+            self._mask = rbac.roles_mask(self.roles)
+        return rbac.has_role(payload, self._mask)
+
+
+class HasPermission(_PrincipalRule):
+    """The principal holds every one of `permissions`."""
+
+    def __init__(self, *permissions: str):
+        self.permissions = permissions
+        self._mask = None
+
+    def allows(self, payload: dict) -> bool:
+        rbac = get_rbac()
+        if self._mask is None:
+            self._mask = rbac.permissions_mask(self.permissions)
+        return rbac.has_permissions(payload, self._mask)
+
+
+class FieldMatchesClaim(Rule):
+    """The object's `field` equals the principal's `claim` (compared as strings)."""
+
+    def __init__(self, field: str, claim: str):
+        self.field = field
+        self.claim = claim
+
+    def compile_check(self, model) -> Check:
+        field, claim = self.field, self.claim
+        _column(model, field)
+
+        def check(payload: dict, obj: Any) -> bool:
+            value = payload.get(claim)
+            return value is not None and str(getattr(obj, field)) == str(value)
+
+        return check
+
+    def compile_filter(self, model) -> Filter:
+        column, claim = _column(model, self.field), self.claim
+
+        def build(payload: dict) -> ColumnElement:
+            value = payload.get(claim)
+            return false() if value is None else column == str(value)
+
+        return build
+
+
+class Owner(FieldMatchesClaim):
+    """The principal created the object (`created_by` of `ElementalAuditMixin`)."""
+
+    def __init__(self, field: str = "created_by"):
+        super().__init__(field, "sub")
+
+
+class FieldIs(Rule):
+    """The object's `field` equals a constant (e.g. `FieldIs("deleted_at", None)`)."""
+
+    def __init__(self, field: str, value: Any):
+        self.field = field
+        self.value = value
+
+    def compile_check(self, model) -> Check:
+        field, value = self.field, self.value
+        _column(model, field)
+        if value is None:
+            return lambda payload, obj: getattr(obj, field) is None
+        return lambda payload, obj: getattr(obj, field) == value
+
+    def compile_filter(self, model) -> Filter:
+        column, value = _column(model, self.field), self.value
+        condition = column.is_(None) if value is None else column == value
+        return lambda payload: condition
+
+
+class AllOf(Rule):
+    def __init__(self, *rules: Rule):
+        self.rules = rules
+
+    def compile_check(self, model) -> Check:
+        checks = tuple(rule.compile_check(model) for rule in self.rules)
+        return lambda payload, obj: all(check(payload, obj) for check in checks)
+
+    def compile_filter(self, model) -> Filter:
+        builders = tuple(rule.compile_filter(model) for rule in self.rules)
+        return lambda payload: and_(*(build(payload) for build in builders))
+
+
+class AnyOf(Rule):
+    def __init__(self, *rules: Rule):
+        self.rules = rules
+
+    def compile_check(self, model) -> Check:
+        checks = tuple(rule.compile_check(model) for rule in self.rules)
+        return lambda payload, obj: any(check(payload, obj) for check in checks)
+
+    def compile_filter(self, model) -> Filter:
+        # Principal-only rules are decided in Python first, so an admin's
+        # listing gets no WHERE clause at all instead of "... OR true".
+        principal_rules = tuple(rule for rule in self.rules if isinstance(rule, _PrincipalRule))
+        builders = tuple(rule.compile_filter(model) for rule in self.rules if not isinstance(rule, _PrincipalRule))
+
+        def build(payload: dict) -> ColumnElement:
+            if any(rule.allows(payload) for rule in principal_rules):
+                return true()
+            if not builders:
+                return false()
+            return or_(*(builder(payload) for builder in builders))
+
+        return build
@@ -0,0 +1,8 @@
+from .cache import (
+    PrincipalState,
+    PrincipalStateCache,
+    get_principal_cache,
+    set_principal_loader,
+    invalidate_principal
+)
+from .settings import ElementalPrincipalSettings
@@ -0,0 +1,210 @@
+import time
+import asyncio
+from logging import Logger
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ...logging import get_logger
+from ...metrics import get_metrics_registry
+from ...exceptions import ConfigurationError
+
+_logger: Optional[Logger] = None
+
+
+def get_principal_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("principal_cache")
+    return _logger
+
+
+class PrincipalState:
+    """The account state a request needs to be allowed through, without the rest of the user row."""
+
+    __slots__ = ("is_active", "is_verified", "token_version")
+
+    def __init__(self, is_active: bool = True, is_verified: bool = True, token_version: int = 1):
+        self.is_active = is_active
+        self.is_verified = is_verified
+        self.token_version = token_version
+
+    def __repr__(self) -> str:
+        return (
+            f"PrincipalState(is_active={self.is_active}, is_verified={self.is_verified}, "
+            f"token_version={self.token_version})"
+        )
+
+
+# Reads the state of many subjects at once (one `WHERE id IN (...)` query).
+# Subjects missing from the result no longer exist.
+PrincipalStateLoader = Callable[[List[str]], Awaitable[Dict[str, PrincipalState]]]
+
+
+class PrincipalStateCache:
+    """
+    Account state keyed by token `sub`, refreshed with stale-while-revalidate.
+
+    A fresh entry answers in memory. A stale one still answers in memory and
+    queues a refresh; only a missing or fully expired entry makes the request
+    wait. Every load - blocking or background - goes through one queue that is
+    flushed `batch_delay` seconds after its first entry, so a burst of requests
+    from different users costs one query. Unknown subjects are cached as None.
+
+    `invalidate` drops an entry and detaches any load already in flight, so a
+    result read before the write can never be stored after it.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[PrincipalStateLoader] = None,
+        ttl: float = 30.0,
+        stale_ttl: float = 300.0,
+        max_entries: int = 100_000,
+        batch_delay: float = 0.002,
+        max_batch: int = 500
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+
+        self._entries: "OrderedDict[str, Tuple[float, Optional[PrincipalState]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._queue: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+        registry = get_metrics_registry()
+        self.lookups = registry.counter("principal_cache_lookups_total", "Principal state lookups by result.")
+        self.batch_sizes = registry.histogram(
+            "principal_cache_batch_size",
+            "Subjects per principal state load.",
+            buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500)
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, sub: str) -> Optional[PrincipalState]:
+        sub = str(sub)
+        entry = self._entries.get(sub)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                self._entries.move_to_end(sub)
+                self.lookups.inc(result="fresh")
+                return entry[1]
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(sub)
+                self.lookups.inc(result="stale")
+                self._revalidate(sub)
+                return entry[1]
+
+        self.lookups.inc(result="miss")
+        return await asyncio.shield(self._enqueue(sub))
+
+    def put(self, sub: str, state: Optional[PrincipalState]) -> None:
+        sub = str(sub)
+        self._entries[sub] = (time.monotonic(), state)
+        self._entries.move_to_end(sub)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, sub: str) -> bool:
+        sub = str(sub)
+        self._inflight.pop(sub, None)
+        return self._entries.pop(sub, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def _revalidate(self, sub: str) -> None:
+        future = self._enqueue(sub)
+        # Nobody awaits a background refresh; its failure is logged by the batch.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def _enqueue(self, sub: str) -> asyncio.Future:
+        future = self._inflight.get(sub)
+        if future is not None:
+            return future
+
+        if self.loader is None:
+            raise ConfigurationError("No principal state loader is registered.")
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight[sub] = loop.create_future()
+        self._queue.append((sub, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch):
+            batch = queue[start:start + self.max_batch]
+            task = asyncio.get_running_loop().create_task(self._load(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        self.batch_sizes.observe(len(batch))
+        try:
+            states = await self.loader([sub for sub, _ in batch])
+        except Exception as e:
+            get_principal_logger().error(f"Principal state load failed ({len(batch)} subjects): {e!r}")
+            for sub, future in batch:
+                if self._inflight.get(sub) is future:
+                    del self._inflight[sub]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for sub, future in batch:
+            state = states.get(sub)
+            # Invalidated while loading: hand the result to its waiters but do not cache it.
+            if self._inflight.get(sub) is future:
+                del self._inflight[sub]
+                self.put(sub, state)
+            if not future.done():
+                future.set_result(state)
+
+
+_cache: Optional[PrincipalStateCache] = None
+
+
+def get_principal_cache() -> PrincipalStateCache:
+    global _cache
+    if _cache is None:
+        from ...settings import get_settings
+
+        settings = get_settings().principals
+        _cache = PrincipalStateCache(
+            ttl=settings.ttl,
+            stale_ttl=settings.stale_ttl,
+            max_entries=settings.max_entries,
+            batch_delay=settings.batch_delay,
+            max_batch=settings.max_batch
+        )
+    return _cache
+
+
+def set_principal_loader(loader: PrincipalStateLoader) -> None:
+    """
+    Registers the coroutine that reads account state for a list of subjects.
+
+    It must return ``{sub: PrincipalState}`` for the subjects that exist,
+    typically from one ``SELECT id, is_active, is_verified, token_version ...
+    WHERE id IN (...)`` query.
+    """
+    get_principal_cache().loader = loader
+
+
+def invalidate_principal(sub: str) -> bool:
+    """Write hook: forget the cached state of `sub` (status change, password change, deletion)."""
+    if _cache is None:
+        return False
+    return _cache.invalidate(sub)
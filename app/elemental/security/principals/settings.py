@@ -0,0 +1,24 @@
+from pydantic import Field
+
+from ...common.schemas import ElementalSchema
+
+
+class ElementalPrincipalSettings(ElementalSchema):
+    """
+    Cache of account state (active / verified flags and token version) per token `sub`.
+
+    An entry is fresh for `ttl` seconds. For `stale_ttl` seconds after that it
+    is still served while a background refresh runs. Past both, the request
+    waits for a fresh load. Misses and refreshes that happen within
+    `batch_delay` seconds of each other share one loader call of at most
+    `max_batch` subjects. Writes through a repository invalidate the entry in
+    the writing worker immediately; other workers see the change within `ttl`.
+
+    Off by default: it needs a loader registered with `set_principal_loader`.
+    """
+    enabled: bool = False
+    ttl: float = Field(default=30.0, ge=0)
+    stale_ttl: float = Field(default=300.0, ge=0)
+    max_entries: int = Field(default=100_000, ge=1)
+    batch_delay: float = Field(default=0.002, ge=0)
+    max_batch: int = Field(default=500, ge=1)
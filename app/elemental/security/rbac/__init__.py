@@ -0,0 +1,9 @@
+from .registry import (
+    PERMISSIONS_CLAIM,
+    CompiledRBAC,
+    encode_mask,
+    decode_mask,
+    get_rbac,
+    init_rbac
+)
+from .settings import ElementalRBACSettings
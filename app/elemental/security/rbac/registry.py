@@ -0,0 +1,131 @@
+import base64
+from typing import Dict, Iterable, Optional, Union
+
+from ...exceptions import ConfigurationError
+from .settings import ElementalRBACSettings
+
+RoleName = Union[str, int]
+
+# Token claim holding the encoded permission mask.
+PERMISSIONS_CLAIM = "pm"
+
+
+def encode_mask(mask: int) -> str:
+    """Encodes a permission mask as short unpadded base64url (little-endian bytes)."""
+    raw = mask.to_bytes((mask.bit_length() + 7) // 8 or 1, "little")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_mask(value: str) -> int:
+    return int.from_bytes(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)), "little")
+
+
+class CompiledRBAC:
+    """
+    Roles and permissions compiled into integer bitsets.
+
+    Every permission owns one bit and every role one bit. For each role the
+    hierarchy closure is precomputed twice: the mask of all permissions it
+    holds and the mask of all roles it counts as. Authorization checks are
+    then a dict lookup plus one bitwise AND, whatever the hierarchy depth.
+    """
+
+    def __init__(self, settings: Optional[ElementalRBACSettings] = None):
+        settings = settings or ElementalRBACSettings()
+
+        self.permission_bits: Dict[str, int] = {
+            name: 1 << index for index, name in enumerate(settings.permissions)
+        }
+        self.role_bits: Dict[RoleName, int] = {
+            name: 1 << index for index, name in enumerate(settings.roles)
+        }
+        self.role_closure: Dict[RoleName, int] = {}
+        self.role_permissions: Dict[RoleName, int] = {}
+
+        for name in settings.roles:
+            roles, permissions = self._close(name, settings, ())
+            self.role_closure[name] = roles
+            self.role_permissions[name] = permissions
+
+    def _close(self, name: str, settings: ElementalRBACSettings, path: tuple):
+        if name in path:
+            raise ConfigurationError(f"Role inheritance cycle: {' -> '.join(path + (name,))}")
+
+        role = settings.roles[name]
+        roles = self.role_bits[name]
+        permissions = self.permissions_mask(role.permissions)
+        for parent in role.inherits:
+            parent_roles, parent_permissions = self._close(parent, settings, path + (name,))
+            roles |= parent_roles
+            permissions |= parent_permissions
+        return roles, permissions
+
+    def role_bit(self, name: RoleName) -> int:
+        """
+        Bit of a role. Roles not declared in the settings get a standalone bit
+        on first use, so `require_roles` keeps working for ad-hoc role names.
+        """
+        bit = self.role_bits.get(name)
+        if bit is None:
+            bit = self.role_bits[name] = 1 << len(self.role_bits)
+            self.role_closure[name] = bit
+        return bit
+
+    def roles_mask(self, names: Iterable[RoleName]) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.role_bit(name)
+        return mask
+
+    def permissions_mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            bit = self.permission_bits.get(name)
+            if bit is None:
+                raise ConfigurationError(f"Undefined permission '{name}'.")
+            mask |= bit
+        return mask
+
+    def has_role(self, payload: dict, required_roles: int) -> bool:
+        return bool(self.role_closure.get(payload.get("role"), 0) & required_roles)
+
+    def payload_permissions(self, payload: dict) -> int:
+        """Permission mask of a token: its encoded claim, or its role's mask for older tokens."""
+        encoded = payload.get(PERMISSIONS_CLAIM)
+        if encoded is not None:
+            try:
+                return decode_mask(encoded)
+            except (ValueError, TypeError):
+                return 0
+        return self.role_permissions.get(payload.get("role"), 0)
+
+    def has_permissions(self, payload: dict, required: int) -> bool:
+        return self.payload_permissions(payload) & required == required
+
+    def permission_names(self, mask: int):
+        return [name for name, bit in self.permission_bits.items() if mask & bit]
+
+    def token_claims(self, role: RoleName, extra_permissions: Iterable[str] = ()) -> dict:
+        """
+        Claims to merge into a token: the role plus its encoded permission mask
+        (role permissions, inherited ones, and any per-user extras).
+        """
+        mask = self.role_permissions.get(role, 0) | self.permissions_mask(extra_permissions)
+        return {"role": role, PERMISSIONS_CLAIM: encode_mask(mask)}
+
+
+_rbac: Optional[CompiledRBAC] = None
+
+
+def init_rbac(settings: Optional[ElementalRBACSettings]) -> CompiledRBAC:
+    global _rbac
+    _rbac = CompiledRBAC(settings)
+    return _rbac
+
+
+def get_rbac() -> CompiledRBAC:
+    if _rbac is None:
+        from ...settings import get_settings
+
+        return init_rbac(getattr(get_settings(), "rbac", None))
+    return _rbac
@@ -0,0 +1,42 @@
+from typing import Dict, List
+
+from pydantic import Field, model_validator
+
+from ...common.schemas import ElementalSchema
+from ...exceptions import ConfigurationError
+
+
+class _Role(ElementalSchema):
+    permissions: List[str] = Field(default_factory=list)
+    inherits: List[str] = Field(default_factory=list)
+
+
+class ElementalRBACSettings(ElementalSchema):
+    """
+    Role and permission definitions compiled into bitsets at startup.
+
+    Attributes:
+        permissions: Every permission, in bit order. Tokens carry permission
+            masks, so only append to this list; reordering or removing entries
+            changes the meaning of tokens already issued.
+        roles: Role name -> granted permissions and inherited roles. A role has
+            every permission of the roles it inherits, transitively, and
+            satisfies `require_roles` for each of them.
+    """
+    permissions: List[str] = Field(default_factory=list)
+    roles: Dict[str, _Role] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def validate_references(self):
+        if len(set(self.permissions)) != len(self.permissions):
+            raise ConfigurationError("rbac.permissions must not contain duplicates.")
+
+        known = set(self.permissions)
+        for name, role in self.roles.items():
+            unknown = [p for p in role.permissions if p not in known]
+            if unknown:
+                raise ConfigurationError(f"Role '{name}' grants undefined permissions: {', '.join(unknown)}")
+            missing = [r for r in role.inherits if r not in self.roles]
+            if missing:
+                raise ConfigurationError(f"Role '{name}' inherits undefined roles: {', '.join(missing)}")
+        return self
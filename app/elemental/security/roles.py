@@ -1,5 +1,6 @@
 from typing import List, Union
 from ..exceptions import ForbiddenError, UnauthorizedError
+from .rbac import PERMISSIONS_CLAIM, get_rbac
 
 
 def validate_roles(
@@ -54,7 +55,10 @@ def extract_user_info(
 def get_user_permissions(
     token_payload: dict
 ) -> List[str]:
-    # Retrieve the permissions list from the payload
+    # Retrieve the permissions from the encoded mask, or the legacy list
+    if PERMISSIONS_CLAIM in token_payload:
+        rbac = get_rbac()
+        return rbac.permission_names(rbac.payload_permissions(token_payload))
     return token_payload.get("permissions", [])
 
 
@@ -62,5 +66,9 @@ def has_permission(
     token_payload: dict,
     required_permission: str
 ) -> bool:
-    # Check if a specific permission exists in the payload
-    return required_permission in get_user_permissions(token_payload)
\ No newline at end of file
+    # Single bitwise check for masked tokens, list lookup for legacy ones
+    if PERMISSIONS_CLAIM in token_payload:
+        rbac = get_rbac()
+        bit = rbac.permission_bits.get(required_permission)
+        return bit is not None and bool(rbac.payload_permissions(token_payload) & bit)
+    return required_permission in token_payload.get("permissions", [])
\ No newline at end of file
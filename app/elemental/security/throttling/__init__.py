@@ -0,0 +1,7 @@
+from .limiter import (
+    FailureCounter,
+    LoginGuard,
+    get_login_guard,
+    guarded_verify_password
+)
+from .settings import ElementalLoginProtectionSettings, FailureLimit
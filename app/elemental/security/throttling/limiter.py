@@ -0,0 +1,250 @@
+import time
+import asyncio
+from array import array
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from ...exceptions import RateLimitError
+from ...metrics import get_metrics_registry
+from ..passwords import async_verify_password
+from .settings import ElementalLoginProtectionSettings, FailureLimit
+
+
+class _Window:
+    __slots__ = ("counts", "bucket", "last_failure")
+
+    def __init__(self, buckets: int):
+        self.counts = array("H", bytes(2 * buckets))
+        self.bucket = 0
+        self.last_failure = 0.0
+
+
+class FailureCounter:
+    """
+    Sliding-window failure counts per key, one small unsigned-short array each.
+
+    The window is split into `buckets` slots; slots older than the window are
+    zeroed lazily when the key is touched, so there is no background sweep.
+    At most `max_keys` keys are tracked, least recently touched evicted first.
+    """
+
+    def __init__(self, window: float, buckets: int, max_keys: int):
+        self.buckets = buckets
+        self.bucket_width = window / buckets
+        self.max_keys = max_keys
+        self._windows: "OrderedDict[str, _Window]" = OrderedDict()
+
+    def _advance(self, entry: _Window, bucket: int) -> None:
+        elapsed = bucket - entry.bucket
+        if elapsed <= 0:
+            return
+        counts = entry.counts
+        for i in range(1, min(elapsed, self.buckets) + 1):
+            counts[(entry.bucket + i) % self.buckets] = 0
+        entry.bucket = bucket
+
+    def state(self, key: str, now: float) -> Tuple[int, float]:
+        """Returns (failures in the window, time of the last failure)."""
+        entry = self._windows.get(key)
+        if entry is None:
+            return 0, 0.0
+        self._advance(entry, int(now / self.bucket_width))
+        return sum(entry.counts), entry.last_failure
+
+    def add(self, key: str, now: float) -> int:
+        bucket = int(now / self.bucket_width)
+        entry = self._windows.get(key)
+        if entry is None:
+            entry = self._windows[key] = _Window(self.buckets)
+            entry.bucket = bucket
+            if len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+            self._advance(entry, bucket)
+
+        slot = bucket % self.buckets
+        if entry.counts[slot] < 0xFFFF:
+            entry.counts[slot] += 1
+        entry.last_failure = now
+        return sum(entry.counts)
+
+    def remove(self, key: str, at: float) -> None:
+        """Takes back one failure added at `at`, unless its slot already left the window."""
+        entry = self._windows.get(key)
+        if entry is None:
+            return
+        bucket = int(at / self.bucket_width)
+        if entry.bucket - bucket >= self.buckets:
+            return
+        slot = bucket % self.buckets
+        if entry.counts[slot]:
+            entry.counts[slot] -= 1
+
+    def reset(self, key: str) -> None:
+        self._windows.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self) -> None:
+        self.tokens += 1
+
+
+class LoginGuard:
+    """
+    Rejects login attempts before they reach the password hash.
+
+    Call `check()` before verifying a password. It counts the attempt as a
+    failure up front, so concurrent attempts cannot all pass the check before
+    any of them fails; call `record_success()` when the password matches, or
+    `release()` when verification could not run. A check costs two dict
+    lookups and a sum over a few array slots, which is negligible next to the
+    bcrypt verification it can avoid.
+    """
+
+    def __init__(self, settings: ElementalLoginProtectionSettings):
+        self.settings = settings
+        self.accounts = FailureCounter(settings.window, settings.buckets, settings.max_tracked_keys)
+        self.ips = FailureCounter(settings.window, settings.buckets, settings.max_tracked_keys)
+        self.budget = _TokenBucket(settings.hashes_per_second, settings.burst)
+
+        self.rejections = get_metrics_registry().counter(
+            "login_attempts_rejected_total",
+            "Login attempts rejected before password verification."
+        )
+
+    @staticmethod
+    def _backoff(failures: int, limit: FailureLimit) -> float:
+        excess = failures - limit.free_attempts
+        if excess <= 0:
+            return 0.0
+        return min(limit.max_delay, limit.base_delay * 2 ** min(excess - 1, 32))
+
+    def _retry_after(self, counter: FailureCounter, key: Optional[str], limit: FailureLimit, now: float) -> float:
+        if key is None:
+            return 0.0
+        failures, last_failure = counter.state(key, now)
+        delay = self._backoff(failures, limit)
+        return max(0.0, last_failure + delay - now) if delay else 0.0
+
+    def _reject(self, reason: str, retry_after: float) -> RateLimitError:
+        self.rejections.inc(reason=reason)
+        return RateLimitError(
+            message="Too many login attempts. Please try again later.",
+            details={"reason": reason, "retry_after": max(1, round(retry_after))}
+        )
+
+    async def check(self, account: Optional[str], ip: Optional[str]) -> float:
+        """
+        Reserves the attempt as a failure and returns its timestamp, which
+        `record_success()` and `release()` need to take it back.
+
+        Raises:
+            RateLimitError: If the account or IP is in backoff, or no hashing
+                slot frees up within `max_budget_wait`.
+        """
+        now = time.time()
+
+        wait = self._retry_after(self.accounts, account, self.settings.account, now)
+        if wait > 0:
+            raise self._reject("account", wait)
+
+        wait = self._retry_after(self.ips, ip, self.settings.ip, now)
+        if wait > 0:
+            raise self._reject("ip", wait)
+
+        wait = self.budget.reserve()
+        if wait > self.settings.max_budget_wait:
+            self.budget.refund()
+            raise self._reject("budget", wait)
+
+        # No await since the backoff checks: the next attempt already sees this one.
+        if account is not None:
+            self.accounts.add(account, now)
+        if ip is not None:
+            self.ips.add(ip, now)
+
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self.release(account, ip, now)
+                raise
+        return now
+
+    def record_success(self, account: Optional[str], ip: Optional[str], attempted_at: float) -> None:
+        # A successful login clears the account; the IP may still be spraying others.
+        if account is not None:
+            self.accounts.reset(account)
+        if ip is not None:
+            self.ips.remove(ip, attempted_at)
+
+    def release(self, account: Optional[str], ip: Optional[str], attempted_at: float) -> None:
+        """Takes back an attempt whose password was never verified."""
+        if account is not None:
+            self.accounts.remove(account, attempted_at)
+        if ip is not None:
+            self.ips.remove(ip, attempted_at)
+
+
+_guard: Optional[LoginGuard] = None
+
+
+def get_login_guard() -> LoginGuard:
+    global _guard
+    if _guard is None:
+        from ...settings import get_settings
+
+        settings = getattr(get_settings(), "login_protection", None) or ElementalLoginProtectionSettings()
+        _guard = LoginGuard(settings)
+    return _guard
+
+
+async def guarded_verify_password(
+    plain_password: str,
+    hashed_password: str,
+    *,
+    account: Optional[str],
+    ip: Optional[str],
+    verify: Optional[Callable[[str, str], Awaitable[bool]]] = None
+) -> bool:
+    """
+    Verifies a login password behind the login guard.
+
+    Raises:
+        RateLimitError: Before any hashing, when the attempt is throttled.
+    """
+    verify = verify or async_verify_password
+    guard = get_login_guard()
+    if not guard.settings.enabled:
+        return await verify(plain_password, hashed_password)
+
+    attempted_at = await guard.check(account, ip)
+    try:
+        valid = await verify(plain_password, hashed_password)
+    except BaseException:
+        guard.release(account, ip, attempted_at)
+        raise
+
+    if valid:
+        guard.record_success(account, ip, attempted_at)
+    return valid
@@ -0,0 +1,35 @@
+from pydantic import Field
+
+from ...common.schemas import ElementalSchema
+
+
+class FailureLimit(ElementalSchema):
+    """Backoff applied to one kind of key (account or client IP) once it exceeds its free attempts."""
+    free_attempts: int = Field(default=5, ge=0)
+    base_delay: float = Field(default=1.0, gt=0)
+    max_delay: float = Field(default=900.0, gt=0)
+
+
+class ElementalLoginProtectionSettings(ElementalSchema):
+    """
+    Login throttling configuration.
+
+    Failures are counted per account and per client IP over `window` seconds.
+    Past `free_attempts` failures, each further attempt has to wait
+    `base_delay * 2 ** (failures - free_attempts)` seconds (capped at
+    `max_delay`) after the previous failure. Independently, every worker may
+    start at most `hashes_per_second` password verifications (with `burst`
+    headroom); an attempt waits up to `max_budget_wait` for a slot and is
+    rejected after that.
+    """
+    enabled: bool = True
+    window: float = Field(default=900.0, gt=0)
+    buckets: int = Field(default=15, ge=1, le=3600)
+    max_tracked_keys: int = Field(default=100_000, ge=1)
+
+    account: FailureLimit = FailureLimit()
+    ip: FailureLimit = FailureLimit(free_attempts=20, base_delay=0.5, max_delay=300.0)
+
+    hashes_per_second: float = Field(default=8.0, gt=0)
+    burst: int = Field(default=16, ge=1)
+    max_budget_wait: float = Field(default=0.5, ge=0)
@@ -4,5 +4,23 @@ from .provider import (
     create_general_token,
     decode_token
 )
+from .codec import (
+    ElementalTokenCodec,
+    get_token_codec,
+    init_token_codec
+)
+from .keys import KeyRing, ParsedKey
 from .types import ElementalTokenTypes
 from .settings import ElementalJWTSettings
+from .cache import (
+    VerifiedTokenCache,
+    get_verified_token_cache,
+    invalidate_token
+)
+from .revocation import (
+    TokenRevocationStore,
+    get_revocation_store,
+    set_revocation_loader,
+    revoke_subject_tokens,
+    revoke_token
+)
@@ -0,0 +1,99 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ...metrics import get_metrics_registry
+
+
+def token_digest(token: str) -> bytes:
+    """Short, fast fingerprint used as cache key so raw tokens are never kept as keys."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already verified token payloads.
+
+    A hit skips signature verification and claim parsing entirely, which is
+    what dominates per-request auth cost when clients reuse the same access
+    token. Entries live until the token's own `exp` claim, or until the
+    signing key's `verify_until` when that comes first, so a cached token
+    never outlives what a fresh decode would accept. Tokens without `exp` are
+    not cached.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        registry = get_metrics_registry()
+        self.hits = registry.counter("jwt_cache_hits_total", "Token verifications served from the cache.")
+        self.misses = registry.counter("jwt_cache_misses_total", "Token verifications that ran the full decode.")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[dict]:
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits.inc()
+                    # Callers may mutate the payload; never hand out the cached object.
+                    return dict(entry[1])
+                del self._entries[key]
+        self.misses.inc()
+        return None
+
+    def put(self, token: str, payload: dict, verify_until: Optional[float] = None) -> None:
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        expires_at = float(exp) if verify_until is None else min(float(exp), verify_until)
+
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> bool:
+        """Drops one token (e.g. on logout). Returns True when it was cached."""
+        with self._lock:
+            return self._entries.pop(token_digest(token), None) is not None
+
+    def invalidate_subject(self, sub: str) -> int:
+        """Drops every cached token of a subject (e.g. logout from all devices)."""
+        sub = str(sub)
+        with self._lock:
+            keys = [key for key, (_, payload) in self._entries.items() if payload.get("sub") == sub]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    global _cache
+    if _cache is None:
+        from ...settings import get_settings
+
+        _cache = VerifiedTokenCache(max_entries=get_settings().jwt.cache.max_entries)
+    return _cache
+
+
+def invalidate_token(token: str) -> bool:
+    """Logout hook: forget the verified payload of `token`."""
+    return get_verified_token_cache().invalidate(token)
@@ -0,0 +1,161 @@
+import json
+import time
+import uuid
+from typing import Any, Iterable, List, Optional
+
+import jwt
+from jwt.utils import base64url_encode
+from jwt.exceptions import ExpiredSignatureError, PyJWTError
+
+from .keys import KeyRing, ParsedKey
+from .types import ElementalTokenTypes
+from .settings import ElementalJWTSettings
+from ...exceptions.auth import TokenExpiredError, UnauthorizedError
+
+# Claims set by the codec itself; `data` can never override them.
+_RESERVED_KEYS = frozenset({"sub", "type", "exp", "iat", "jti", "version", "id", "token_type"})
+
+
+class ElementalTokenCodec:
+    """
+    Encodes and decodes Elemental JWTs with settings resolved once.
+
+    The key ring (parsed keys and their pre-encoded JOSE headers) and the
+    expiry deltas are copied out of `ElementalJWTSettings` at construction, so
+    minting or verifying a token does no settings lookup, no secret unwrapping
+    and no key parsing; each token only serializes and signs its own claims.
+    """
+
+    __slots__ = ("keyring", "access_expire_seconds", "refresh_expire_seconds", "_jwt")
+
+    def __init__(
+        self,
+        keyring: KeyRing,
+        access_expire_seconds: int = 3600,
+        refresh_expire_seconds: int = 7 * 24 * 3600
+    ):
+        self.keyring = keyring
+        self.access_expire_seconds = access_expire_seconds
+        self.refresh_expire_seconds = refresh_expire_seconds
+        self._jwt = jwt.PyJWT()
+
+    @classmethod
+    def from_settings(cls, settings: ElementalJWTSettings) -> "ElementalTokenCodec":
+        return cls(
+            keyring=KeyRing.from_settings(settings),
+            access_expire_seconds=int(settings.access_token.expire_delta.total_seconds()),
+            refresh_expire_seconds=int(settings.refresh_token.expire_delta.total_seconds())
+        )
+
+    def _lifetime(self, token_type: str, days=0, hours=0, minutes=0, seconds=0) -> int:
+        """Resolve expiration rules."""
+        if days or hours or minutes or seconds:
+            return int(days * 86400 + hours * 3600 + minutes * 60 + seconds)
+
+        if token_type == ElementalTokenTypes.ACCESS or token_type == "general":
+            return self.access_expire_seconds
+        if token_type == ElementalTokenTypes.REFRESH:
+            return self.refresh_expire_seconds
+        raise ValueError(f"Unknown token type '{token_type}'.")
+
+    @staticmethod
+    def _subject(data: dict, sub_key: Optional[str]) -> str:
+        if sub_key:
+            if sub_key not in data:
+                raise ValueError(
+                    f"Missing '{sub_key}' key in data."
+                    f"Available keys: {', '.join(data.keys())}"
+                )
+            return str(data[sub_key])
+        return str(data.get("id") or data.get("sub") or data.get("user_id"))
+
+    @staticmethod
+    def _sign(key: ParsedKey, data: Any, token_type: str, sub_key: Optional[str], iat: int, exp: int) -> str:
+        if not isinstance(data, dict):
+            raise ValueError("Data must be a dict")
+
+        # 1. Base claims (Flat structure)
+        payload = {
+            "sub": ElementalTokenCodec._subject(data, sub_key),
+            "type": token_type,
+            "exp": exp,
+            "iat": iat,
+            "jti": uuid.uuid4().hex,
+            "version": data.get("version") or data.get("token_version", 1)
+        }
+
+        # 2. Merge extra data (Avoiding reserved keys)
+        for name, value in data.items():
+            if name not in _RESERVED_KEYS:
+                payload[name] = value
+
+        payload_segment = base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
+        signing_input = key.header_segment + b"." + payload_segment
+        signature = base64url_encode(key.alg_obj.sign(signing_input, key.signing_key))
+        return (signing_input + b"." + signature).decode()
+
+    def encode(self, data: dict, token_type: str, sub_key: Optional[str] = None, **expiry) -> str:
+        """Builds and signs one token. `expiry` takes days/hours/minutes/seconds overrides."""
+        now = int(time.time())
+        key = self.keyring.signer(now)
+        return self._sign(key, data, token_type, sub_key, now, now + self._lifetime(token_type, **expiry))
+
+    def encode_many(
+        self,
+        items: Iterable[dict],
+        token_type: str,
+        sub_key: Optional[str] = None,
+        **expiry
+    ) -> List[str]:
+        """
+        Mints one token per item (invitations, password-reset links, ...).
+
+        The whole batch shares one issue time and expiry, computed once.
+        """
+        now = int(time.time())
+        exp = now + self._lifetime(token_type, **expiry)
+        key = self.keyring.signer(now)
+        return [self._sign(key, data, token_type, sub_key, now, exp) for data in items]
+
+    def verify_until(self, token: str) -> Optional[float]:
+        """When the key that verifies `token` retires; None when it does not (or is unknown)."""
+        try:
+            key = self.keyring.verifier(jwt.get_unverified_header(token).get("kid"))
+        except PyJWTError:
+            return None
+        return key.verify_until if key is not None else None
+
+    def decode(self, token: str) -> dict:
+        """Decodes token and raises custom Elemental exceptions."""
+        try:
+            key = self.keyring.verifier(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                raise UnauthorizedError(message="Token signed with an unknown or retired key")
+            # The algorithm is pinned per key, so a token cannot pick how it gets verified.
+            return self._jwt.decode(token, key.verifying_key, algorithms=[key.algorithm])
+        except UnauthorizedError:
+            raise
+        except ExpiredSignatureError:
+            raise TokenExpiredError()
+        except PyJWTError:
+            raise UnauthorizedError(message="Invalid or malformed JWT token")
+        except Exception as e:
+            raise UnauthorizedError(message=f"Could not validate credentials: {str(e)}")
+
+
+_codec: Optional[ElementalTokenCodec] = None
+
+
+def init_token_codec(settings: ElementalJWTSettings) -> ElementalTokenCodec:
+    """(Re)builds the process-wide codec; call again after changing JWT settings."""
+    global _codec
+    _codec = ElementalTokenCodec.from_settings(settings)
+    return _codec
+
+
+def get_token_codec() -> ElementalTokenCodec:
+    if _codec is None:
+        from ...settings import get_settings
+
+        return init_token_codec(get_settings().jwt)
+    return _codec
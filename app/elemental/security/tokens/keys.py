@@ -0,0 +1,172 @@
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import jwt
+from jwt.utils import base64url_encode
+
+from .settings import ElementalJWTSettings
+from ...exceptions import ConfigurationError
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+class ParsedKey:
+    """A key ring entry with its key material parsed and its JOSE header pre-encoded."""
+
+    __slots__ = (
+        "kid", "algorithm", "alg_obj", "signing_key", "verifying_key", "header_segment",
+        "active_from", "active_until", "verify_until"
+    )
+
+    def __init__(
+        self,
+        kid: Optional[str],
+        algorithm: str,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+        active_from: Optional[float] = None,
+        active_until: Optional[float] = None,
+        verify_until: Optional[float] = None
+    ):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.active_from = active_from
+        self.active_until = active_until
+        self.verify_until = verify_until
+
+        try:
+            self.alg_obj = jwt.get_algorithm_by_name(algorithm)
+            self.signing_key = self.alg_obj.prepare_key(private_key) if private_key is not None else None
+            if public_key is not None:
+                self.verifying_key = self.alg_obj.prepare_key(public_key)
+            elif algorithm.startswith("HS"):
+                self.verifying_key = self.signing_key
+            else:
+                self.verifying_key = self.signing_key.public_key()
+        except (jwt.PyJWTError, ValueError, TypeError) as e:
+            raise ConfigurationError(f"JWT key '{kid}' could not be loaded: {e}")
+
+        header: Dict[str, Any] = {"alg": algorithm, "typ": "JWT"}
+        if kid is not None:
+            header["kid"] = kid
+        self.header_segment = base64url_encode(
+            json.dumps(header, separators=(",", ":"), sort_keys=True).encode()
+        )
+
+    @property
+    def symmetric(self) -> bool:
+        return self.algorithm.startswith("HS")
+
+    def can_sign(self, now: float) -> bool:
+        return (
+            self.signing_key is not None
+            and (self.active_from is None or self.active_from <= now)
+            and (self.active_until is None or now < self.active_until)
+        )
+
+    def can_verify(self, now: float) -> bool:
+        return self.verify_until is None or now < self.verify_until
+
+    def to_jwk(self) -> Dict[str, Any]:
+        jwk = self.alg_obj.to_jwk(self.verifying_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class KeyRing:
+    """
+    Signing and verification keys indexed by `kid`.
+
+    Every key is parsed once when the ring is built; verification is a dict
+    lookup on the token's `kid` header. The key used for signing is cached
+    until the next validity boundary of any key, so picking it is O(1) as well.
+    A key without `kid` (the legacy `secret_key`) verifies tokens that carry no
+    `kid` header.
+    """
+
+    def __init__(self, keys: Iterable[ParsedKey]):
+        self.keys: List[ParsedKey] = list(keys)
+        self._by_kid: Dict[Optional[str], ParsedKey] = {key.kid: key for key in self.keys}
+
+        self._boundaries = sorted({
+            boundary
+            for key in self.keys
+            for boundary in (key.active_from, key.active_until, key.verify_until)
+            if boundary is not None
+        })
+        self._signer: Optional[ParsedKey] = None
+        self._signer_expires = float("-inf")
+        self._signer_since = float("inf")
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str = "HS256") -> "KeyRing":
+        return cls([ParsedKey(None, algorithm, private_key=secret)])
+
+    @classmethod
+    def from_settings(cls, settings: ElementalJWTSettings) -> "KeyRing":
+        keys = []
+        for entry in settings.keys:
+            if entry.private_key is not None:
+                private_key = entry.private_key.get_secret_value()
+            elif entry.private_key_file is not None:
+                private_key = Path(entry.private_key_file).read_text()
+            else:
+                private_key = None
+
+            keys.append(ParsedKey(
+                entry.kid,
+                entry.algorithm,
+                private_key=private_key,
+                public_key=entry.public_key,
+                active_from=_timestamp(entry.active_from),
+                active_until=_timestamp(entry.active_until),
+                verify_until=_timestamp(entry.verify_until)
+            ))
+
+        if settings.secret_key is not None:
+            keys.append(ParsedKey(None, settings.algorithm, private_key=settings.secret_key.get_secret_value()))
+
+        return cls(keys)
+
+    def signer(self, now: Optional[float] = None) -> ParsedKey:
+        """Returns the key that signs new tokens: the most recently activated usable one."""
+        now = time.time() if now is None else now
+        if self._signer is not None and self._signer_since <= now < self._signer_expires:
+            return self._signer
+
+        candidates = [key for key in self.keys if key.can_sign(now)]
+        if not candidates:
+            raise ConfigurationError("No JWT signing key is active.")
+
+        # Keyed entries win over the legacy secret; among them the newest activation wins.
+        self._signer = max(
+            candidates,
+            key=lambda key: (key.kid is not None, key.active_from or float("-inf"))
+        )
+        previous = [boundary for boundary in self._boundaries if boundary <= now]
+        upcoming = [boundary for boundary in self._boundaries if boundary > now]
+        self._signer_since = previous[-1] if previous else float("-inf")
+        self._signer_expires = upcoming[0] if upcoming else float("inf")
+        return self._signer
+
+    def verifier(self, kid: Optional[str]) -> Optional[ParsedKey]:
+        key = self._by_kid.get(kid)
+        if key is None or (key.verify_until is not None and not key.can_verify(time.time())):
+            return None
+        return key
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Public keys still valid for verification. Symmetric keys are never published."""
+        now = time.time()
+        return {
+            "keys": [
+                key.to_jwk()
+                for key in self.keys
+                if key.kid is not None and not key.symmetric and key.can_verify(now)
+            ]
+        }
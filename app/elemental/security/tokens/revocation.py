@@ -0,0 +1,216 @@
+import time
+import asyncio
+from logging import Logger
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from ...logging import get_logger
+
+# (minimum token version per subject, revoked jti -> token exp timestamp)
+RevocationSnapshot = Tuple[Dict[str, int], Dict[str, float]]
+RevocationLoader = Callable[[], Awaitable[RevocationSnapshot]]
+
+_logger: Optional[Logger] = None
+
+
+def get_revocation_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("token_revocation")
+    return _logger
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Probe positions are derived from Python's own string hash (cached on the
+    string object) with double hashing, so a lookup allocates nothing and
+    hashes nothing new. False positives only cost the exact lookup behind it.
+    """
+
+    __slots__ = ("size", "hashes", "_bits")
+
+    def __init__(self, capacity: int, hashes: int = 3):
+        # 10 bits per element with 3 probes keeps false positives under ~2%.
+        self.size = max(1024, capacity * 10)
+        self.hashes = hashes
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, value: str) -> None:
+        h = hash(value)
+        step = (h >> 32) | 1
+        for _ in range(self.hashes):
+            position = h % self.size
+            self._bits[position >> 3] |= 1 << (position & 7)
+            h += step
+
+    def __contains__(self, value: str) -> bool:
+        bits = self._bits
+        size = self.size
+        h = hash(value)
+        step = (h >> 32) | 1
+        for _ in range(self.hashes):
+            position = h % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            h += step
+        return True
+
+
+class TokenRevocationStore:
+    """
+    In-memory view of revoked tokens, synced from the database in the background.
+
+    Two rules revoke a token: its `version` claim is below the subject's
+    minimum version (logout everywhere, password change), or its `jti` was
+    revoked individually (single logout). Revoked jtis are kept only until the
+    token's own expiry: expired ones are pruned on refresh, and by
+    `revoke_token` whenever the map has doubled since the last prune, so the
+    map stays bounded without a loader. A Bloom filter over both key sets sits in front, so the
+    common case - a token that was never revoked - is rejected by the filter
+    without probing either map.
+
+    State changes from `revoke_*` apply to this process immediately; other
+    workers pick them up at their next refresh, so callers must also persist
+    them where the loader reads from.
+    """
+
+    # Smallest jti count that triggers a prune from `revoke_token`.
+    PRUNE_FLOOR = 1024
+
+    def __init__(self, loader: Optional[RevocationLoader] = None, refresh_interval: float = 30.0):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+
+        self.min_versions: Dict[str, int] = {}
+        self.revoked_jtis: Dict[str, float] = {}
+        self._bloom = BloomFilter(0)
+        self._prune_at = self.PRUNE_FLOOR
+
+        self._task: Optional[asyncio.Task] = None
+
+    def _rebuild(self) -> None:
+        # Room to double before `_add` has to rebuild again.
+        bloom = BloomFilter(2 * (len(self.min_versions) + len(self.revoked_jtis)))
+        for sub in self.min_versions:
+            bloom.add(sub)
+        for jti in self.revoked_jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def _add(self, key: str) -> None:
+        # Resize once the filter holds more than it was sized for, to keep false positives rare.
+        if (len(self.min_versions) + len(self.revoked_jtis)) * 10 > self._bloom.size:
+            self._rebuild()
+        else:
+            self._bloom.add(key)
+
+    def is_revoked(self, payload: dict) -> bool:
+        bloom = self._bloom
+
+        sub = payload.get("sub")
+        if sub is not None and sub in bloom:
+            min_version = self.min_versions.get(sub)
+            if min_version is not None and payload.get("version", 1) < min_version:
+                return True
+
+        jti = payload.get("jti")
+        if jti is not None and jti in bloom and jti in self.revoked_jtis:
+            return True
+
+        return False
+
+    def revoke_subject(self, sub: str, min_version: int) -> None:
+        """Rejects every token of `sub` whose version is below `min_version`."""
+        sub = str(sub)
+        if min_version > self.min_versions.get(sub, 0):
+            self.min_versions[sub] = min_version
+            self._add(sub)
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        """Rejects one token until its expiry."""
+        now = time.time()
+        if expires_at <= now:
+            return
+        self.revoked_jtis[jti] = expires_at
+        if len(self.revoked_jtis) > self._prune_at:
+            self.prune(now)
+        else:
+            self._add(jti)
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Drops jtis whose tokens have expired and rebuilds the filter without them."""
+        now = time.time() if now is None else now
+        self.revoked_jtis = {jti: exp for jti, exp in self.revoked_jtis.items() if exp > now}
+        self._prune_at = max(self.PRUNE_FLOOR, 2 * len(self.revoked_jtis))
+        self._rebuild()
+
+    def merge(self, min_versions: Dict[str, int], revoked_jtis: Dict[str, float]) -> None:
+        """Merges a snapshot from the database and drops expired jtis."""
+        now = time.time()
+
+        versions = dict(self.min_versions)
+        for sub, version in min_versions.items():
+            sub = str(sub)
+            if version > versions.get(sub, 0):
+                versions[sub] = version
+
+        self.min_versions = versions
+        self.revoked_jtis.update((jti, exp) for jti, exp in revoked_jtis.items() if exp > now)
+        self.prune(now)
+
+    async def refresh(self) -> None:
+        if self.loader is None:
+            return
+        min_versions, revoked_jtis = await self.loader()
+        self.merge(min_versions, revoked_jtis)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                get_revocation_logger().error(f"Token revocation refresh failed: {e!r}")
+
+    async def start(self) -> None:
+        """Loads the initial state, then keeps refreshing it in the background."""
+        if self.loader is None or self._task is not None:
+            return
+        await self.refresh()
+        self._task = asyncio.get_running_loop().create_task(self._refresh_loop(), name="token-revocation-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+_store = TokenRevocationStore()
+
+
+def get_revocation_store() -> TokenRevocationStore:
+    return _store
+
+
+def set_revocation_loader(loader: RevocationLoader) -> None:
+    """
+    Registers the coroutine that reads revocation state from the database.
+
+    It must return ``(min_versions, revoked_jtis)``: the current `token_version`
+    of every user that has revoked tokens, and the revoked jtis that have not
+    expired yet, mapped to their expiry timestamp.
+    """
+    _store.loader = loader
+
+
+def revoke_subject_tokens(sub: str, min_version: int) -> None:
+    """Invalidation hook for "log out everywhere" and password changes."""
+    _store.revoke_subject(sub, min_version)
+
+
+def revoke_token(jti: str, expires_at: float) -> None:
+    """Invalidation hook for a single logout."""
+    _store.revoke_token(jti, expires_at)
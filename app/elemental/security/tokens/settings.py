@@ -1,7 +1,9 @@
-from datetime import timedelta
-from pydantic import Field, SecretStr
+from datetime import datetime, timedelta
+from typing import List, Literal, Optional
+from pydantic import Field, SecretStr, model_validator
 
 from ...common.schemas import ElementalSchema
+from ...exceptions import ConfigurationError
 
 
 class _AccessToken(ElementalSchema):
@@ -36,6 +38,43 @@ class _RefreshToken(ElementalSchema):
             days=self.expire_days
         )
 
+class _VerifiedTokenCache(ElementalSchema):
+    enabled: bool = True
+    max_entries: int = Field(default=10_000, ge=1)
+
+
+class _Revocation(ElementalSchema):
+    enabled: bool = True
+    refresh_interval: float = Field(default=30.0, gt=0)
+
+
+class _SigningKey(ElementalSchema):
+    """
+    One entry of the signing key ring.
+
+    A key signs new tokens while `active_from <= now < active_until` and keeps
+    verifying (and stays published in JWKS) until `verify_until`. Rotating
+    without logging anyone out means adding the new key ahead of time and
+    letting the old key's windows overlap it by at least one refresh lifetime.
+    """
+    kid: str = Field(min_length=1)
+    algorithm: Literal["EdDSA", "ES256", "RS256", "HS256"] = "EdDSA"
+    private_key: Optional[SecretStr] = Field(default=None, repr=False)
+    private_key_file: Optional[str] = None
+    public_key: Optional[str] = None
+
+    active_from: Optional[datetime] = None
+    active_until: Optional[datetime] = None
+    verify_until: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def validate_key_material(self):
+        if self.private_key is None and self.private_key_file is None and self.public_key is None:
+            raise ConfigurationError(f"JWT key '{self.kid}' needs a private_key, private_key_file or public_key.")
+        if self.algorithm == "HS256" and self.public_key is not None:
+            raise ConfigurationError(f"JWT key '{self.kid}' is symmetric and cannot have a public_key.")
+        return self
+
 
 class ElementalJWTSettings(ElementalSchema):
     """
@@ -49,12 +88,34 @@ class ElementalJWTSettings(ElementalSchema):
     Attributes:
         algorithm: The algorithm used for JWT signing. Default is "HS256".
         secret_key: The secret key used for encoding and decoding JSON Web Tokens. Has a
-            minimum length of 8 characters.
+            minimum length of 8 characters. Tokens without a `kid` header are verified
+            with it, so it can stay configured while migrating to the key ring.
+        keys: Key ring of `kid`-tagged keys. When set, new tokens are signed with the
+            currently active key and the public halves are served as JWKS.
+        jwks_max_age: Seconds other services may cache the published JWKS.
+        revocation: Token version / jti revocation checks and their refresh interval.
+        cache: Bounded cache of verified payloads consulted by JWTBearer.
     """
     algorithm: str = "HS256"
-    secret_key: SecretStr = Field(
+    secret_key: Optional[SecretStr] = Field(
+        default=None,
         min_length=8
     )
+    keys: List[_SigningKey] = Field(default_factory=list)
+    jwks_max_age: int = Field(default=300, ge=0)
 
     access_token: _AccessToken = _AccessToken()
     refresh_token: _RefreshToken = _RefreshToken()
+    cache: _VerifiedTokenCache = _VerifiedTokenCache()
+    revocation: _Revocation = _Revocation()
+
+    @model_validator(mode="after")
+    def validate_keys(self):
+        if self.secret_key is None and not self.keys:
+            raise ConfigurationError("Either jwt.secret_key or at least one jwt.keys entry must be defined.")
+
+        kids = [key.kid for key in self.keys]
+        if len(kids) != len(set(kids)):
+            raise ConfigurationError("JWT key ids (kid) must be unique.")
+
+        return self
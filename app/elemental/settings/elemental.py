@@ -35,10 +35,55 @@ class _CorsSettings(ElementalSchema):
     max_age: int = 3600
 
 
+class _WorkersSettings(ElementalSchema):
+    count: int = Field(default=1, ge=1)
+    max_rss_mb: Optional[int] = Field(default=None, ge=1)
+    max_requests: Optional[int] = Field(default=None, ge=1)
+    max_requests_jitter: int = Field(default=0, ge=0)
+    max_age_seconds: Optional[float] = Field(default=None, gt=0)
+    check_interval: float = Field(default=5.0, gt=0)
+
+
+class _ShutdownSettings(ElementalSchema):
+    """
+    `grace_period` bounds the whole drain from the shutdown signal: uvicorn's
+    wait for open connections and the lifespan's wait for background tasks
+    share it, in single-process and supervised mode alike.
+    """
+    grace_period: float = Field(default=20.0, ge=0)
+
+
+class _LoopMonitorSettings(ElementalSchema):
+    enabled: bool = True
+    interval: float = Field(default=0.25, gt=0)
+    block_threshold: float = Field(default=0.1, gt=0)
+
+
+class _ProfilerSettings(ElementalSchema):
+    max_seconds: float = Field(default=60.0, gt=0)
+    interval: float = Field(default=0.01, ge=0.001, le=1)
+
+
+class _MemorySettings(ElementalSchema):
+    frames: int = Field(default=10, ge=1, le=100)
+    max_snapshots: int = Field(default=5, ge=2)
+    top_limit: int = Field(default=20, ge=1)
+
+
+class _DiagnosticsSettings(ElementalSchema):
+    admin_roles: list[str] = ['admin']
+    loop_monitor: _LoopMonitorSettings = _LoopMonitorSettings()
+    profiler: _ProfilerSettings = _ProfilerSettings()
+    memory: _MemorySettings = _MemorySettings()
+
+
 class WebApplication(_ApplicationSettings):
     app_type: Literal["web"] = "web"
     ssl_enabled: bool = False
     cors: _CorsSettings = _CorsSettings()
+    workers: _WorkersSettings = _WorkersSettings()
+    shutdown: _ShutdownSettings = _ShutdownSettings()
+    diagnostics: _DiagnosticsSettings = _DiagnosticsSettings()
 
 
 class ElementalSettings(PydanticBaseSettings):
@@ -0,0 +1,9 @@
+from .registry import (
+    BackgroundTaskRegistry,
+    get_background_tasks
+)
+
+__all__ = [
+    'BackgroundTaskRegistry',
+    'get_background_tasks'
+]
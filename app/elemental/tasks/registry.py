@@ -0,0 +1,72 @@
+import asyncio
+from logging import Logger
+from typing import Any, Coroutine, Optional, Set
+
+from ..logging import get_logger
+
+_logger: Optional[Logger] = None
+
+
+def get_tasks_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("background_tasks")
+    return _logger
+
+
+class BackgroundTaskRegistry:
+    """
+    Keeps track of fire-and-forget tasks so shutdown can wait for them.
+
+    Holding a strong reference also prevents the event loop from garbage
+    collecting a task that nobody awaits while it is still running.
+    """
+
+    def __init__(self):
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is not None:
+            get_tasks_logger().error(f"Background task '{task.get_name()}' failed: {exc!r}")
+
+    async def drain(self, timeout: float) -> int:
+        """
+        Waits up to `timeout` seconds for the registered tasks to finish.
+
+        Returns:
+            Number of tasks still running at the deadline; those are cancelled.
+        """
+        if not self._tasks:
+            return 0
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=max(timeout, 0))
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return len(pending)
+
+
+_registry = BackgroundTaskRegistry()
+
+
+def get_background_tasks() -> BackgroundTaskRegistry:
+    return _registry
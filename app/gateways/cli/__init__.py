@@ -0,0 +1,5 @@
+from .cli import run_cli
+
+__all__ = [
+    'run_cli'
+]
@@ -0,0 +1,19 @@
+import sys
+import argparse
+from typing import List, Optional
+
+from .commands import COMMANDS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py cli", description="Elemental management commands.")
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for register in COMMANDS:
+        register(subparsers)
+    return parser
+
+
+def run_cli(argv: Optional[List[str]] = None) -> int:
+    """Parses `argv` (defaults to sys.argv) and runs the selected command."""
+    args = build_parser().parse_args(sys.argv[1:] if argv is None else argv)
+    return args.handler(args) or 0
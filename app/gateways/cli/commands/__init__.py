@@ -0,0 +1,8 @@
+from .memory import register as register_memory
+from .passwords import register as register_passwords
+
+# Each entry adds one sub-command to the CLI parser.
+COMMANDS = [
+    register_memory,
+    register_passwords,
+]
@@ -0,0 +1,50 @@
+import os
+import json
+import urllib.error
+import urllib.request
+from typing import Optional
+
+from app.elemental.settings import get_settings
+
+ADMIN_TOKEN_ENV = "ELEMENTALBACK_ADMIN_TOKEN"
+
+
+def default_base_url() -> str:
+    application = get_settings().application
+    host = "127.0.0.1" if application.host in ("0.0.0.0", "::") else application.host
+    return f"http://{host}:{application.port}{application.api_prefix}"
+
+
+def add_server_arguments(parser) -> None:
+    parser.add_argument("--url", default=None, help="API base URL (default: from settings)")
+    parser.add_argument(
+        "--token", default=None,
+        help=f"Admin access token (default: ${ADMIN_TOKEN_ENV})"
+    )
+
+
+class AdminClient:
+    """Minimal client for the admin-only endpoints of a running server."""
+
+    def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None, timeout: float = 30.0):
+        self.base_url = (base_url or default_base_url()).rstrip("/")
+        self.token = token or os.environ.get(ADMIN_TOKEN_ENV)
+        self.timeout = timeout
+
+    def request(self, method: str, path: str) -> dict:
+        request = urllib.request.Request(f"{self.base_url}{path}", method=method)
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:  # nosec B310
+                body = json.loads(response.read() or b"null")
+        except urllib.error.HTTPError as exc:
+            raise SystemExit(f"{method} {path} failed with {exc.code}: {exc.read().decode(errors='replace')}")
+        except urllib.error.URLError as exc:
+            raise SystemExit(f"Could not reach {self.base_url}: {exc.reason}")
+
+        # The success parser wraps payloads in an envelope.
+        if isinstance(body, dict) and "data" in body:
+            return body["data"]
+        return body
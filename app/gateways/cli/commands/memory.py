@@ -0,0 +1,85 @@
+import argparse
+from urllib.parse import quote, urlencode
+
+from .client import AdminClient, add_server_arguments
+
+_PREFIX = "/diagnostics/memory"
+
+
+def _format_size(size: int) -> str:
+    sign = "-" if size < 0 else ("+" if size > 0 else "")
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
+
+
+def _print_top(report: dict) -> None:
+    print(f"Snapshot '{report['snapshot']}': {_format_size(report['total_size']).lstrip('+')} traced")
+    for module in report["modules"]:
+        print(f"\n{_format_size(module['size']).lstrip('+'):>12}  {module['count']:>9} blocks  {module['module']}")
+        for site in module["sites"]:
+            print(f"{_format_size(site['size']).lstrip('+'):>12}  {site['count']:>9} blocks    {site['site']}")
+
+
+def _print_diff(report: dict) -> None:
+    print(f"'{report['base']}' -> '{report['target']}': {_format_size(report['size_diff'])}")
+    for module in report["modules"]:
+        print(f"\n{_format_size(module['size_diff']):>12}  {module['count_diff']:>+9} blocks  {module['module']}")
+        for site in module["sites"]:
+            print(f"{_format_size(site['size']):>12}  {site['count']:>+9} blocks    {site['site']}")
+
+
+def _handle(args: argparse.Namespace) -> int:
+    client = AdminClient(args.url, args.token)
+
+    if args.action == "start":
+        client.request("POST", f"{_PREFIX}/start?{urlencode({'frames': args.frames})}")
+        print(f"Memory tracing started ({args.frames} frames).")
+    elif args.action == "stop":
+        client.request("POST", f"{_PREFIX}/stop")
+        print("Memory tracing stopped.")
+    elif args.action == "snapshot":
+        result = client.request("POST", f"{_PREFIX}/snapshots/{quote(args.name)}")
+        print(
+            f"Snapshot '{result['name']}' taken: {_format_size(result['traced_bytes']).lstrip('+')} traced, "
+            f"peak {_format_size(result['peak_bytes']).lstrip('+')}."
+        )
+    elif args.action == "top":
+        _print_top(client.request("GET", f"{_PREFIX}/snapshots/{quote(args.name)}?{urlencode({'limit': args.limit})}"))
+    elif args.action == "diff":
+        query = urlencode({"base": args.base, "target": args.target, "limit": args.limit})
+        _print_diff(client.request("GET", f"{_PREFIX}/diff?{query}"))
+    return 0
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "memory",
+        help="tracemalloc snapshots of a running server",
+        description="Drives the memory diagnostics endpoints of a running server (admin token required)."
+    )
+    actions = parser.add_subparsers(dest="action", metavar="action", required=True)
+
+    start = actions.add_parser("start", help="start tracing allocations")
+    start.add_argument("--frames", type=int, default=10, help="traceback depth (default: 10)")
+
+    actions.add_parser("stop", help="stop tracing allocations")
+
+    snapshot = actions.add_parser("snapshot", help="take a named snapshot")
+    snapshot.add_argument("name")
+
+    top = actions.add_parser("top", help="largest allocation sites of a snapshot, by app module")
+    top.add_argument("name")
+    top.add_argument("--limit", type=int, default=20)
+
+    diff = actions.add_parser("diff", help="compare two snapshots, by app module")
+    diff.add_argument("base")
+    diff.add_argument("target")
+    diff.add_argument("--limit", type=int, default=20)
+
+    for action in actions.choices.values():
+        add_server_arguments(action)
+    parser.set_defaults(handler=_handle)
@@ -0,0 +1,57 @@
+import argparse
+
+from app.elemental.settings import get_settings
+from app.elemental.security.passwords import calibrate
+
+
+def _handle(args: argparse.Namespace) -> int:
+    settings = get_settings().passwords
+    scheme = args.scheme or settings.scheme
+
+    try:
+        result = calibrate(
+            scheme,
+            args.target_ms,
+            samples=args.samples,
+            argon2_memory_cost=settings.argon2.memory_cost,
+            argon2_parallelism=settings.argon2.parallelism
+        )
+    except ImportError:
+        raise SystemExit("argon2 calibration needs the 'argon2-cffi' package.")
+
+    for entry in result["measurements"]:
+        cost = ", ".join(f"{key}={value}" for key, value in entry.items() if key != "seconds")
+        print(f"{cost:<48} {entry['seconds'] * 1000:8.1f} ms")
+
+    choice = result["choice"]
+    print(f"\nClosest cost under {args.target_ms:.0f} ms: {choice['seconds'] * 1000:.1f} ms per hash.")
+    print("Settings:\n")
+    print("[passwords]")
+    print(f'scheme = "{scheme}"')
+    if scheme == "bcrypt":
+        print(f"bcrypt_rounds = {choice['bcrypt_rounds']}")
+    else:
+        print("\n[passwords.argon2]")
+        for key in ("time_cost", "memory_cost", "parallelism"):
+            print(f"{key} = {choice[key]}")
+    return 0
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "passwords",
+        help="password hashing maintenance",
+        description="Password hashing maintenance commands."
+    )
+    actions = parser.add_subparsers(dest="action", metavar="action", required=True)
+
+    calibrate_parser = actions.add_parser(
+        "calibrate",
+        help="pick the hashing cost that meets a target latency on this machine"
+    )
+    calibrate_parser.add_argument("--target-ms", type=float, default=250.0, help="latency per hash (default: 250)")
+    calibrate_parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=None,
+                                  help="scheme to calibrate (default: passwords.scheme)")
+    calibrate_parser.add_argument("--samples", type=int, default=3, help="timings per cost, median is used")
+
+    parser.set_defaults(handler=_handle)
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from fastapi import Request
+from fastapi.security import APIKeyHeader
+
+from app.elemental.exceptions import AuthenticationError
+from app.elemental.settings import get_settings
+from app.elemental.security.apikeys import get_api_key_authenticator
+
+
+class APIKeyBearer(APIKeyHeader):
+    """
+    Authenticates machine clients by the API key in the configured header
+    (``X-API-Key`` by default) and returns a payload shaped like an access
+    token's. With `auto_error=False` a missing header, or any header while API
+    keys are disabled, yields None, so the dependency can be combined with
+    `JWTBearer`.
+    """
+
+    def __init__(self, auto_error: bool = True):
+        settings = get_settings().api_keys
+        super(APIKeyBearer, self).__init__(name=settings.header, auto_error=False)
+        self.require_key = auto_error
+        self.enabled = settings.enabled
+
+    async def __call__(self, request: Request) -> Optional[dict]:
+        key = await super(APIKeyBearer, self).__call__(request)
+
+        if not key:
+            if self.require_key:
+                raise AuthenticationError(message="Missing API key.")
+            return None
+
+        if not self.enabled:
+            if not self.require_key:
+                return None
+            raise AuthenticationError(message="API key authentication is disabled.")
+
+        payload = await get_api_key_authenticator().authenticate(key)
+        if payload is None:
+            raise AuthenticationError(message="Invalid API key.")
+
+        return payload
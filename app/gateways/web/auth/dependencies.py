@@ -1,11 +1,25 @@
-from typing import Dict, Any, Union
-from fastapi import Depends, HTTPException, status
+from typing import Dict, Any, Optional, Union
+from fastapi import Depends
 
+from .api_key import APIKeyBearer
 from .jwt_bearer import JWTBearer
-from app.elemental.security.roles import require_role, extract_user_info, has_permission, get_user_permissions
-from app.elemental.exceptions import ForbiddenError, UnauthorizedError, AuthenticationError
+from app.elemental.security.roles import extract_user_info
+from app.elemental.security.rbac import get_rbac
+from app.elemental.security.principals import get_principal_cache
+from app.elemental.settings import get_settings
+from app.elemental.exceptions import (
+    ForbiddenError,
+    UnauthorizedError,
+    AuthenticationError,
+    AccountDisabledError,
+    AccountNotVerifiedError,
+    TokenRevokedError
+)
 
 jwt_bearer = JWTBearer()
+optional_jwt_bearer = JWTBearer(require_token=False)
+api_key_bearer = APIKeyBearer()
+optional_api_key_bearer = APIKeyBearer(auto_error=False)
 
 
 async def get_current_user_payload(
@@ -13,12 +27,56 @@ async def get_current_user_payload(
 ) -> Dict[str, Any]:
     return payload
 
+async def get_api_key_payload(
+    payload: dict = Depends(api_key_bearer)
+) -> Dict[str, Any]:
+    return payload
+
+
+async def get_principal_payload(
+    api_key_payload: Optional[dict] = Depends(optional_api_key_bearer),
+    token_payload: Optional[dict] = Depends(optional_jwt_bearer)
+) -> Dict[str, Any]:
+    """
+    Accepts either an API key or a bearer token; the API key wins when both are sent.
+    Both schemes are dependencies, so routes declare them in OpenAPI.
+    """
+    if api_key_payload is not None:
+        return api_key_payload
+    if token_payload is not None:
+        return token_payload
+    raise AuthenticationError(message="Missing authorization header.")
+
 async def get_current_user_info(
     payload: Dict[str, Any] = Depends(get_current_user_payload)
 ) -> Dict[str, Any]:
     return extract_user_info(payload)
 
 
+async def get_current_active_user(
+    payload: Dict[str, Any] = Depends(get_current_user_payload)
+) -> Dict[str, Any]:
+    """
+    Like `get_current_user_info`, but also rejects disabled or unverified
+    accounts and tokens older than the account's token version. Account state
+    comes from the principal cache, so a request normally costs no query.
+    The checks are skipped while the cache is disabled or has no loader.
+    """
+    cache = get_principal_cache()
+    if get_settings().principals.enabled and cache.loader is not None:
+        state = await cache.get(payload.get("sub"))
+        if state is None:
+            raise UnauthorizedError("User no longer exists")
+        if not state.is_active:
+            raise AccountDisabledError()
+        if not state.is_verified:
+            raise AccountNotVerifiedError()
+        if payload.get("version", 1) < state.token_version:
+            raise TokenRevokedError()
+
+    return extract_user_info(payload)
+
+
 async def get_current_user_id(
     user_info: Dict[str, Any] = Depends(get_current_user_info)
 ) -> str:
@@ -41,31 +99,49 @@ async def get_current_user_role(
     return role
 
 def require_roles(*allowed_roles: Union[str, int]):
+    """
+    Allows tokens or API keys whose role is one of `allowed_roles` or inherits one of them.
+    The allowed set is compiled to a role mask once, when the dependency is built.
+    """
+    if not all(isinstance(role, (str, int)) for role in allowed_roles):
+        raise ValueError("Roles must be string or int type")
+
+    rbac = get_rbac()
+    required = rbac.roles_mask(allowed_roles)
+
     async def check_roles(
-        payload: Dict[str, Any] = Depends(get_current_user_payload)
+        payload: Dict[str, Any] = Depends(get_principal_payload)
     ) -> Dict[str, Any]:
-        return require_role(payload, *allowed_roles)
+        if not payload:
+            raise UnauthorizedError("No authentication token provided")
+
+        if not rbac.has_role(payload, required):
+            raise ForbiddenError(
+                f"Operation not permitted for role: {payload.get('role', 'None')}"
+            )
+        return payload
 
     return check_roles
-#
-#
-
-# async def get_current_user_permissions(
-#     payload: Dict[str, Any] = Depends(get_current_user_payload)
-# ) -> List[str]:
-#     return get_user_permissions(payload)
-#
-#
-
-# def require_permission(required_permission: str):
-#     async def check_permission(
-#             payload: Dict[str, Any] = Depends(get_current_user_payload)
-#     ) -> Dict[str, Any]:
-#         if not has_permission(payload, required_permission):
-#             raise HTTPException(
-#                 status_code=status.HTTP_403_FORBIDDEN,
-#                 detail=f"Permission required: {required_permission}"
-#             )
-#         return payload
-#
-#     return check_permission
\ No newline at end of file
+
+
+def require_permission(*required_permissions: str):
+    """
+    Allows tokens or API keys holding every one of `required_permissions`, read from the
+    token's permission mask (or its role's mask for tokens issued without one).
+    """
+    rbac = get_rbac()
+    required = rbac.permissions_mask(required_permissions)
+
+    async def check_permission(
+        payload: Dict[str, Any] = Depends(get_principal_payload)
+    ) -> Dict[str, Any]:
+        if not payload:
+            raise UnauthorizedError("No authentication token provided")
+
+        if not rbac.has_permissions(payload, required):
+            raise ForbiddenError(
+                f"Permission required: {', '.join(required_permissions)}"
+            )
+        return payload
+
+    return check_permission
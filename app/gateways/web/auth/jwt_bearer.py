@@ -7,19 +7,45 @@ from fastapi import Request
 from fastapi.security import HTTPBearer
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.elemental.exceptions import AuthenticationError
+from app.elemental.exceptions import AuthenticationError, TokenRevokedError
+from app.elemental.settings import get_settings
 from app.elemental.security.tokens import decode_token
+from app.elemental.security.tokens import get_token_codec
 from app.elemental.security.tokens import ElementalTokenTypes
+from app.elemental.security.tokens import get_verified_token_cache
+from app.elemental.security.tokens import get_revocation_store
 
 
 class JWTBearer(HTTPBearer):
-    def __init__(self, auto_error: bool = False):
+    """
+    Verifies the bearer access token and returns its payload. With
+    `require_token=False` a missing header yields None, so the dependency can
+    be combined with `APIKeyBearer`.
+    """
+
+    def __init__(
+        self,
+        auto_error: bool = False,
+        use_cache: Optional[bool] = None,
+        check_revocation: Optional[bool] = None,
+        require_token: bool = True
+    ):
         super(JWTBearer, self).__init__(auto_error=auto_error)
+        self.require_token = require_token
+        jwt_settings = get_settings().jwt
+        if use_cache is None:
+            use_cache = jwt_settings.cache.enabled
+        if check_revocation is None:
+            check_revocation = jwt_settings.revocation.enabled
+        self.cache = get_verified_token_cache() if use_cache else None
+        self.revocation = get_revocation_store() if check_revocation else None
 
     async def __call__(self, request: Request) -> Optional[dict]:
         credentials: HTTPAuthorizationCredentials = await super(JWTBearer, self).__call__(request)
 
         if not credentials:
+            if not self.require_token:
+                return None
             raise AuthenticationError(message="Missing authorization header.")
 
         if not credentials.scheme == "Bearer":
@@ -28,13 +54,21 @@ class JWTBearer(HTTPBearer):
             )
 
         token = credentials.credentials
-        payload = self.get_payload(token)
+        payload = self.cache.get(token) if self.cache is not None else None
+        if payload is None:
+            payload = self.get_payload(token)
+            if payload and self.cache is not None:
+                # A cached payload must not outlive the key that verified it.
+                self.cache.put(token, payload, get_token_codec().verify_until(token))
         if not payload:
             raise AuthenticationError(message="Invalid token.")
 
         if payload.get("type") != ElementalTokenTypes.ACCESS:
             raise AuthenticationError(message="Invalid token type.")
 
+        if self.revocation is not None and self.revocation.is_revoked(payload):
+            raise TokenRevokedError()
+
         return payload
 
     @staticmethod
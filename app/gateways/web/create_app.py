@@ -10,6 +10,10 @@ from .middlewares import (
     success_parser_middleware,
     headers_middleware,
     security_logging_middleware,
+    request_counter_middleware,
+    inflight_requests_middleware,
+    loop_monitor_middleware,
+    query_stats_middleware,
     elemental_form_error_handler
 )
 
@@ -38,13 +42,21 @@ def __init_middlewares__(
     _app_: FastAPI,
 ) -> None:
 
+    # Registration order is inside-out: the first entry wraps the router directly.
+    # The loop monitor tagger must stay innermost because BaseHTTPMiddleware
+    # layers run the downstream app in a separate task. The query stats layer
+    # stays outermost so its header is added after the response rewriters ran.
     middleware_list = [
+        loop_monitor_middleware,
         cors_middleware,
         logging_middleware,
         headers_middleware,
         success_parser_middleware,
         exception_parser_middleware,
-        security_logging_middleware
+        security_logging_middleware,
+        request_counter_middleware,
+        inflight_requests_middleware,
+        query_stats_middleware
     ]
 
     for middleware_class, options in middleware_list:
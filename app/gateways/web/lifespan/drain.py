@@ -0,0 +1,36 @@
+import time
+from logging import Logger
+
+from app.elemental.tasks import get_background_tasks
+from ..middlewares import get_inflight_tracker
+
+
+async def drain_application(grace_period: float, logger: Logger) -> None:
+    """
+    Stops admitting requests and waits for in-flight handlers and registered
+    background tasks before services are disposed. The `grace_period` counts
+    from the shutdown signal, so time uvicorn already spent closing
+    connections is not granted twice.
+    """
+    tracker = get_inflight_tracker()
+    tracker.start_draining()
+    deadline = tracker.drain_started + grace_period
+
+    background_tasks = get_background_tasks()
+    logger.info(
+        f"Draining: {tracker.active} in-flight requests, "
+        f"{background_tasks.pending} background tasks (grace period {grace_period}s)"
+    )
+
+    await tracker.wait_idle(deadline - time.monotonic())
+    aborted_requests = tracker.active
+
+    aborted_tasks = await background_tasks.drain(deadline - time.monotonic())
+
+    if aborted_requests or aborted_tasks:
+        logger.warning(
+            f"Drain timed out: {aborted_requests} in-flight requests and "
+            f"{aborted_tasks} background tasks aborted."
+        )
+    else:
+        logger.info("Drain complete.")
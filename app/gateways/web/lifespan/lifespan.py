@@ -3,9 +3,16 @@ from contextlib import asynccontextmanager
 from importlib import import_module
 
 from app.elemental.logging import get_logger
+from app.elemental.diagnostics import start_loop_monitor, stop_loop_monitor
 from app.elemental.settings import get_settings
+from app.elemental.security.tokens import get_revocation_store
+from app.elemental.security.apikeys import get_api_key_authenticator
+from app.elemental.security.passwords import shutdown_password_hasher
 from app.infrastructure import infrastructure_modules
 
+from ..middlewares import get_inflight_tracker
+from .drain import drain_application
+
 
 @asynccontextmanager
 async def app_lifespan(
@@ -14,10 +21,13 @@ async def app_lifespan(
     settings = get_settings()
 
     logger = get_logger("fastapi_lifespan")
+    api_key_settings = getattr(settings, "api_keys", None)
 
     loaded_services: list[str] = []
     loaded_modules: dict[str, object] = {}
 
+    get_inflight_tracker().reset()
+
     # --- INIT PHASE ---
     try:
         for key, module_path in infrastructure_modules.items():
@@ -42,9 +52,45 @@ async def app_lifespan(
             await init_func(getattr(settings, key))
             loaded_services.append(key)
 
+        jwt_settings = getattr(settings, "jwt", None)
+        if jwt_settings and jwt_settings.revocation.enabled:
+            revocation = get_revocation_store()
+            revocation.refresh_interval = jwt_settings.revocation.refresh_interval
+            await revocation.start()
+
+        if api_key_settings and api_key_settings.enabled:
+            await get_api_key_authenticator().start()
+
+        diagnostics = getattr(settings.application, "diagnostics", None)
+        if diagnostics and diagnostics.loop_monitor.enabled:
+            start_loop_monitor(
+                interval=diagnostics.loop_monitor.interval,
+                block_threshold=diagnostics.loop_monitor.block_threshold
+            )
+
         yield
 
     finally:
+        # =========================
+        # DRAIN PHASE
+        # =========================
+        shutdown_settings = getattr(settings.application, "shutdown", None)
+        grace_period = shutdown_settings.grace_period if shutdown_settings else 0.0
+
+        try:
+            await drain_application(grace_period, logger)
+        except Exception as e:
+            logger.error(f"Error while draining: {e}")
+
+        # The refresh loop reads from the database, so it stops before services close.
+        await get_revocation_store().stop()
+        # Last-used timestamps are flushed while the database is still open.
+        if api_key_settings and api_key_settings.enabled:
+            try:
+                await get_api_key_authenticator().stop()
+            except Exception as e:
+                logger.error(f"Error flushing API key usage: {e}")
+
         # =========================
         # SHUTDOWN PHASE
         # =========================
@@ -71,4 +117,6 @@ async def app_lifespan(
             except Exception as e:
                 logger.error(f"Error shutting down {key}: {e}")
 
+        shutdown_password_hasher()
+        stop_loop_monitor()
         logger.info("All services shut down.")
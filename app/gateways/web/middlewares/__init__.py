@@ -2,6 +2,10 @@ from .logging import logging_middleware
 from .cors import cors_middleware
 from .headers import headers_middleware
 from .security import security_logging_middleware
+from .counters import request_counter_middleware
+from .inflight import inflight_requests_middleware, get_inflight_tracker
+from .loop_monitor import loop_monitor_middleware
+from .queries import query_stats_middleware
 
 from .responses import (
     success_parser_middleware,
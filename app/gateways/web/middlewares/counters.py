@@ -0,0 +1,36 @@
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Shared counter injected by the worker supervisor (multiprocessing RawValue).
+# Stays None when the app runs as a single, unsupervised process.
+_request_counter: Optional[object] = None
+
+
+def set_request_counter(counter: Optional[object]) -> None:
+    global _request_counter
+    _request_counter = counter
+
+
+class RequestCounterMiddleware:
+    """
+    Counts handled HTTP requests into the counter shared with the worker supervisor.
+
+    Implemented as a plain ASGI middleware: it only bumps an integer, so it should
+    not pay for the request/response wrapping done by BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and _request_counter is not None:
+            _request_counter.value += 1
+
+        await self.app(scope, receive, send)
+
+
+request_counter_middleware = (
+    RequestCounterMiddleware,
+    {}
+)
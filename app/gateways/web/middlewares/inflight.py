@@ -0,0 +1,105 @@
+import time
+import asyncio
+from typing import Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.elemental.common import ElementalErrorCode
+from app.elemental.common.responses import parse_response
+
+
+class InFlightTracker:
+    """Counts HTTP requests currently being handled and gates admission while draining."""
+
+    def __init__(self):
+        self.active = 0
+        self.draining = False
+        self.drain_started: Optional[float] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def reset(self) -> None:
+        """Re-arms the tracker at startup (the idle event must belong to the running loop)."""
+        self.active = 0
+        self.draining = False
+        self.drain_started = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start_draining(self) -> None:
+        """Closes admission; `drain_started` keeps the `time.monotonic()` of the first call."""
+        if not self.draining:
+            self.draining = True
+            self.drain_started = time.monotonic()
+
+    def enter(self) -> None:
+        self.active += 1
+        self._idle.clear()
+
+    def leave(self) -> None:
+        self.active -= 1
+        if self.active <= 0:
+            self.active = 0
+            self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Returns True when every in-flight request finished before the timeout."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max(timeout, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+_tracker = InFlightTracker()
+
+
+def get_inflight_tracker() -> InFlightTracker:
+    return _tracker
+
+
+class InFlightRequestsMiddleware:
+    """
+    Tracks in-flight requests for the shutdown drain phase.
+
+    Once draining starts, new requests are refused with 503 so the worker can
+    finish what it already accepted. It is a plain ASGI middleware so the count
+    covers the whole response, including streamed bodies and background tasks.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if _tracker.draining:
+            error = ElementalErrorCode.SERVICE_UNAVAILABLE
+            response = JSONResponse(
+                status_code=error.http_code,
+                content=parse_response(
+                    status_code=error.http_code,
+                    error_code=error.name,
+                    message="The server is shutting down.",
+                    path=scope.get("path", ""),
+                    method=scope.get("method", "")
+                ),
+                headers={"Connection": "close", "Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        _tracker.enter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _tracker.leave()
+
+
+inflight_requests_middleware = (
+    InFlightRequestsMiddleware,
+    {}
+)
@@ -0,0 +1,34 @@
+import asyncio
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.elemental.diagnostics import get_loop_monitor
+
+
+class LoopMonitorRouteMiddleware:
+    """
+    Registers which request each task is serving, so the event-loop watchdog can
+    name the route when it catches a blocking callback.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        monitor = get_loop_monitor()
+        if monitor is None or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        monitor.requests[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            monitor.requests.pop(task, None)
+
+
+loop_monitor_middleware = (
+    LoopMonitorRouteMiddleware,
+    {}
+)
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.elemental.settings import get_settings
+from app.infrastructure.database.sql.instrumentation import track_queries
+
+
+class QueryStatsMiddleware:
+    """
+    Opens the per-request query stats the database instrumentation fills in.
+
+    With `header` (defaults to ``application.debug``) the response carries
+    ``X-DB-Query-Count`` and ``X-DB-Query-Time`` (milliseconds), covering the
+    queries run before the response started.
+    """
+
+    def __init__(self, app: ASGIApp, header: Optional[bool] = None):
+        self.app = app
+        self.header = get_settings().application.debug if header is None else header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(scope) as stats:
+            if not self.header:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Query-Time"] = f"{stats.duration * 1000:.1f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+
+query_stats_middleware = (
+    QueryStatsMiddleware,
+    {}
+)
@@ -6,6 +6,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.elemental.common.responses import parse_response
 
+# Request state flag set by responses that write their own envelope while streaming.
+ENVELOPED_STATE_KEY = "response_enveloped"
+
 JSON_CONTENT_TYPES = [
     "application/json",
     "application/json; charset=utf-8"
@@ -34,6 +37,9 @@ class SuccessParserMiddleware(BaseHTTPMiddleware):
 
         response: Response = await call_next(request)
 
+        if getattr(request.state, ENVELOPED_STATE_KEY, False):
+            return response
+
         # Process only successful JSON responses
         if 200 <= response.status_code < 300:
             content_type = response.headers.get("content-type", "")
@@ -0,0 +1,69 @@
+from typing import Any, Callable, Literal, Optional
+
+from fastapi import Query
+
+from app.elemental.common.schemas import CursorPageMeta, CursorPageSchema, PageMeta, PageSchema
+
+
+class CursorParams:
+    """Query parameters of a keyset-paginated listing."""
+
+    __slots__ = ("limit", "cursor")
+
+    def __init__(self, limit: int, cursor: Optional[str]):
+        self.limit = limit
+        self.cursor = cursor
+
+
+def cursor_pagination(default_limit: int = 20, max_limit: int = 100):
+    """
+    Builds the dependency reading ``?limit=&cursor=``. Pass its `limit` and
+    `cursor` to `ElementalRepository._get_page` and the result to `cursor_page`.
+    """
+
+    async def get_cursor_params(
+        limit: int = Query(default_limit, ge=1, le=max_limit, description="Items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page")
+    ) -> CursorParams:
+        return CursorParams(limit, cursor)
+
+    return get_cursor_params
+
+
+def cursor_page(page: Any, serialize: Optional[Callable[[Any], Any]] = None) -> CursorPageSchema:
+    """Shapes a repository `CursorPage` as ``{"items": [...], "page": {...}}``."""
+    items = [serialize(item) for item in page.items] if serialize is not None else list(page.items)
+    return CursorPageSchema(items=items, page=CursorPageMeta(**page.meta()))
+
+
+class PageParams:
+    """Query parameters of a numbered listing."""
+
+    __slots__ = ("page", "page_size", "count")
+
+    def __init__(self, page: int, page_size: int, count: str):
+        self.page = page
+        self.page_size = page_size
+        self.count = count
+
+
+def page_pagination(default_page_size: int = 20, max_page_size: int = 100, default_count: str = "exact"):
+    """
+    Builds the dependency reading ``?page=&page_size=&count=``. Pass the values
+    to `ElementalRepository._get_page_with_total` and the result to `page_response`.
+    """
+
+    async def get_page_params(
+        page: int = Query(1, ge=1, description="Page number"),
+        page_size: int = Query(default_page_size, ge=1, le=max_page_size, description="Items per page"),
+        count: Literal["exact", "estimated", "none"] = Query(default_count, description="How to compute the total")
+    ) -> PageParams:
+        return PageParams(page, page_size, count)
+
+    return get_page_params
+
+
+def page_response(page: Any, serialize: Optional[Callable[[Any], Any]] = None) -> PageSchema:
+    """Shapes a repository `OffsetPage` as ``{"items": [...], "page": {...}}``."""
+    items = [serialize(item) for item in page.items] if serialize is not None else list(page.items)
+    return PageSchema(items=items, page=PageMeta(**page.meta()))
@@ -1,9 +1,13 @@
 from fastapi import APIRouter
 from .src_routers import get_all_routers
 from .docs import custom_openapi
+from .diagnostics import diagnostics_router
+from .jwks import well_known_router
 
 
 elemental_router = APIRouter()
+elemental_router.include_router(diagnostics_router)
+elemental_router.include_router(well_known_router)
 
 @elemental_router.get("/ping")
 async def ping() -> bool:
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import PlainTextResponse
+
+from app.elemental.diagnostics import get_memory_tracer, profile
+from app.elemental.metrics import get_metrics_registry
+from app.elemental.settings import get_settings
+
+from ..auth.dependencies import require_roles
+
+_settings = get_settings()
+_diagnostics_settings = _settings.application.diagnostics
+
+diagnostics_router = APIRouter(
+    prefix="/diagnostics",
+    tags=["diagnostics"],
+    dependencies=[Depends(require_roles(*_diagnostics_settings.admin_roles))]
+)
+
+# Prometheus text exposition format.
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@diagnostics_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Returns this worker's metrics for Prometheus to scrape."""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=METRICS_MEDIA_TYPE)
+
+
+@diagnostics_router.get("/profile", response_class=PlainTextResponse)
+async def sample_profile(
+    seconds: float = Query(10.0, gt=0, description="Sampling duration in seconds"),
+    interval_ms: float = Query(
+        _diagnostics_settings.profiler.interval * 1000, ge=1, le=1000,
+        description="Sampling interval in milliseconds"
+    ),
+    all_threads: bool = Query(False, description="Sample every thread, not only the event loop"),
+    include_idle: bool = Query(False, description="Keep stacks parked in select/wait"),
+) -> str:
+    """Runs the in-process sampling profiler and returns collapsed stacks for flamegraph tools."""
+    return await profile(
+        seconds,
+        interval=interval_ms / 1000,
+        all_threads=all_threads,
+        include_idle=include_idle,
+        max_seconds=_diagnostics_settings.profiler.max_seconds
+    )
+
+
+@diagnostics_router.post("/memory/start")
+async def start_memory_tracing(
+    frames: int = Query(_diagnostics_settings.memory.frames, ge=1, le=100, description="Traceback depth"),
+) -> dict:
+    """Starts tracemalloc. Deeper tracebacks attribute allocations better but cost more."""
+    get_memory_tracer(_diagnostics_settings.memory.max_snapshots).start(frames)
+    return {"tracing": True, "frames": frames}
+
+
+@diagnostics_router.post("/memory/stop")
+async def stop_memory_tracing() -> dict:
+    """Stops tracemalloc. Snapshots already taken stay available for comparison."""
+    get_memory_tracer(_diagnostics_settings.memory.max_snapshots).stop()
+    return {"tracing": False}
+
+
+# Taking and grouping snapshots walks every trace and can take seconds on a large
+# heap; these endpoints are plain functions so FastAPI runs them in its threadpool
+# instead of on the event loop.
+@diagnostics_router.post("/memory/snapshots/{name}")
+def take_memory_snapshot(name: str = Path(..., pattern=r"^[\w.-]{1,64}$")) -> dict:
+    """Takes a named snapshot, replacing an older one with the same name."""
+    return get_memory_tracer(_diagnostics_settings.memory.max_snapshots).take(name)
+
+
+@diagnostics_router.get("/memory/snapshots/{name}")
+def memory_snapshot_top(
+    name: str,
+    limit: int = Query(_diagnostics_settings.memory.top_limit, ge=1, le=500),
+) -> dict:
+    """Returns the largest `app.*` modules of a snapshot with their top allocation sites."""
+    return get_memory_tracer(_diagnostics_settings.memory.max_snapshots).top(name, limit)
+
+
+@diagnostics_router.get("/memory/diff")
+def memory_snapshot_diff(
+    base: str = Query(..., description="Older snapshot name"),
+    target: str = Query(..., description="Newer snapshot name"),
+    limit: int = Query(_diagnostics_settings.memory.top_limit, ge=1, le=500),
+) -> dict:
+    """Compares two snapshots, largest growth (or shrink) first."""
+    return get_memory_tracer(_diagnostics_settings.memory.max_snapshots).diff(base, target, limit)
@@ -0,0 +1,21 @@
+import json
+
+from fastapi import APIRouter, Response
+
+from app.elemental.settings import get_settings
+from app.elemental.security.tokens import get_token_codec
+
+_jwt_settings = get_settings().jwt
+
+well_known_router = APIRouter(prefix="/.well-known", tags=["auth"])
+
+
+@well_known_router.get("/jwks.json")
+async def jwks() -> Response:
+    """Public verification keys of the JWT key ring, for services that verify tokens locally."""
+    # The JWK Set media type keeps the success parser from wrapping the document in the envelope.
+    return Response(
+        content=json.dumps(get_token_codec().keyring.jwks()),
+        media_type="application/jwk-set+json",
+        headers={"Cache-Control": f"public, max-age={_jwt_settings.jwks_max_age}"}
+    )
@@ -0,0 +1,115 @@
+import json
+import uuid
+from decimal import Decimal
+from datetime import date, datetime, time
+from typing import Any, AsyncIterable, Callable, Literal, Mapping, Optional
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.elemental.logging import get_logger
+from app.elemental.common.responses import parse_response
+
+from .middlewares.responses.success import ENVELOPED_STATE_KEY
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_STREAM_ABORTED = {"code": "STREAM_ABORTED", "message": "The response stream was interrupted.", "details": {}}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _default_serialize(item: Any) -> Any:
+    model_dump = getattr(item, "model_dump", None)
+    return model_dump() if model_dump is not None else item
+
+
+class RowStreamResponse(StreamingResponse):
+    """
+    Streams rows as they are produced, e.g. from `ElementalRepository._stream`.
+
+    ``format="json"`` writes the standard response envelope around a JSON
+    array: everything up to ``"data":[`` goes out first, then the rows, then the
+    closing keys. ``success`` and ``error`` are written last, so a failure in
+    the middle of the stream still ends in a valid document that reports it.
+    ``format="ndjson"`` writes one row per line with no envelope; a failure
+    adds a final ``{"error": ...}`` line.
+
+    Encoded rows are buffered up to `chunk_size` bytes per write, so memory
+    stays bounded by one chunk plus the rows the iterator holds.
+    """
+
+    def __init__(
+        self,
+        rows: AsyncIterable[Any],
+        format: Literal["json", "ndjson"] = "json",
+        serialize: Optional[Callable[[Any], Any]] = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 64 * 1024
+    ):
+        self.rows = rows
+        self.format = format
+        self.serialize = serialize or _default_serialize
+        self.chunk_size = chunk_size
+        media_type = NDJSON_MEDIA_TYPE if format == "ndjson" else "application/json"
+        super().__init__(content=(), status_code=status_code, headers=headers, media_type=media_type)
+
+    def _dumps(self, value: Any) -> str:
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+    async def _encode_json(self, scope: Scope):
+        envelope = parse_response(
+            data=[],
+            status_code=self.status_code,
+            path=scope.get("path", ""),
+            method=scope.get("method", "")
+        )
+        head = {key: value for key, value in envelope.items() if key not in ("success", "data", "error")}
+        yield self._dumps(head)[:-1] + ',"data":['
+
+        buffer, size, first = [], 0, True
+        try:
+            async for row in self.rows:
+                encoded = self._dumps(self.serialize(row))
+                buffer.append(encoded if first else "," + encoded)
+                size += len(encoded) + 1
+                first = False
+                if size >= self.chunk_size:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+        except Exception as e:
+            get_logger("streaming").error(f"Row stream failed for {scope.get('path')}: {e!r}")
+            yield "".join(buffer) + '],"success":false,"error":' + self._dumps(_STREAM_ABORTED) + "}"
+            return
+
+        yield "".join(buffer) + '],"success":true,"error":null}'
+
+    async def _encode_ndjson(self, scope: Scope):
+        buffer, size = [], 0
+        try:
+            async for row in self.rows:
+                encoded = self._dumps(self.serialize(row)) + "\n"
+                buffer.append(encoded)
+                size += len(encoded)
+                if size >= self.chunk_size:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+        except Exception as e:
+            get_logger("streaming").error(f"Row stream failed for {scope.get('path')}: {e!r}")
+            buffer.append(self._dumps({"error": _STREAM_ABORTED}) + "\n")
+
+        if buffer:
+            yield "".join(buffer)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope.setdefault("state", {})[ENVELOPED_STATE_KEY] = True
+        encode = self._encode_ndjson if self.format == "ndjson" else self._encode_json
+        self.body_iterator = encode(scope)
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,9 @@
+from .supervisor import WorkerSupervisor, read_process_rss
+from .server import DrainingServer, server_config
+
+__all__ = [
+    'DrainingServer',
+    'WorkerSupervisor',
+    'read_process_rss',
+    'server_config'
+]
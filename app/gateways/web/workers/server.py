@@ -0,0 +1,33 @@
+import math
+from types import FrameType
+from typing import Any, Optional
+
+import uvicorn
+
+from app.elemental.settings import WebApplication
+from ..middlewares import get_inflight_tracker
+
+
+def server_config(app: Any, settings: WebApplication) -> uvicorn.Config:
+    """Uvicorn config shared by the single-process runtime and supervised workers."""
+    return uvicorn.Config(
+        app,
+        host=settings.host,
+        port=settings.port,
+        timeout_graceful_shutdown=math.ceil(settings.shutdown.grace_period),
+    )
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    Uvicorn server that closes the admission gate as soon as a shutdown signal
+    arrives.
+
+    Uvicorn only stops listening after the signal; requests that still reach
+    the worker on kept-alive connections are answered 503 with
+    ``Connection: close`` instead of starting work the drain would cut short.
+    """
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        get_inflight_tracker().start_draining()
+        super().handle_exit(sig, frame)
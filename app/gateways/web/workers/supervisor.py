@@ -0,0 +1,262 @@
+import os
+import time
+import signal
+import random
+import socket
+import threading
+import multiprocessing
+from collections import Counter
+from dataclasses import dataclass, field
+from logging import Logger
+from multiprocessing.context import SpawnProcess
+from typing import Dict, List, Optional
+
+import uvicorn
+
+from app.elemental.logging import get_logger
+from app.elemental.settings import WebApplication
+from .server import DrainingServer, server_config
+
+multiprocessing.allow_connection_pickling()
+_spawn = multiprocessing.get_context("spawn")
+
+_logger: Optional[Logger] = None
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def get_supervisor_logger() -> Logger:
+    global _logger
+    if _logger is None:
+        _logger = get_logger("worker_supervisor")
+    return _logger
+
+
+def read_process_rss(pid: int) -> Optional[int]:
+    """
+    Returns the resident set size of a process in bytes.
+
+    Reads /proc on Linux and falls back to psutil when it is installed.
+    Returns None when the RSS cannot be determined.
+    """
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except Exception:
+        return None
+
+
+def _serve_worker(config: uvicorn.Config, sockets: List[socket.socket], request_counter) -> None:
+    """Child process entry point: wires the shared request counter and runs uvicorn."""
+    from ..middlewares.counters import set_request_counter
+
+    config.configure_logging()
+    set_request_counter(request_counter)
+
+    try:
+        DrainingServer(config).run(sockets=sockets)
+    except KeyboardInterrupt:
+        pass
+
+
+@dataclass
+class _Worker:
+    slot: int
+    process: SpawnProcess
+    request_counter: object
+    max_requests: Optional[int]
+    started_at: float = field(default_factory=time.monotonic)
+    retire_deadline: Optional[float] = field(default=None)
+
+    @property
+    def requests(self) -> int:
+        return self.request_counter.value
+
+
+class WorkerSupervisor:
+    """
+    Runs N uvicorn worker processes over a shared socket and recycles them when
+    they cross the configured RSS, request-count or age thresholds.
+
+    Recycling is graceful: a replacement is started first, then the old worker
+    receives SIGTERM so uvicorn stops accepting, drains in-flight requests and
+    runs the lifespan shutdown (the ``close_*`` hooks) before exiting.
+    """
+
+    # Seconds past `shutdown.grace_period` a worker gets to run its close hooks.
+    CLOSE_MARGIN = 10.0
+
+    def __init__(self, settings: WebApplication, app_path: str = "app.gateways.web:app"):
+        self.settings = settings
+        self.workers_settings = settings.workers
+        self.app_path = app_path
+        self.logger = get_supervisor_logger()
+
+        self.recycle_counts: Counter = Counter()
+
+        self._workers: Dict[int, _Worker] = {}
+        self._retiring: List[_Worker] = []
+        self._should_exit = threading.Event()
+        self._config: Optional[uvicorn.Config] = None
+        self._sockets: List[socket.socket] = []
+
+    # --- Lifecycle ---
+
+    @property
+    def kill_timeout(self) -> float:
+        """How long a terminated worker may take to exit: the drain plus time for the close hooks."""
+        return self.settings.shutdown.grace_period + self.CLOSE_MARGIN
+
+    def run(self) -> None:
+        self._config = server_config(self.app_path, self.settings)
+        self._sockets = [self._config.bind_socket()]
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+
+        self.logger.info(
+            f"Starting {self.workers_settings.count} workers "
+            f"(max_rss_mb={self.workers_settings.max_rss_mb}, "
+            f"max_requests={self.workers_settings.max_requests}, "
+            f"max_age_seconds={self.workers_settings.max_age_seconds})"
+        )
+
+        for slot in range(self.workers_settings.count):
+            self._spawn(slot)
+
+        try:
+            while not self._should_exit.wait(self.workers_settings.check_interval):
+                self._reap_retiring()
+                self._check_workers()
+        finally:
+            self._shutdown()
+
+    def _handle_exit(self, sig, _frame) -> None:
+        self.logger.info(f"Received {signal.Signals(sig).name}, stopping workers...")
+        self._should_exit.set()
+
+    def _shutdown(self) -> None:
+        for worker in list(self._workers.values()):
+            self._terminate(worker)
+
+        deadline = self._now() + self.kill_timeout
+        for worker in list(self._workers.values()) + self._retiring:
+            worker.process.join(max(0.0, deadline - self._now()))
+            if worker.process.is_alive():
+                self.logger.warning(f"Worker {worker.process.pid} did not exit in time, killing it.")
+                worker.process.kill()
+                worker.process.join()
+
+        for sock in self._sockets:
+            sock.close()
+
+        self.logger.info(f"Worker supervisor stopped. Recycles: {dict(self.recycle_counts)}")
+
+    # --- Workers ---
+
+    def _spawn(self, slot: int) -> _Worker:
+        request_counter = _spawn.RawValue("Q", 0)
+        process = _spawn.Process(
+            target=_serve_worker,
+            kwargs={
+                "config": self._config,
+                "sockets": self._sockets,
+                "request_counter": request_counter,
+            },
+            name=f"elemental-worker-{slot}",
+        )
+        process.start()
+
+        worker = _Worker(
+            slot=slot,
+            process=process,
+            request_counter=request_counter,
+            max_requests=self._max_requests_for_worker(),
+        )
+        self._workers[slot] = worker
+        self.logger.info(f"Worker {slot} started (pid {process.pid})")
+        return worker
+
+    def _max_requests_for_worker(self) -> Optional[int]:
+        # Jitter keeps workers started together from recycling together.
+        max_requests = self.workers_settings.max_requests
+        if max_requests is None:
+            return None
+        return max_requests + random.randint(0, self.workers_settings.max_requests_jitter)
+
+    def _terminate(self, worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.process.terminate()
+
+    def _check_workers(self) -> None:
+        for slot, worker in list(self._workers.items()):
+            if not worker.process.is_alive():
+                self._record_recycle(worker, "exited", f"exit code {worker.process.exitcode}")
+                self._spawn(slot)
+                continue
+
+            # One draining worker at a time keeps capacity stable during recycles.
+            if self._retiring:
+                continue
+
+            reason = self.recycle_reason(worker)
+            if reason is not None:
+                self._recycle(worker, *reason)
+
+    def recycle_reason(self, worker: _Worker) -> Optional[tuple[str, str]]:
+        """Returns (reason, detail) when the worker crossed a threshold, else None."""
+        max_rss_mb = self.workers_settings.max_rss_mb
+        if max_rss_mb is not None:
+            rss = read_process_rss(worker.process.pid)
+            if rss is not None and rss > max_rss_mb * 1024 * 1024:
+                return "rss", f"rss {rss // (1024 * 1024)}MB > {max_rss_mb}MB"
+
+        if worker.max_requests is not None and worker.requests >= worker.max_requests:
+            return "requests", f"{worker.requests} requests >= {worker.max_requests}"
+
+        max_age = self.workers_settings.max_age_seconds
+        if max_age is not None:
+            age = self._now() - worker.started_at
+            if age >= max_age:
+                return "age", f"age {age:.0f}s >= {max_age:.0f}s"
+
+        return None
+
+    def _recycle(self, worker: _Worker, reason: str, detail: str) -> None:
+        self._record_recycle(worker, reason, detail)
+
+        # Start the replacement before draining the old worker so the slot keeps serving.
+        self._spawn(worker.slot)
+
+        worker.retire_deadline = self._now() + self.kill_timeout
+        self._retiring.append(worker)
+        self._terminate(worker)
+
+    def _reap_retiring(self) -> None:
+        for worker in list(self._retiring):
+            if not worker.process.is_alive():
+                worker.process.join()
+                self._retiring.remove(worker)
+                self.logger.info(f"Worker {worker.process.pid} drained and exited.")
+            elif self._now() > worker.retire_deadline:
+                self.logger.warning(
+                    f"Worker {worker.process.pid} exceeded the graceful timeout, killing it."
+                )
+                worker.process.kill()
+
+    def _record_recycle(self, worker: _Worker, reason: str, detail: str) -> None:
+        self.recycle_counts[reason] += 1
+        self.logger.warning(
+            f"Recycling worker {worker.slot} (pid {worker.process.pid}): {detail} "
+            f"[{reason} recycles: {self.recycle_counts[reason]}]"
+        )
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
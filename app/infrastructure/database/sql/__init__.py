@@ -6,6 +6,7 @@ from .manager import (
 
 from .orm.declarative import DeclarativeBase
 from .orm.mixins import (ElementalAuditMixin,
+                         ElementalCachedMixin,
                          ElementalModelMixin,
                          ElementalReadOnlyMixin,
                          ElementalSoftDeleteMixin,
@@ -13,6 +14,10 @@ from .orm.mixins import (ElementalAuditMixin,
                          ElementalUUIDMixin
                          )
 from .orm.repository import ElementalRepository
+from .orm.pagination import CursorCodec, CursorPage, OffsetPage, init_cursor_codec, get_cursor_codec
+from .orm.counting import CountCache, get_count_cache, estimate_row_count
+from .orm.loader import BatchLoader, get_batch_loader
+from .orm.entity_cache import EntityCache, get_entity_cache
 from .orm.tables import (
     ElementalTable,
     ElementalFullAuditTable,
@@ -20,6 +25,7 @@ from .orm.tables import (
     ElementalTimestampTable,
     ElementalUUIDTable,
 )
+from .instrumentation import QueryStats, get_query_stats, track_queries
 from .settings import DatabaseSettings
 
 __all__ = [
@@ -30,6 +36,7 @@ __all__ = [
     'DeclarativeBase',
 
     'ElementalAuditMixin',
+    'ElementalCachedMixin',
     'ElementalModelMixin',
     'ElementalReadOnlyMixin',
     'ElementalSoftDeleteMixin',
@@ -37,6 +44,18 @@ __all__ = [
     'ElementalUUIDMixin',
 
     'ElementalRepository',
+    'CursorCodec',
+    'CursorPage',
+    'OffsetPage',
+    'CountCache',
+    'get_count_cache',
+    'estimate_row_count',
+    'BatchLoader',
+    'get_batch_loader',
+    'EntityCache',
+    'get_entity_cache',
+    'init_cursor_codec',
+    'get_cursor_codec',
 
     'ElementalTable',
     'ElementalFullAuditTable',
@@ -44,5 +63,9 @@ __all__ = [
     'ElementalTimestampTable',
     'ElementalUUIDTable',
 
+    'QueryStats',
+    'get_query_stats',
+    'track_queries',
+
     'DatabaseSettings'
 ]
\ No newline at end of file
@@ -0,0 +1,193 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import Logger
+from typing import Any, Dict, Iterator, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.elemental.logging import get_logger
+from app.elemental.metrics import get_metrics_registry
+
+# `Connection.info` key of the start times of the statements in flight on it.
+_STARTED_KEY = "elemental_query_started"
+
+# Longest statement text written to the log.
+_MAX_LOGGED_STATEMENT = 1000
+
+_query_stats: ContextVar[Optional["QueryStats"]] = ContextVar("elemental_query_stats", default=None)
+
+
+class QueryStats:
+    """Queries run while serving one request, filled in by `QueryInstrumentation`."""
+
+    __slots__ = ("scope", "count", "duration", "templates", "suspects")
+
+    def __init__(self, scope: Optional[Dict[str, Any]] = None):
+        self.scope = scope
+        self.count = 0
+        self.duration = 0.0
+        # Statement text -> executions; SQLAlchemy statements are already parameterized templates.
+        self.templates: Dict[str, int] = {}
+        self.suspects: Set[str] = set()
+
+    @property
+    def route(self) -> str:
+        if self.scope is None:
+            return "<no request>"
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}".strip()
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being served, or None outside `track_queries`."""
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries(scope: Optional[Dict[str, Any]] = None) -> Iterator[QueryStats]:
+    """Collects the queries run inside the block, including tasks it spawns, into one `QueryStats`."""
+    stats = QueryStats(scope)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+        get_metrics_registry().histogram(
+            "db_queries_per_request",
+            "Database statements executed per request.",
+            buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+        ).observe(stats.count)
+
+
+def _type_names(values) -> str:
+    # Runs of one type are collapsed, so a long IN list stays one short token.
+    names, last, run = [], None, 0
+    for value in values:
+        name = type(value).__name__
+        if name == last:
+            run += 1
+            continue
+        if last is not None:
+            names.append(last if run == 1 else f"{last}*{run}")
+        last, run = name, 1
+    if last is not None:
+        names.append(last if run == 1 else f"{last}*{run}")
+    return ", ".join(names)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describes bound parameters by name and type only, so values never reach the log."""
+    if executemany:
+        batch = list(parameters or ())
+        return f"{len(batch)} x {parameter_shape(batch[0])}" if batch else "[]"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return f"({_type_names(parameters)})"
+    return type(parameters).__name__
+
+
+class QueryInstrumentation:
+    """
+    Times every statement through the engine's cursor events.
+
+    Each statement feeds the ``db_queries_total`` counter and the
+    ``db_query_duration_seconds`` histogram and, inside `track_queries`, the
+    request's `QueryStats`. Statements slower than `slow_threshold` seconds are
+    logged with the route and the shape of their parameters. A statement
+    repeated `n_plus_one_threshold` times in one request is logged once as an
+    N+1 suspect - typically a lazy load or a lookup inside a loop.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.25,
+        n_plus_one_threshold: int = 10,
+        logger: Optional[Logger] = None
+    ):
+        self.slow_threshold = slow_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.logger = logger or get_logger("database")
+
+        registry = get_metrics_registry()
+        self.queries = registry.counter("db_queries_total", "Database statements executed.")
+        self.durations = registry.histogram(
+            "db_query_duration_seconds",
+            "Time spent executing database statements.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+        )
+        self.slow_queries = registry.counter("db_slow_queries_total", "Statements slower than the threshold.")
+        self.n_plus_one = registry.counter("db_n_plus_one_suspects_total", "Statements repeated within one request.")
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def uninstall(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    def _handle_error(self, exception_context) -> None:
+        # A failed statement never reaches after_cursor_execute; drop its start time.
+        conn = exception_context.connection
+        if conn is not None and exception_context.cursor is not None:
+            started = conn.info.get(_STARTED_KEY)
+            if started:
+                started.pop()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get(_STARTED_KEY)
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+
+        self.queries.inc()
+        self.durations.observe(elapsed)
+
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+            seen = stats.templates[statement] = stats.templates.get(statement, 0) + 1
+            if seen == self.n_plus_one_threshold and statement not in stats.suspects:
+                stats.suspects.add(statement)
+                self.n_plus_one.inc(route=stats.route)
+                self.logger.warning(
+                    f"Possible N+1 on {stats.route}: statement executed {seen} times in one request: "
+                    f"{statement[:_MAX_LOGGED_STATEMENT]}"
+                )
+
+        if elapsed >= self.slow_threshold:
+            route = stats.route if stats is not None else "<no request>"
+            self.slow_queries.inc(route=route)
+            self.logger.warning(
+                f"Slow query ({elapsed * 1000:.1f}ms) on {route}: {statement[:_MAX_LOGGED_STATEMENT]} "
+                f"params={parameter_shape(parameters, executemany)}"
+            )
+
+
+_instrumentation: Optional[QueryInstrumentation] = None
+
+
+def get_query_instrumentation() -> Optional[QueryInstrumentation]:
+    return _instrumentation
+
+
+def install_query_instrumentation(
+    engine: Engine,
+    slow_threshold: float = 0.25,
+    n_plus_one_threshold: int = 10
+) -> QueryInstrumentation:
+    """Instruments `engine` (the sync engine behind an AsyncEngine) and makes it the process-wide instance."""
+    global _instrumentation
+    _instrumentation = QueryInstrumentation(slow_threshold, n_plus_one_threshold)
+    _instrumentation.install(engine)
+    return _instrumentation
@@ -9,6 +9,9 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.elemental.logging import get_logger
 
 from .settings import DatabaseSettings
+from .orm.pagination import get_cursor_codec, init_cursor_codec
+from .orm.entity_cache import init_entity_cache
+from .instrumentation import install_query_instrumentation
 from .exceptions import (
     DatabaseError,
     DatabaseConnectionError,
@@ -98,12 +101,25 @@ async def init_database(settings: DatabaseSettings) -> None:
             **pool_kwargs
         )
 
+        install_query_instrumentation(
+            _engine.sync_engine,
+            slow_threshold=settings.slow_query_threshold,
+            n_plus_one_threshold=settings.n_plus_one_threshold
+        )
+
         _session_factory = async_sessionmaker(
             _engine,
             expire_on_commit=False,
             class_=AsyncSession
         )
 
+        if settings.cursor_secret is not None:
+            init_cursor_codec(settings.cursor_secret.get_secret_value())
+        else:
+            # Resolved now so a missing key fails at startup, not on the first paginated request.
+            get_cursor_codec()
+        init_entity_cache(settings.entity_cache_max_bytes)
+
         # Immediate health check
         await test_database_connection()
 
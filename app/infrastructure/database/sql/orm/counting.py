@@ -0,0 +1,92 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CountCache:
+    """
+    Short-lived totals of list queries, keyed by table and filter.
+
+    Totals shown next to a page do not need to be exact to the row, but
+    counting is the most expensive part of a listing on a large table. Each
+    entry lives `ttl` seconds; writes through a repository drop every entry of
+    their table in that worker.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, int, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, table: str, key: Hashable) -> Optional[Tuple[int, bool]]:
+        """Returns ``(total, estimated)`` or None."""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[(table, key)]
+                return None
+            self._entries.move_to_end((table, key))
+            return entry[1], entry[2]
+
+    def put(self, table: str, key: Hashable, total: int, ttl: float, estimated: bool = False) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(table, key)] = (time.monotonic() + ttl, total, estimated)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_count_cache = CountCache()
+
+
+def get_count_cache() -> CountCache:
+    return _count_cache
+
+
+async def estimate_row_count(session: AsyncSession, table: str) -> Optional[int]:
+    """
+    Row count of `table` from planner statistics, or None when the dialect
+    keeps none or the table was never analyzed.
+
+    PostgreSQL: ``pg_class.reltuples`` (kept by autovacuum / ANALYZE).
+    SQLite: the leading number of ``sqlite_stat1.stat`` (kept by ANALYZE).
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table}
+        )
+        estimate = result.scalar()
+        # -1 means "never vacuumed or analyzed" since PostgreSQL 14.
+        return int(estimate) if estimate is not None and estimate >= 0 else None
+
+    if dialect == "sqlite":
+        # sqlite_stat1 only exists after the first ANALYZE.
+        exists = await session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        )
+        if exists.scalar() is None:
+            return None
+        result = await session.execute(text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table"), {"table": table})
+        counts = [int(stat.split(" ", 1)[0]) for stat in result.scalars().all() if stat]
+        return max(counts) if counts else None
+
+    return None
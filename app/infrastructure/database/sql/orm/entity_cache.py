@@ -0,0 +1,226 @@
+import sys
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.elemental.metrics import get_metrics_registry
+
+from .declarative import ElementalSQLBase
+
+# `Session.info` key collecting the cache keys written by the current transaction.
+_WRITTEN_KEY = "elemental_entity_cache_written"
+# `Session.info` flag set once the current transaction ran an INSERT/UPDATE/DELETE statement.
+_STATEMENT_WRITE_KEY = "elemental_entity_cache_statement_write"
+
+CacheKey = Tuple[str, Any]
+
+
+def cache_ttl(model: Type[ElementalSQLBase]) -> float:
+    """Seconds `model` rows may be cached for; 0 when the model did not opt in."""
+    return getattr(model, "__cache_ttl__", 0.0) or 0.0
+
+
+def _size(values: Optional[tuple]) -> int:
+    if values is None:
+        return sys.getsizeof(None)
+    return sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+
+
+class EntityCache:
+    """
+    Process-wide cache of rows fetched by primary key, for models that opt in
+    with ``__cache_ttl__`` (see `ElementalCachedMixin`).
+
+    Entries hold the column values as a plain tuple - never ORM instances, so
+    nothing is shared between sessions - and a missing id is cached as None
+    for ``__cache_negative_ttl__`` seconds. The LRU is bounded by the
+    estimated size of the stored values rather than by entry count.
+
+    Writes flushed by any session drop their rows' entries when that session
+    commits; bulk statements are invalidated by the repository. Other workers
+    see a change once their entry expires.
+
+    A fill is bracketed by `begin_fill` and `put`: an invalidation of the key
+    in between wins, so a reader that loaded a row before a concurrent commit
+    cannot cache the old version after the commit invalidated it.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Optional[tuple], int]]" = OrderedDict()
+        self._columns: Dict[type, Tuple[str, ...]] = {}
+        # Key -> token of the fill in progress; invalidations drop it.
+        self._filling: Dict[CacheKey, object] = {}
+        self._lock = threading.Lock()
+
+        registry = get_metrics_registry()
+        self.lookups = registry.counter("entity_cache_lookups_total", "Entity cache lookups by model and result.")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def columns(self, model: Type[ElementalSQLBase]) -> Tuple[str, ...]:
+        keys = self._columns.get(model)
+        if keys is None:
+            keys = self._columns[model] = tuple(attr.key for attr in inspect(model).column_attrs)
+        return keys
+
+    def get(self, model: Type[ElementalSQLBase], object_id: Any) -> Tuple[bool, Optional[tuple]]:
+        """Returns ``(found, values)``; ``(True, None)`` is a cached miss."""
+        key = (model.__tablename__, object_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._discard(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        self.lookups.inc(model=model.__tablename__, result="hit" if entry is not None else "miss")
+        return (True, entry[1]) if entry is not None else (False, None)
+
+    def begin_fill(self, model: Type[ElementalSQLBase], object_id: Any) -> object:
+        """Marks a load of `object_id` as started; pass the token to `put` or `cancel_fill`."""
+        token = object()
+        with self._lock:
+            self._filling[(model.__tablename__, object_id)] = token
+        return token
+
+    def cancel_fill(self, model: Type[ElementalSQLBase], object_id: Any, fill: object) -> None:
+        key = (model.__tablename__, object_id)
+        with self._lock:
+            if self._filling.get(key) is fill:
+                del self._filling[key]
+
+    def put(
+        self,
+        model: Type[ElementalSQLBase],
+        object_id: Any,
+        instance: Optional[ElementalSQLBase],
+        fill: Optional[object] = None
+    ) -> None:
+        """
+        Caches `instance` (None for a missing row). With a `fill` token from
+        `begin_fill`, nothing is stored if the key was invalidated, or another
+        fill started, since then.
+        """
+        key = (model.__tablename__, object_id)
+        values = None
+        if instance is None:
+            ttl = getattr(model, "__cache_negative_ttl__", 0.0) or 0.0
+        else:
+            ttl = cache_ttl(model)
+            loaded = instance.__dict__
+            keys = self.columns(model)
+            # Deferred or expired columns would be cached as missing; skip those rows.
+            if any(key not in loaded for key in keys):
+                ttl = 0
+            else:
+                values = tuple(loaded[key] for key in keys)
+
+        size = _size(values)
+        with self._lock:
+            if fill is not None:
+                if self._filling.get(key) is not fill:
+                    return
+                del self._filling[key]
+            if ttl <= 0:
+                return
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + ttl, values, size)
+            self.size += size
+            while self.size > self.max_bytes and self._entries:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def invalidate(self, table: str, object_id: Any) -> None:
+        with self._lock:
+            self._discard((table, object_id))
+            self._filling.pop((table, object_id), None)
+
+    def invalidate_table(self, table: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table]:
+                self._discard(key)
+            for key in [key for key in self._filling if key[0] == table]:
+                del self._filling[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._filling.clear()
+            self.size = 0
+
+    def instance(self, session, model: Type[ElementalSQLBase], values: tuple) -> ElementalSQLBase:
+        """Builds a persistent instance in `session` from cached values, without SQL."""
+        instance = inspect(model).class_manager.new_instance()
+        for key, value in zip(self.columns(model), values):
+            set_committed_value(instance, key, value)
+        make_transient_to_detached(instance)
+        session.add(instance)
+        return instance
+
+
+_cache = EntityCache()
+
+
+def get_entity_cache() -> EntityCache:
+    return _cache
+
+
+def init_entity_cache(max_bytes: int) -> EntityCache:
+    global _cache
+    _cache = EntityCache(max_bytes=max_bytes)
+    return _cache
+
+
+def has_pending_writes(session: Session) -> bool:
+    """True while `session` holds unflushed changes or a transaction that already wrote."""
+    return bool(
+        session.new or session.dirty or session.deleted
+        or session.info.get(_WRITTEN_KEY) or session.info.get(_STATEMENT_WRITE_KEY)
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(state: ORMExecuteState) -> None:
+    # Statements bypass the unit of work, so `after_flush` never sees them.
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_STATEMENT_WRITE_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written(session: Session, _) -> None:
+    written = None
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if cache_ttl(type(instance)) <= 0:
+            continue
+        # New rows have no identity key until the flush finishes; read the primary key instead.
+        identity = inspect(type(instance)).primary_key_from_instance(instance)
+        if written is None:
+            written = session.info.setdefault(_WRITTEN_KEY, set())
+        written.add((type(instance).__tablename__, identity[0] if len(identity) == 1 else identity))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written(session: Session) -> None:
+    written = session.info.pop(_WRITTEN_KEY, None)
+    if written:
+        for table, object_id in written:
+            _cache.invalidate(table, object_id)
+    session.info.pop(_STATEMENT_WRITE_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_written(session: Session, _) -> None:
+    session.info.pop(_WRITTEN_KEY, None)
+    session.info.pop(_STATEMENT_WRITE_KEY, None)
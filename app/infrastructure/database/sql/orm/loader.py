@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .declarative import ElementalSQLBase
+
+# Key of the per-model loaders in `AsyncSession.info`.
+_SESSION_KEY = "elemental_batch_loaders"
+
+
+class BatchLoader:
+    """
+    Coalesces lookups by id for one model within one session.
+
+    Every `load(id)` made while the event loop runs the current batch of
+    callbacks - e.g. from coroutines started together with `asyncio.gather` -
+    is collected and resolved by a single ``SELECT ... WHERE id IN (...)``
+    scheduled with `call_soon`. Ids are de-duplicated, and results (including
+    misses) are memoized for the life of the loader, which is the life of
+    the request's session. Repository writes on the model clear it.
+    """
+
+    def __init__(self, session: AsyncSession, model: Type[ElementalSQLBase], max_batch: int = 500):
+        self.session = session
+        self.model = model
+        self.max_batch = max_batch
+
+        self._futures: Dict[Any, asyncio.Future] = {}
+        self._queue: List[Tuple[Any, asyncio.Future]] = []
+        self._scheduled = False
+        self._tasks: set = set()
+
+    def load(self, object_id: Any) -> "asyncio.Future[Optional[ElementalSQLBase]]":
+        """Returns an awaitable of the record with `object_id` (None when missing)."""
+        future = self._futures.get(object_id)
+        if future is not None:
+            # Shielded, so one cancelled caller does not cancel the shared result.
+            return asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = self._futures[object_id] = loop.create_future()
+        self._queue.append((object_id, future))
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return asyncio.shield(future)
+
+    async def load_many(self, object_ids: Iterable[Any]) -> List[Optional[ElementalSQLBase]]:
+        return list(await asyncio.gather(*(self.load(object_id) for object_id in object_ids)))
+
+    def prime(self, object_id: Any, instance: Optional[ElementalSQLBase]) -> None:
+        """Seeds the memo with an already loaded record."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(instance)
+        self._futures[object_id] = future
+
+    def clear(self, object_id: Any = None) -> None:
+        if object_id is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(object_id, None)
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        queue, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._fetch(queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, queue: List[Tuple[Any, asyncio.Future]]) -> None:
+        # Chunks run one after another: a session cannot execute concurrently.
+        for start in range(0, len(queue), self.max_batch):
+            batch = queue[start:start + self.max_batch]
+            try:
+                stmt = select(self.model).where(self.model.id.in_([object_id for object_id, _ in batch]))
+                result = await self.session.execute(stmt)
+                found = {instance.id: instance for instance in result.scalars().all()}
+            except Exception as e:
+                for object_id, future in batch:
+                    # Failures are not memoized, so a later load retries.
+                    if self._futures.get(object_id) is future:
+                        del self._futures[object_id]
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for object_id, future in batch:
+                if not future.done():
+                    future.set_result(found.get(object_id))
+
+
+def get_batch_loader(session: AsyncSession, model: Type[ElementalSQLBase]) -> BatchLoader:
+    """The loader of `model` bound to `session`, created on first use."""
+    loaders = session.info.setdefault(_SESSION_KEY, {})
+    loader = loaders.get(model)
+    if loader is None:
+        loader = loaders[model] = BatchLoader(session, model)
+    return loader
+
+
+def clear_batch_loader(session: AsyncSession, model: Type[ElementalSQLBase]) -> None:
+    loader = session.info.get(_SESSION_KEY, {}).get(model)
+    if loader is not None:
+        loader.clear()
@@ -134,3 +134,14 @@ class ElementalReadOnlyMixin:
     def delete(self):
         raise NotImplementedError("This model is read-only")
 
+
+class ElementalCachedMixin:
+    """
+    Opts a model into the process-wide entity cache used by
+    `ElementalRepository._get_by_id`. Suited to rows read far more often than
+    they change; other workers may serve a stale row for up to the TTL.
+    """
+    # Seconds a fetched row is reused for.
+    __cache_ttl__: float = 60.0
+    # Seconds an id known to be missing is reused for; 0 disables negative caching.
+    __cache_negative_ttl__: float = 5.0
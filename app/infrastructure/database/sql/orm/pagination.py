@@ -0,0 +1,184 @@
+import hmac
+import json
+import base64
+import hashlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, Sequence, TypeVar, Union
+
+from app.elemental.exceptions import ConfigurationError, ValidationError
+
+T = TypeVar("T")
+
+# Domain-separation label for the cursor key derived from `jwt.secret_key`.
+_CURSOR_KEY_LABEL = b"elemental-cursor"
+
+NEXT = "next"
+PREVIOUS = "prev"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _encode_value(value: Any) -> Any:
+    # Key values are tagged so they round-trip with their type and compare correctly in SQL.
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+class CursorCodec:
+    """
+    Opaque, tamper-proof pagination cursors.
+
+    A cursor carries the sort key of the row it points at, the direction to
+    read in and a scope (table and key columns), signed with HMAC-SHA256.
+    Clients cannot forge a position or reuse a cursor on another listing.
+    """
+
+    __slots__ = ("_secret",)
+
+    def __init__(self, secret: Union[str, bytes]):
+        self._secret = secret.encode() if isinstance(secret, str) else secret
+
+    def _signature(self, body: bytes) -> bytes:
+        return hmac.new(self._secret, body, hashlib.sha256).digest()[:16]
+
+    def encode(self, scope: str, direction: str, values: Sequence[Any]) -> str:
+        body = json.dumps(
+            [scope, direction, [_encode_value(value) for value in values]],
+            separators=(",", ":")
+        ).encode()
+        return f"{_b64encode(body)}.{_b64encode(self._signature(body))}"
+
+    def decode(self, scope: str, cursor: str) -> tuple:
+        """Returns ``(direction, values)``. Raises ValidationError for foreign or tampered cursors."""
+        try:
+            body_part, signature_part = cursor.split(".")
+            body = _b64decode(body_part)
+            if not hmac.compare_digest(self._signature(body), _b64decode(signature_part)):
+                raise ValueError("bad signature")
+            cursor_scope, direction, values = json.loads(body)
+        except (ValueError, TypeError):
+            raise ValidationError(message="Invalid pagination cursor.", details={"error_type": "invalid_cursor"})
+
+        if cursor_scope != scope or direction not in (NEXT, PREVIOUS):
+            raise ValidationError(message="Invalid pagination cursor.", details={"error_type": "invalid_cursor"})
+        return direction, [_decode_value(value) for value in values]
+
+
+class CursorPage(Generic[T]):
+    """One page of a keyset listing plus the cursors to its neighbours."""
+
+    __slots__ = ("items", "limit", "next_cursor", "prev_cursor")
+
+    def __init__(
+        self,
+        items: List[T],
+        limit: int,
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None
+    ):
+        self.items = items
+        self.limit = limit
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    def meta(self) -> dict:
+        return {
+            "limit": self.limit,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
+            "has_next": self.has_next,
+            "has_prev": self.has_prev,
+        }
+
+
+class OffsetPage(Generic[T]):
+    """One numbered page and, when it was counted, the total of matching rows."""
+
+    __slots__ = ("items", "page", "page_size", "total", "estimated")
+
+    def __init__(
+        self,
+        items: List[T],
+        page: int,
+        page_size: int,
+        total: Optional[int] = None,
+        estimated: bool = False
+    ):
+        self.items = items
+        self.page = page
+        self.page_size = page_size
+        self.total = total
+        self.estimated = estimated
+
+    @property
+    def pages(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return (self.total + self.page_size - 1) // self.page_size
+
+    def meta(self) -> dict:
+        return {
+            "page": self.page,
+            "page_size": self.page_size,
+            "total": self.total,
+            "pages": self.pages,
+            "estimated": self.estimated,
+        }
+
+
+_codec: Optional[CursorCodec] = None
+
+
+def init_cursor_codec(secret: Union[str, bytes]) -> CursorCodec:
+    global _codec
+    _codec = CursorCodec(secret)
+    return _codec
+
+
+def derive_cursor_secret(secret: Union[str, bytes]) -> bytes:
+    """Cursor key derived from another secret, so cursors and access tokens never share a MAC key."""
+    secret = secret.encode() if isinstance(secret, str) else secret
+    return hmac.new(secret, _CURSOR_KEY_LABEL, hashlib.sha256).digest()
+
+
+def get_cursor_codec() -> CursorCodec:
+    """The process-wide codec; defaults to a key derived from `jwt.secret_key`."""
+    if _codec is None:
+        from app.elemental.settings import get_settings
+
+        secret = get_settings().jwt.secret_key
+        if secret is None:
+            raise ConfigurationError("Cursor pagination needs database.cursor_secret (or jwt.secret_key) to be set.")
+        return init_cursor_codec(derive_cursor_secret(secret.get_secret_value()))
+    return _codec
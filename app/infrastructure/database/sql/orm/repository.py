@@ -1,19 +1,87 @@
-from typing import Any, Optional, List, Type
-from sqlalchemy import and_
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, List, Sequence, Type, Union
+from sqlalchemy import UniqueConstraint, and_, delete, exists, func, insert, inspect, tuple_, update
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import InstanceState
 
 from ..exceptions import DatabaseError
 from .declarative import ElementalSQLBase
-from app.elemental.exceptions import DuplicateError, ConflictError, ValidationError
+from .counting import estimate_row_count, get_count_cache
+from .loader import BatchLoader, clear_batch_loader, get_batch_loader
+from .entity_cache import cache_ttl, get_entity_cache, has_pending_writes
+from .pagination import NEXT, PREVIOUS, CursorPage, OffsetPage, get_cursor_codec
+from app.elemental.exceptions import (
+    DuplicateError,
+    ConflictError,
+    ConfigurationError,
+    NotFoundError,
+    ValidationError
+)
+from app.elemental.security.policies import Policy, CompiledPolicy
+from app.elemental.security.principals import invalidate_principal
 
 
 class ElementalRepository:
-    def __init__(self, model: Type[ElementalSQLBase], session: AsyncSession):
+    # Authorization rules for this repository's model; subclasses set it or pass one in.
+    policy: Optional[Policy] = None
+    # Attribute holding the token `sub` when this repository writes the user model;
+    # its writes then drop the cached account state of that principal.
+    principal_key: Optional[str] = None
+    # Rows per statement in the `_bulk_*` methods.
+    bulk_chunk_size: int = 1000
+    # Indexed, unique-together columns that order `_get_page` listings.
+    cursor_columns: Sequence[str] = ("created_at", "id")
+    # Seconds a listing total is reused for the same filter; 0 disables the cache.
+    count_cache_ttl: float = 5.0
+    # Rows fetched from the cursor at a time by `_stream`.
+    stream_batch_size: int = 500
+
+    def __init__(
+        self,
+        model: Type[ElementalSQLBase],
+        session: AsyncSession,
+        policy: Optional[Policy] = None
+    ):
         self.model = model
         self.session = session
 
+        policy = policy or self.policy
+        self._policy: Optional[CompiledPolicy] = policy.compile(model) if policy else None
+
+    def _authorized(self, stmt, principal: Optional[dict], action: str):
+        """Adds the policy's WHERE condition for `principal`; unchanged without principal or policy."""
+        if principal is None or self._policy is None:
+            return stmt
+        return stmt.where(self._policy.filter(action, principal))
+
+    def _authorize(self, action: str, principal: Optional[dict], instance: ElementalSQLBase) -> ElementalSQLBase:
+        """Checks a loaded instance against the policy. Raises ForbiddenError."""
+        if principal is None or self._policy is None:
+            return instance
+        return self._policy.authorize(action, principal, instance)
+
+    def _after_write(self, rows: Iterable[Any]) -> None:
+        """Drops cached totals of this table and the cached entities and principals of the written rows."""
+        get_count_cache().invalidate(self.model.__tablename__)
+        clear_batch_loader(self.session, self.model)
+        cached = cache_ttl(self.model) > 0
+        if not cached and self.principal_key is None:
+            return
+        for row in rows:
+            if cached:
+                get_entity_cache().invalidate(self.model.__tablename__, self._row_value(row, "id"))
+            if self.principal_key is not None:
+                value = self._row_value(row, self.principal_key)
+                if value is not None:
+                    invalidate_principal(str(value))
+
+    @staticmethod
+    def _row_value(row: Any, key: str) -> Any:
+        return row.get(key) if isinstance(row, dict) else getattr(row, key, None)
+
     async def _check_uniqueness(self, existing_id: Optional[Any], field: str, value: Any) -> bool:
         """Checks if a unique field value already exists for another record."""
         column = getattr(self.model, field)
@@ -22,9 +90,10 @@ class ElementalRepository:
         if existing_id is not None:
             conditions.append(self.model.id != existing_id)
 
-        stmt = select(self.model).where(and_(*conditions)).limit(1)
+        # EXISTS on the indexed column: no row is loaded or hydrated.
+        stmt = select(exists().where(and_(*conditions)))
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is None
+        return not result.scalar()
 
     async def _select_one(self, **query) -> Optional[ElementalSQLBase]:
         """Generic filter_by one record."""
@@ -32,42 +101,110 @@ class ElementalRepository:
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def _get_by_id(self, object_id: Any) -> Optional[ElementalSQLBase]:
-        """Get record by primary key."""
-        return await self.session.get(self.model, object_id)
+    async def _get_by_id(
+        self,
+        object_id: Any,
+        principal: Optional[dict] = None,
+        action: str = "read"
+    ) -> Optional[ElementalSQLBase]:
+        """
+        Get record by primary key. With a principal, records it may not
+        `action` are filtered out in SQL and read as missing.
 
-    async def _create(self, instance: ElementalSQLBase) -> ElementalSQLBase:
-        """Add and commit a new record."""
+        Models with ``__cache_ttl__`` are served from the entity cache when
+        the session holds no writes of its own; see `EntityCache`.
+        """
+        if principal is None or self._policy is None:
+            if cache_ttl(self.model) > 0:
+                return await self._get_cached(object_id)
+            return await self.session.get(self.model, object_id)
+
+        stmt = self._authorized(select(self.model).where(self.model.id == object_id), principal, action)
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def _get_cached(self, object_id: Any) -> Optional[ElementalSQLBase]:
+        instance = self.session.identity_map.get(inspect(self.model).identity_key_from_primary_key((object_id,)))
+        if instance is not None or has_pending_writes(self.session):
+            return await self.session.get(self.model, object_id)
+
+        cache = get_entity_cache()
+        found, values = cache.get(self.model, object_id)
+        if found:
+            return None if values is None else cache.instance(self.session, self.model, values)
+
+        fill = cache.begin_fill(self.model, object_id)
         try:
-            self.session.add(instance)
-            await self._commit()
+            instance = await self.session.get(self.model, object_id)
+        except BaseException:
+            cache.cancel_fill(self.model, object_id, fill)
+            raise
+        cache.put(self.model, object_id, instance, fill)
+        return instance
 
+    async def _load_expired(self, instance: ElementalSQLBase) -> None:
+        """
+        Loads server-generated values the write itself did not return. With
+        RETURNING (PostgreSQL, SQLite >= 3.35) INSERTs already bring them back
+        and nothing is expired; other dialects, and server-side `onupdate`
+        values of a flushed UPDATE, cost one SELECT of just those columns.
+        """
+        expired = inspect(instance).expired_attributes
+        if expired:
             try:
-                await self.session.refresh(instance)
+                await self.session.refresh(instance, attribute_names=list(expired))
             except Exception:
                 pass
 
-            return instance
-        except IntegrityError as e:
-            error_msg = str(e.orig).lower()
-
-            if "not null" in error_msg:
-                raise ValidationError(
-                    message="A required field is missing.",
-                    details={"error_type": "missing_required_field"}
-                )
+    @staticmethod
+    def _create_error(e: IntegrityError) -> Exception:
+        error_msg = str(e.orig).lower()
 
-            if "unique" in error_msg or "duplicate" in error_msg:
-                raise DuplicateError(
-                    message="A record with this information already exists.",
-                    details={"error_type": "unique_violation"}
-                )
+        if "not null" in error_msg:
+            return ValidationError(
+                message="A required field is missing.",
+                details={"error_type": "missing_required_field"}
+            )
 
-            raise ValidationError(
-                message="Data integrity violation.",
-                details={"error_type": "integrity_error"}
+        if "unique" in error_msg or "duplicate" in error_msg:
+            return DuplicateError(
+                message="A record with this information already exists.",
+                details={"error_type": "unique_violation"}
             )
 
+        return ValidationError(
+            message="Data integrity violation.",
+            details={"error_type": "integrity_error"}
+        )
+
+    @property
+    def _loader(self) -> BatchLoader:
+        return get_batch_loader(self.session, self.model)
+
+    async def _load(self, object_id: Any) -> Optional[ElementalSQLBase]:
+        """
+        Like `_get_by_id`, but lookups made concurrently on this session are
+        batched into one ``WHERE id IN (...)`` query and memoized for the
+        session's lifetime. Policies are not applied.
+        """
+        return await self._loader.load(object_id)
+
+    async def _load_many(self, object_ids: Iterable[Any]) -> List[Optional[ElementalSQLBase]]:
+        """Records for `object_ids` in order (None for missing ones), in one query."""
+        return await self._loader.load_many(object_ids)
+
+    async def _create(self, instance: ElementalSQLBase) -> ElementalSQLBase:
+        """Add and commit a new record: a single INSERT ... RETURNING where supported."""
+        try:
+            self.session.add(instance)
+            await self._commit()
+            self._after_write((instance,))
+            await self._load_expired(instance)
+
+            return instance
+        except IntegrityError as e:
+            raise self._create_error(e)
+
         except SQLAlchemyError:
             raise DatabaseError(
                 message="Error saving new instance",
@@ -75,23 +212,38 @@ class ElementalRepository:
             )
 
     async def _update(self, instance: ElementalSQLBase) -> ElementalSQLBase:
-        """Commit changes to an existing record safely."""
+        """
+        Commit changes to an existing record safely.
+
+        An instance attached to this session is flushed as usual. A detached
+        instance (loaded by another session) whose relationships are unchanged
+        is written with `_update_fields` from the columns changed on it,
+        without loading the row first; NotFoundError if the row is gone.
+        Anything else - a transient instance built by hand, or a detached one
+        with changed relationships - goes through ``session.merge()``, which
+        loads the row, cascades relationships and inserts when it is missing.
+        """
+        state = inspect(instance)
+        if instance not in self.session and state.detached and not self._relationships_changed(state):
+            values = self._changed_values(instance)
+            if not values:
+                return instance
+
+            updated = await self._update_fields(state.identity[0], values)
+            if updated is None:
+                raise NotFoundError(message="Record to update does not exist.")
+            return updated
+
         try:
-            instance = await self.session.merge(instance)
+            if instance not in self.session:
+                instance = await self.session.merge(instance)
             await self._commit()
-
-            try:
-                await self.session.refresh(instance)
-            except Exception:
-                pass
+            self._after_write((instance,))
+            await self._load_expired(instance)
 
             return instance
         except IntegrityError as e:
-            # Handle integrity errors during update (e.g., changing email to an existing one)
-            error_msg = str(e.orig).lower()
-            if "unique" in error_msg or "duplicate" in error_msg:
-                raise DuplicateError(message="Conflict with existing data.", details={"error_type": "unique_violation"})
-            raise ValidationError(message="Update failed due to integrity violation.")
+            raise self._update_error(e)
 
         except SQLAlchemyError:
             raise DatabaseError(
@@ -99,27 +251,223 @@ class ElementalRepository:
                 details={"error_type": "internal_db_error"}
             )
 
-    async def _delete(self, instance: ElementalSQLBase) -> None:
-        """Delete and commit."""
+    @staticmethod
+    def _update_error(e: IntegrityError) -> Exception:
+        # Handle integrity errors during update (e.g., changing email to an existing one)
+        error_msg = str(e.orig).lower()
+        if "unique" in error_msg or "duplicate" in error_msg:
+            return DuplicateError(message="Conflict with existing data.", details={"error_type": "unique_violation"})
+        return ValidationError(message="Update failed due to integrity violation.")
+
+    async def _update_fields(
+        self,
+        object_id: Any,
+        values: Dict[str, Any],
+        principal: Optional[dict] = None,
+        action: str = "update"
+    ) -> Optional[ElementalSQLBase]:
+        """
+        Partial update by primary key without loading the row: one
+        ``UPDATE ... SET <values> WHERE id = :id RETURNING *``. Dialects without
+        UPDATE RETURNING read the row back by primary key afterwards.
+
+        Returns the updated record, or None when no row matched (including rows
+        `principal` may not `action`).
+        """
+        if not values:
+            raise ValidationError(message="Nothing to update.")
+
+        stmt = self._authorized(update(self.model).where(self.model.id == object_id), principal, action)
+        stmt = stmt.values(**values)
         try:
-            if instance not in self.session:
-                instance = await self.session.merge(instance)
+            if self.session.get_bind().dialect.update_returning:
+                result = await self.session.execute(stmt.returning(self.model))
+                instance = result.scalars().first()
+            else:
+                result = await self.session.execute(stmt)
+                instance = None
+                if result.rowcount:
+                    instance = await self.session.get(self.model, object_id, populate_existing=True)
+            await self._commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise self._update_error(e)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise DatabaseError(
+                message="Error updating instance",
+                details={"error_type": "internal_db_error"}
+            )
+
+        if instance is not None:
+            self._after_write((instance,))
+        return instance
+
+    def _conflict_target(self, values: Dict[str, Any], conflict_on: Optional[Sequence[str]]) -> List[str]:
+        """
+        Columns of the unique constraint an upsert resolves on: `conflict_on`
+        when given, otherwise the first unique constraint or unique index whose
+        columns are all present in `values`, with the primary key as a last resort.
+        """
+        if conflict_on:
+            return list(conflict_on)
+
+        table = self.model.__table__
+        candidates = [
+            [column.key for column in constraint.columns]
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        candidates += [[column.key for column in index.columns] for index in table.indexes if index.unique]
+        candidates.append([column.key for column in table.primary_key.columns])
+
+        for columns in candidates:
+            if columns and all(column in values for column in columns):
+                return columns
+        raise ValidationError(
+            message="No unique constraint of this model is covered by the given values.",
+            details={"error_type": "no_conflict_target"}
+        )
+
+    def _dialect_insert(self):
+        name = self.session.get_bind().dialect.name
+        if name == "postgresql":
+            return postgresql.insert(self.model)
+        if name == "sqlite":
+            return sqlite.insert(self.model)
+        raise ConfigurationError(f"Upserts are not supported on the '{name}' dialect.")
 
+    async def _execute_insert(self, stmt) -> Optional[ElementalSQLBase]:
+        stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+        try:
+            result = await self.session.execute(stmt)
+            instance = result.scalars().first()
+            await self._commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            # Conflicts on the target are resolved in SQL; anything left is another constraint.
+            raise self._create_error(e)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise DatabaseError(
+                message="Error saving instance",
+                details={"error_type": "internal_db_error"}
+            )
+
+        if instance is not None:
+            self._after_write((instance,))
+        return instance
+
+    async def _upsert(
+        self,
+        row: Union[dict, ElementalSQLBase],
+        conflict_on: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None
+    ) -> ElementalSQLBase:
+        """
+        Inserts `row` or, when it collides on a unique constraint, updates the
+        existing record - atomically, in one ``INSERT ... ON CONFLICT DO UPDATE
+        ... RETURNING`` (PostgreSQL, SQLite).
+
+        `update_fields` limits which columns are overwritten on conflict; by
+        default every given column except the conflict target and the primary
+        key. Columns with an SQL `onupdate` (e.g. `updated_at`) are refreshed too.
+        """
+        values = self._row_values(row)
+        target = self._conflict_target(values, conflict_on)
+        stmt = self._dialect_insert().values(**values)
+
+        primary_keys = {column.key for column in self.model.__table__.primary_key.columns}
+        fields = update_fields if update_fields is not None else [
+            key for key in values if key not in target and key not in primary_keys
+        ]
+        set_ = {key: stmt.excluded[key] for key in fields}
+        for column in self.model.__table__.columns:
+            onupdate = column.onupdate
+            if column.key not in set_ and onupdate is not None and isinstance(getattr(onupdate, "arg", None), ClauseElement):
+                set_[column.key] = onupdate.arg
+
+        if set_:
+            stmt = stmt.on_conflict_do_update(index_elements=target, set_=set_)
+        else:
+            # Nothing to overwrite: still return the existing row.
+            stmt = stmt.on_conflict_do_update(index_elements=target, set_={target[0]: stmt.excluded[target[0]]})
+        return await self._execute_insert(stmt)
+
+    async def _insert_ignore(
+        self,
+        row: Union[dict, ElementalSQLBase],
+        conflict_on: Optional[Sequence[str]] = None
+    ) -> Optional[ElementalSQLBase]:
+        """
+        Inserts `row` unless it collides on a unique constraint, in one
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING``. Returns the created
+        record, or None when it already existed - replacing a
+        `_check_uniqueness` probe followed by `_create`, without the race.
+        """
+        values = self._row_values(row)
+        target = self._conflict_target(values, conflict_on)
+        stmt = self._dialect_insert().values(**values).on_conflict_do_nothing(index_elements=target)
+        return await self._execute_insert(stmt)
+
+    async def _delete(self, instance: ElementalSQLBase) -> None:
+        """
+        Delete and commit. An instance that is not attached to this session is
+        deleted by primary key directly, without loading it first.
+        """
+        if instance not in self.session:
+            await self._delete_by_id(instance.id)
+            self._after_write((instance,))
+            return
+
+        try:
             await self.session.delete(instance)
             await self._commit()
+            self._after_write((instance,))
         except SQLAlchemyError:
             raise ConflictError(
                 message="Could not delete: instance is in use or invalid state",
                 details={"error_type": "delete_conflict"}
             )
 
-    async def _get_all(self, page: int = 1, page_size: int = 10) -> List[ElementalSQLBase]:
-        """Paginated fetch."""
+    async def _delete_by_id(
+        self,
+        object_id: Any,
+        principal: Optional[dict] = None,
+        action: str = "delete"
+    ) -> bool:
+        """
+        ``DELETE ... WHERE id = :id`` in one statement. ORM-level cascades do not
+        run; rely on the foreign keys' ON DELETE rules. Returns whether a row
+        was deleted.
+        """
+        stmt = self._authorized(delete(self.model).where(self.model.id == object_id), principal, action)
+        try:
+            result = await self.session.execute(stmt)
+            await self._commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise ConflictError(
+                message="Could not delete: instance is in use or invalid state",
+                details={"error_type": "delete_conflict"}
+            )
+
+        self._after_write(({"id": object_id},))
+        return result.rowcount > 0
+
+    async def _get_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        principal: Optional[dict] = None,
+        action: str = "read"
+    ) -> List[ElementalSQLBase]:
+        """Paginated fetch, restricted in SQL to the rows `principal` may `action`."""
         if page < 1 or page_size < 1:
             raise ValidationError(message="Pagination parameters must be >= 1")
 
         offset = (page - 1) * page_size
-        stmt = select(self.model).offset(offset).limit(page_size)
+        stmt = self._authorized(select(self.model), principal, action).offset(offset).limit(page_size)
 
         try:
             result = await self.session.execute(stmt)
@@ -130,6 +478,343 @@ class ElementalRepository:
                 details={"error_type": "fetch_error"}
             )
 
+    async def _stream(
+        self,
+        principal: Optional[dict] = None,
+        action: str = "read",
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[ElementalSQLBase]:
+        """
+        Yields every matching record without loading the result set at once.
+
+        Rows come from a server-side cursor `batch_size` at a time
+        (``yield_per``), and each batch is expunged from the session once it has
+        been consumed, so memory stays flat however many rows are exported.
+        Keep the session open until iteration ends; the cursor is closed when
+        the iterator is, even if the consumer stops early.
+        """
+        batch_size = batch_size or self.stream_batch_size
+        stmt = self._authorized(select(self.model), principal, action).execution_options(yield_per=batch_size)
+
+        result = None
+        try:
+            result = await self.session.stream(stmt)
+            async for partition in result.scalars().partitions():
+                for instance in partition:
+                    yield instance
+                for instance in partition:
+                    self.session.expunge(instance)
+        except SQLAlchemyError:
+            raise DatabaseError(
+                message="Error streaming records",
+                details={"error_type": "fetch_error"}
+            )
+        finally:
+            if result is not None:
+                await result.close()
+
+    async def _get_page_with_total(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        principal: Optional[dict] = None,
+        action: str = "read",
+        count: str = "exact"
+    ) -> OffsetPage:
+        """
+        A page of `_get_all` together with the total number of matching rows.
+
+        `count` selects how the total is obtained:
+
+        - ``"exact"``: read from ``count(*) OVER ()`` on the page query itself,
+          so rows and total arrive in one round trip.
+        - ``"estimated"``: taken from planner statistics for unfiltered
+          listings (exact for filtered ones or when no statistics exist).
+        - ``"none"``: no total at all.
+
+        Totals are cached per filter for `count_cache_ttl` seconds; while one
+        is cached the page query runs without the window function.
+        """
+        if page < 1 or page_size < 1:
+            raise ValidationError(message="Pagination parameters must be >= 1")
+        if count not in ("exact", "estimated", "none"):
+            raise ValidationError(message="count must be 'exact', 'estimated' or 'none'")
+
+        table = self.model.__tablename__
+        base = self._authorized(select(self.model), principal, action)
+        offset = (page - 1) * page_size
+        cache = get_count_cache()
+
+        cache_key = None
+        total, estimated = None, False
+        if count != "none":
+            where = base.whereclause
+            if where is not None:
+                compiled = where.compile(dialect=self.session.get_bind().dialect)
+                cache_key = (count, str(compiled), repr(sorted(compiled.params.items())))
+            else:
+                cache_key = (count,)
+            cached = cache.get(table, cache_key)
+            if cached is not None:
+                total, estimated = cached
+            elif count == "estimated" and where is None:
+                total = await estimate_row_count(self.session, table)
+                if total is not None:
+                    estimated = True
+                    cache.put(table, cache_key, total, self.count_cache_ttl, estimated=True)
+
+        try:
+            if count == "none" or total is not None:
+                result = await self.session.execute(base.offset(offset).limit(page_size))
+                items = list(result.scalars().all())
+            else:
+                stmt = base.add_columns(func.count().over().label("total")).offset(offset).limit(page_size)
+                rows = (await self.session.execute(stmt)).all()
+                items = [row[0] for row in rows]
+                if rows:
+                    total = rows[0].total
+                elif offset == 0:
+                    total = 0
+                else:
+                    # Past the last page the window has no row to ride on.
+                    count_stmt = select(func.count()).select_from(base.subquery())
+                    total = (await self.session.execute(count_stmt)).scalar_one()
+                cache.put(table, cache_key, total, self.count_cache_ttl)
+        except SQLAlchemyError:
+            raise DatabaseError(
+                message="Error fetching records",
+                details={"error_type": "fetch_error"}
+            )
+
+        return OffsetPage(items, page, page_size, total=total, estimated=estimated)
+
+    async def _get_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        principal: Optional[dict] = None,
+        action: str = "read"
+    ) -> CursorPage:
+        """
+        Keyset pagination over `cursor_columns`.
+
+        Each page starts strictly after (or, going back, before) the row its
+        cursor points at - ``WHERE (created_at, id) > (:a, :b)`` - so the cost of
+        a page does not grow with its depth and concurrent inserts do not shift
+        rows between pages.
+        """
+        if limit < 1:
+            raise ValidationError(message="Pagination limit must be >= 1")
+
+        columns = [getattr(self.model, name) for name in self.cursor_columns]
+        codec = get_cursor_codec()
+        scope = f"{self.model.__tablename__}:{','.join(self.cursor_columns)}"
+
+        direction, values = codec.decode(scope, cursor) if cursor else (NEXT, None)
+        stmt = self._authorized(select(self.model), principal, action)
+        if direction == NEXT:
+            if values is not None:
+                stmt = stmt.where(tuple_(*columns) > tuple_(*values))
+            stmt = stmt.order_by(*(column.asc() for column in columns))
+        else:
+            stmt = stmt.where(tuple_(*columns) < tuple_(*values)).order_by(*(column.desc() for column in columns))
+
+        try:
+            result = await self.session.execute(stmt.limit(limit + 1))
+            items = list(result.scalars().all())
+        except SQLAlchemyError:
+            raise DatabaseError(
+                message="Error fetching records",
+                details={"error_type": "fetch_error"}
+            )
+
+        more = len(items) > limit
+        items = items[:limit]
+        if direction == PREVIOUS:
+            items.reverse()
+
+        def key(instance) -> list:
+            return [getattr(instance, name) for name in self.cursor_columns]
+
+        # Coming from a cursor means there is a page on the side we came from.
+        has_next = more if direction == NEXT else True
+        has_prev = more if direction == PREVIOUS else values is not None
+        return CursorPage(
+            items,
+            limit,
+            next_cursor=codec.encode(scope, NEXT, key(items[-1])) if items and has_next else None,
+            prev_cursor=codec.encode(scope, PREVIOUS, key(items[0])) if items and has_prev else None
+        )
+
+    def _row_values(self, row: Union[dict, ElementalSQLBase]) -> Dict[str, Any]:
+        """Column values of a dict or of the attributes set on an (unsaved) instance."""
+        if isinstance(row, dict):
+            return row
+        state = inspect(row)
+        return {
+            attr.key: getattr(row, attr.key)
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+
+    @staticmethod
+    def _relationships_changed(state: InstanceState) -> bool:
+        return any(
+            relationship.key in state.dict and state.attrs[relationship.key].history.has_changes()
+            for relationship in state.mapper.relationships
+        )
+
+    @staticmethod
+    def _changed_values(instance: ElementalSQLBase) -> Dict[str, Any]:
+        """
+        Column values modified on `instance` since it was loaded (every value
+        set, for one built by hand). Primary keys identify the row and are
+        never written; unchanged columns, including ``onupdate`` ones, are left
+        out so the database keeps them or fills them in.
+        """
+        state = inspect(instance)
+        primary = {state.mapper.get_property_by_column(column).key for column in state.mapper.primary_key}
+        return {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key not in primary and attr.key in state.dict and state.attrs[attr.key].history.has_changes()
+        }
+
+    @staticmethod
+    def _chunks(items: Sequence, chunk_size: int) -> Iterable[tuple]:
+        if chunk_size < 1:
+            raise ValidationError(message="Chunk size must be >= 1")
+        for index, start in enumerate(range(0, len(items), chunk_size)):
+            yield index, start, items[start:start + chunk_size]
+
+    @staticmethod
+    def _bulk_error(e: IntegrityError, chunk: int, offset: int, size: int) -> Exception:
+        details = {"chunk": chunk, "offset": offset, "size": size}
+        error_msg = str(e.orig).lower()
+
+        if "not null" in error_msg:
+            return ValidationError(
+                message=f"A required field is missing in chunk {chunk}.",
+                details={"error_type": "missing_required_field", **details}
+            )
+        if "unique" in error_msg or "duplicate" in error_msg:
+            return DuplicateError(
+                message=f"A record in chunk {chunk} already exists.",
+                details={"error_type": "unique_violation", **details}
+            )
+        return ValidationError(
+            message=f"Data integrity violation in chunk {chunk}.",
+            details={"error_type": "integrity_error", **details}
+        )
+
+    async def _run_chunks(self, items: Sequence, chunk_size: Optional[int], execute) -> list:
+        """
+        Runs `execute(chunk)` for every chunk inside one transaction and commits
+        once. Any failure rolls back every chunk; the error reports which one failed.
+        """
+        results = []
+        chunk, offset, size = 0, 0, 0
+        try:
+            for chunk, offset, rows in self._chunks(items, chunk_size or self.bulk_chunk_size):
+                size = len(rows)
+                results.append(await execute(rows))
+            await self._commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise self._bulk_error(e, chunk, offset, size)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise DatabaseError(
+                message=f"Error in bulk operation at chunk {chunk}",
+                details={"error_type": "bulk_error", "chunk": chunk, "offset": offset, "size": size}
+            )
+        return results
+
+    async def _bulk_create(
+        self,
+        rows: Sequence[Union[dict, ElementalSQLBase]],
+        chunk_size: Optional[int] = None
+    ) -> List[ElementalSQLBase]:
+        """
+        Inserts many rows with one multi-row INSERT per chunk and returns the
+        created records. Where the dialect supports RETURNING, they come back
+        from that same statement with their generated values; otherwise they
+        are built from the inserted values.
+        """
+        values = [self._row_values(row) for row in rows]
+        returning = self.session.get_bind().dialect.insert_executemany_returning
+
+        async def execute(chunk):
+            if returning:
+                result = await self.session.scalars(insert(self.model).returning(self.model), chunk)
+                return list(result.all())
+            await self.session.execute(insert(self.model), chunk)
+            return [self.model(**row) for row in chunk]
+
+        created = [instance for chunk in await self._run_chunks(values, chunk_size, execute) for instance in chunk]
+        self._after_write(created)
+        return created
+
+    async def _bulk_update(
+        self,
+        rows: Sequence[Union[dict, ElementalSQLBase]],
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Updates many rows by primary key: one executemany UPDATE per chunk.
+        Every row must carry its primary key; only the given columns change.
+        Returns the number of rows sent.
+        """
+        values = [self._row_values(row) for row in rows]
+        primary_keys = [column.key for column in inspect(self.model).primary_key]
+        if any(key not in row for row in values for key in primary_keys):
+            raise ValidationError(
+                message="Every row of a bulk update needs its primary key.",
+                details={"error_type": "missing_primary_key", "primary_key": primary_keys}
+            )
+
+        async def execute(chunk):
+            await self.session.execute(update(self.model), chunk)
+            return len(chunk)
+
+        updated = sum(await self._run_chunks(values, chunk_size, execute))
+        self._after_write(values)
+        return updated
+
+    async def _bulk_delete(self, ids: Sequence[Any], chunk_size: Optional[int] = None) -> int:
+        """
+        Deletes records by id with one `DELETE ... WHERE id IN (...)` per chunk. Returns rows deleted.
+
+        When `principal_key` is another column, its values come back through
+        ``DELETE ... RETURNING`` (or a SELECT of the chunk first, on dialects
+        without it) so the deleted principals are invalidated too.
+        """
+        ids = list(ids)
+        key = self.principal_key if self.principal_key not in (None, "id") else None
+        returning = self.session.get_bind().dialect.delete_returning
+
+        async def execute(chunk):
+            stmt = (
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            if key is None:
+                result = await self.session.execute(stmt)
+                return result.rowcount, [{"id": object_id} for object_id in chunk]
+
+            columns = (self.model.id.label("id"), getattr(self.model, key).label(key))
+            if returning:
+                rows = (await self.session.execute(stmt.returning(*columns))).mappings().all()
+            else:
+                rows = (await self.session.execute(select(*columns).where(self.model.id.in_(chunk)))).mappings().all()
+                await self.session.execute(stmt)
+            return len(rows), [dict(row) for row in rows]
+
+        results = await self._run_chunks(ids, chunk_size, execute)
+        self._after_write(row for _, rows in results for row in rows)
+        return sum(count for count, _ in results)
+
     async def _commit(self):
         """Standardized commit with automatic rollback on failure."""
         try:
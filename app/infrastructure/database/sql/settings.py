@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import Field, SecretStr
 from app.elemental.common import ElementalSchema
 
@@ -16,3 +17,20 @@ class DatabaseSettings(ElementalSchema):
     pool_size: int = Field(default=5, description="Connection pool size")
     max_overflow: int = Field(default=10, description="Max overflow connections")
     echo: bool = Field(default=False, description="Log SQL statements")
+    cursor_secret: Optional[SecretStr] = Field(
+        default=None,
+        description="Key signing pagination cursors (defaults to a key derived from jwt.secret_key)",
+        repr=False
+    )
+    entity_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        description="Approximate memory bound of the entity cache of models with __cache_ttl__"
+    )
+    slow_query_threshold: float = Field(
+        default=0.25,
+        description="Seconds after which a statement is logged as slow"
+    )
+    n_plus_one_threshold: int = Field(
+        default=10,
+        description="Executions of one statement within a request that flag it as an N+1 suspect"
+    )
@@ -6,7 +6,8 @@ from .manager import (
 )
 from .utils import (
     safe_send_email,
-    safe_send_email_with_attachments
+    safe_send_email_with_attachments,
+    send_email_in_background
 )
 
 
@@ -16,5 +17,6 @@ __all__ = [
     'init_email_service',
     'is_email_service_initialized',
     'safe_send_email_with_attachments',
-    'safe_send_email'
+    'safe_send_email',
+    'send_email_in_background'
 ]
\ No newline at end of file
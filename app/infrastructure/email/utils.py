@@ -1,8 +1,11 @@
+import asyncio
 from typing import (
-    List
+    List,
+    Optional
 )
 from pathlib import Path
 
+from app.elemental.tasks import get_background_tasks
 from .drivers import EmailServiceManager
 
 
@@ -37,4 +40,26 @@ async def safe_send_email_with_attachments(
         context=context,
         recipients=recipients,
         attachments=attachments
-    )
\ No newline at end of file
+    )
+
+def send_email_in_background(
+    email_service: EmailServiceManager,
+    template_name: str,
+    context: dict,
+    recipients: list,
+    attachments: Optional[List[Path]] = None
+) -> asyncio.Task:
+    """
+    Starts an email send without waiting for it. The task is registered with
+    the background task registry, so the shutdown drain waits for it before
+    the services close; failures are logged by the registry.
+    """
+    return get_background_tasks().spawn(
+        email_service.send(
+            template_name=template_name,
+            context=context,
+            recipients=recipients,
+            attachments=attachments
+        ),
+        name=f"email:{template_name}"
+    )
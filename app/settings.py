@@ -1,7 +1,19 @@
 from .elemental.settings import ElementalSettings
-from .elemental.security import ElementalJWTSettings
+from .elemental.security import (
+    ElementalJWTSettings,
+    ElementalPasswordSettings,
+    ElementalLoginProtectionSettings,
+    ElementalRBACSettings,
+    ElementalAPIKeySettings,
+    ElementalPrincipalSettings
+)
 
 from .infrastructure.oauth import OAuthSettings
 
 class ApplicationSettings(ElementalSettings):
     jwt: ElementalJWTSettings
+    passwords: ElementalPasswordSettings = ElementalPasswordSettings()
+    login_protection: ElementalLoginProtectionSettings = ElementalLoginProtectionSettings()
+    rbac: ElementalRBACSettings = ElementalRBACSettings()
+    api_keys: ElementalAPIKeySettings = ElementalAPIKeySettings()
+    principals: ElementalPrincipalSettings = ElementalPrincipalSettings()
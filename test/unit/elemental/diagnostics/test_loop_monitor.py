@@ -0,0 +1,33 @@
+import time
+import asyncio
+from unittest.mock import MagicMock
+from app.elemental.diagnostics import EventLoopMonitor
+
+async def test_monitor_records_lag():
+    """Must feed the lag histogram while the loop is idle."""
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.5, logger=MagicMock())
+    before = sum(s["count"] for s in monitor.lag_histogram.collect().values())
+
+    monitor.start()
+    await asyncio.sleep(0.1)
+    monitor.stop()
+
+    after = sum(s["count"] for s in monitor.lag_histogram.collect().values())
+    assert after > before
+
+async def test_monitor_reports_blocking_call_with_route():
+    """Must log the loop thread stack and route when a callback blocks."""
+    logger = MagicMock()
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05, logger=logger)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    monitor.requests[asyncio.current_task()] = {"method": "POST", "path": "/login"}
+    time.sleep(0.3)  # Blocks the loop on purpose
+    await asyncio.sleep(0.03)
+    monitor.stop()
+
+    assert logger.warning.called
+    message = logger.warning.call_args[0][0]
+    assert "POST /login" in message
+    assert "test_monitor_reports_blocking_call_with_route" in message
@@ -0,0 +1,47 @@
+import pytest
+from app.elemental.diagnostics import MemoryTracer
+from app.elemental.diagnostics.memory import _module_name
+from app.elemental.exceptions import ConflictError, NotFoundError
+
+@pytest.fixture
+def tracer():
+    tracer = MemoryTracer(max_snapshots=2)
+    tracer.start(frames=5)
+    yield tracer
+    tracer.stop()
+
+def test_module_name_maps_app_files():
+    """Must map files of the app package to dotted module names."""
+    import app.elemental.metrics.registry as registry
+    import app.elemental.metrics as metrics
+
+    assert _module_name(registry.__file__) == "app.elemental.metrics.registry"
+    assert _module_name(metrics.__file__) == "app.elemental.metrics"
+    assert _module_name(pytest.__file__) is None
+
+def test_diff_reports_growth(tracer):
+    """Must attribute allocations made between two snapshots."""
+    tracer.take("before")
+    retained = [bytearray(1024) for _ in range(500)]
+    tracer.take("after")
+
+    report = tracer.diff("before", "after", limit=5)
+    top = report["modules"][0]
+    assert top["module"] == "<other>"
+    assert top["size_diff"] >= 500 * 1024
+    assert __file__ in top["sites"][0]["site"]
+    assert len(retained) == 500
+
+def test_snapshots_are_bounded(tracer):
+    """Must evict the oldest snapshot and reject unknown names."""
+    for name in ("a", "b", "c"):
+        tracer.take(name)
+
+    assert list(tracer.snapshots) == ["b", "c"]
+    with pytest.raises(NotFoundError):
+        tracer.top("a")
+
+def test_start_twice_conflicts(tracer):
+    """Must refuse to restart an active trace."""
+    with pytest.raises(ConflictError):
+        tracer.start()
@@ -0,0 +1,42 @@
+import time
+import asyncio
+import threading
+import pytest
+from app.elemental.diagnostics import SamplingProfiler, profile
+from app.elemental.exceptions import ConflictError, ValidationError
+
+def _spin(seconds: float):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(100))
+
+def test_sampling_profiler_collapsed_output():
+    """Must produce collapsed stacks naming the busy function."""
+    worker = threading.Thread(target=_spin, args=(0.2,))
+    worker.start()
+
+    profiler = SamplingProfiler(interval=0.005, thread_ids=[worker.ident])
+    profiler.start()
+    worker.join()
+    profiler.stop()
+
+    output = profiler.collapsed()
+    assert profiler.ticks > 0
+    first_line = output.splitlines()[0]
+    assert "_spin" in first_line
+    assert first_line.rsplit(" ", 1)[1].isdigit()
+
+async def test_profile_refuses_concurrent_sessions():
+    """Must reject a second session while one is running."""
+    running = asyncio.create_task(profile(0.2, interval=0.01))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ConflictError):
+        await profile(0.1)
+
+    assert isinstance(await running, str)
+
+async def test_profile_validates_duration():
+    """Must reject durations above the configured maximum."""
+    with pytest.raises(ValidationError):
+        await profile(120, max_seconds=60)
@@ -0,0 +1,55 @@
+import pytest
+from app.elemental.metrics import MetricsRegistry
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+def test_counter_with_labels(registry):
+    """Must count separately per label set."""
+    counter = registry.counter("hits_total", "Hits")
+    counter.inc()
+    counter.inc(2, route="/a")
+    counter.inc(route="/a")
+
+    assert counter.value() == 1
+    assert counter.value(route="/a") == 3
+
+def test_registry_returns_same_metric(registry):
+    """Must share the metric declared under the same name."""
+    assert registry.counter("x") is registry.counter("x")
+
+def test_registry_rejects_type_mismatch(registry):
+    """Must not silently reuse a name with another metric type."""
+    registry.counter("x")
+    with pytest.raises(ValueError):
+        registry.histogram("x")
+
+def test_gauge_set_and_dec(registry):
+    """Must allow setting and decreasing values."""
+    gauge = registry.gauge("in_flight")
+    gauge.set(5)
+    gauge.dec(2)
+    assert gauge.value() == 3
+
+def test_histogram_buckets(registry):
+    """Must place observations in the first bucket that fits."""
+    histogram = registry.histogram("lag", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    series = histogram.collect()[()]
+    assert series["count"] == 3
+    assert list(series["buckets"].values()) == [1, 1, 1]
+
+def test_render_prometheus(registry):
+    """Must render cumulative buckets in the exposition format."""
+    registry.histogram("lag", "Loop lag", buckets=(0.1,)).observe(0.05)
+    registry.counter("hits_total").inc(route="/a")
+
+    text = registry.render()
+    assert "# TYPE lag histogram" in text
+    assert 'lag_bucket{le="0.1"} 1' in text
+    assert 'lag_bucket{le="+Inf"} 1' in text
+    assert 'hits_total{route="/a"} 1.0' in text
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from app.elemental.security.apikeys import APIKeyAuthenticator, APIKeyRecord
+
+def _authenticator(**kwargs) -> APIKeyAuthenticator:
+    return APIKeyAuthenticator("test-secret-with-some-length", **kwargs)
+
+async def test_authenticate_valid_key():
+    """Must return the record payload for a matching secret only."""
+    authenticator = _authenticator()
+    key, prefix, digest = authenticator.generate()
+    records = {prefix: APIKeyRecord(prefix, digest, subject="svc-1", claims={"scope": "sync"})}
+
+    async def loader(p):
+        return records.get(p)
+
+    authenticator.loader = loader
+
+    payload = await authenticator.authenticate(key)
+    assert payload["sub"] == "svc-1"
+    assert payload["type"] == "api_key"
+    assert payload["api_key"] == prefix
+    assert payload["scope"] == "sync"
+
+    assert await authenticator.authenticate(key[:-1] + ("A" if key[-1] != "A" else "B")) is None
+    assert await authenticator.authenticate("not-a-key") is None
+
+async def test_expired_key_rejected():
+    """Must reject keys past their expiry."""
+    authenticator = _authenticator()
+    key, prefix, digest = authenticator.generate()
+
+    async def loader(p):
+        return APIKeyRecord(p, digest, subject="svc", expires_at=time.time() - 1)
+
+    authenticator.loader = loader
+    assert await authenticator.authenticate(key) is None
+
+async def test_lookups_are_cached_and_coalesced():
+    """Must call the loader once for concurrent and repeated lookups."""
+    authenticator = _authenticator()
+    key, prefix, digest = authenticator.generate()
+    calls = []
+
+    async def loader(p):
+        calls.append(p)
+        await asyncio.sleep(0.01)
+        return APIKeyRecord(p, digest, subject="svc")
+
+    authenticator.loader = loader
+    results = await asyncio.gather(*(authenticator.authenticate(key) for _ in range(5)))
+    await authenticator.authenticate(key)
+
+    assert all(result["sub"] == "svc" for result in results)
+    assert calls == [prefix]
+
+    authenticator.invalidate(prefix)
+    await authenticator.authenticate(key)
+    assert calls == [prefix, prefix]
+
+async def test_usage_flushed_in_batches():
+    """Must write last-used timestamps in batches and retry failed ones."""
+    authenticator = _authenticator(batch_size=2)
+    keys = [authenticator.generate() for _ in range(3)]
+    digests = {prefix: digest for _, prefix, digest in keys}
+
+    async def loader(p):
+        return APIKeyRecord(p, digests[p], subject="svc")
+
+    batches = []
+    fail = [True]
+
+    async def writer(batch):
+        if fail[0]:
+            fail[0] = False
+            raise RuntimeError("database unavailable")
+        batches.append(batch)
+
+    authenticator.loader = loader
+    authenticator.usage_writer = writer
+    for key, _, _ in keys:
+        await authenticator.authenticate(key)
+
+    await authenticator.flush()
+    assert len(batches) == 1 and len(batches[0]) == 1
+
+    await authenticator.flush()
+    assert sorted(len(batch) for batch in batches) == [1, 2]
+    assert set().union(*batches) == set(digests)
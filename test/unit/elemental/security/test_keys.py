@@ -0,0 +1,74 @@
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from app.elemental.security.tokens import ElementalTokenCodec, KeyRing, ParsedKey
+from app.elemental.exceptions import ConfigurationError
+from app.elemental.exceptions.auth import UnauthorizedError
+
+def _pem(private_key) -> str:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+
+@pytest.fixture
+def ring():
+    now = time.time()
+    return KeyRing([
+        ParsedKey("old", "ES256", private_key=_pem(ec.generate_private_key(ec.SECP256R1())),
+                  active_until=now + 100, verify_until=now + 200),
+        ParsedKey("new", "EdDSA", private_key=_pem(ed25519.Ed25519PrivateKey.generate()),
+                  active_from=now + 100),
+        ParsedKey(None, "HS256", private_key="legacy-secret"),
+    ])
+
+def test_signer_follows_rotation_windows(ring):
+    """Must switch the signing key at the activation boundary."""
+    now = time.time()
+    assert ring.signer(now).kid == "old"
+    assert ring.signer(now + 150).kid == "new"
+    assert ring.signer(now).kid == "old"
+
+def test_decode_uses_kid_and_pins_algorithm(ring):
+    """Must verify by kid and refuse tokens that pick another algorithm."""
+    codec = ElementalTokenCodec(ring)
+    token = codec.encode({"sub": "1"}, "access")
+
+    assert jwt.get_unverified_header(token)["kid"] == "old"
+    assert codec.decode(token)["sub"] == "1"
+
+    forged = jwt.encode({"sub": "1", "exp": int(time.time()) + 60}, "legacy-secret", headers={"kid": "new"})
+    with pytest.raises(UnauthorizedError):
+        codec.decode(forged)
+
+    unknown = jwt.encode({"sub": "1"}, "legacy-secret", headers={"kid": "missing"})
+    with pytest.raises(UnauthorizedError):
+        codec.decode(unknown)
+
+def test_legacy_tokens_without_kid(ring):
+    """Must verify tokens without kid against the legacy secret."""
+    token = jwt.encode({"sub": "7", "exp": int(time.time()) + 60}, "legacy-secret", algorithm="HS256")
+    assert ElementalTokenCodec(ring).decode(token)["sub"] == "7"
+
+def test_jwks_publishes_only_public_keys(ring):
+    """Must publish asymmetric keys without private material."""
+    keys = ring.jwks()["keys"]
+
+    assert [key["kid"] for key in keys] == ["old", "new"]
+    assert all("d" not in key for key in keys)
+
+def test_invalid_key_material():
+    """Must fail at load time, not per request."""
+    with pytest.raises(ConfigurationError):
+        ParsedKey("broken", "ES256", private_key="not a pem")
+
+def test_verify_until_of_the_signing_key(ring):
+    """Must report when the key that verifies a token retires."""
+    codec = ElementalTokenCodec(ring)
+    token = codec.encode({"sub": "1"}, "access")
+
+    assert codec.verify_until(token) == ring.verifier("old").verify_until
+    assert ElementalTokenCodec(KeyRing.from_secret("secret")).verify_until(token) is None
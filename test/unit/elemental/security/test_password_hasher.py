@@ -0,0 +1,61 @@
+import os
+import time
+import asyncio
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from app.elemental.security.passwords import PasswordHasherPool
+from app.elemental.security.passwords.utils import get_password_hash, verify_password
+
+async def test_hasher_pool_round_trip():
+    """Must hash and verify off the event loop."""
+    pool = PasswordHasherPool(executor="thread", max_workers=1, max_concurrency=1)
+    try:
+        hashed = await pool.run("hash", get_password_hash, "secret")
+        assert await pool.run("verify", verify_password, "secret", hashed) is True
+        assert await pool.run("verify", verify_password, "other", hashed) is False
+    finally:
+        pool.shutdown()
+
+async def test_hasher_pool_caps_concurrency():
+    """Must not run more hashes at once than max_concurrency."""
+    pool = PasswordHasherPool(executor="thread", max_workers=4, max_concurrency=2)
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        time.sleep(0.05)
+        running -= 1
+
+    try:
+        await asyncio.gather(*(pool.run("test", work) for _ in range(6)))
+    finally:
+        pool.shutdown()
+
+    assert peak == 2
+    assert pool.queue_histogram.collect()[(("operation", "test"),)]["count"] == 6
+
+async def test_process_pool_round_trip_and_shutdown():
+    """Must hash and verify in child processes and start a fresh pool after shutdown."""
+    pool = PasswordHasherPool(executor="process", max_workers=1, max_concurrency=1)
+    try:
+        assert await pool.run("pid", os.getpid) != os.getpid()
+        assert isinstance(pool._executor, ProcessPoolExecutor)
+
+        hashed = await pool.run("hash", get_password_hash, "secret")
+        assert verify_password("secret", hashed)
+        assert await pool.run("verify", verify_password, "secret", hashed) is True
+        assert await pool.run("verify", verify_password, "other", hashed) is False
+
+        executor = pool._executor
+        pool.shutdown()
+        assert pool._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(os.getpid)
+
+        assert await pool.run("verify", verify_password, "secret", hashed) is True
+        assert pool._executor is not executor
+    finally:
+        pool.shutdown()
@@ -95,3 +95,28 @@ def test_generate_secure_password_custom_length():
     """Must respect custom length."""
     pwd = generate_secure_password(length=50)
     assert len(pwd) == 50
+
+# --- Upgrade & Calibration Tests ---
+
+def test_verify_and_upgrade_password_rehashes_weak_hash():
+    """Must return a new hash when the stored one is below the configured cost."""
+    from passlib.hash import bcrypt
+    from app.elemental.security.passwords.utils import verify_and_upgrade_password, needs_rehashing
+
+    weak = bcrypt.using(rounds=4).hash("secret")
+    assert needs_rehashing(weak)
+
+    valid, new_hash = verify_and_upgrade_password("secret", weak)
+    assert valid is True
+    assert new_hash is not None and not needs_rehashing(new_hash)
+
+    assert verify_and_upgrade_password("wrong", weak) == (False, None)
+
+def test_calibrate_bcrypt_picks_cost_within_target():
+    """Must stop at the first cost over the target and pick the one before it."""
+    from app.elemental.security.passwords.calibration import calibrate_bcrypt
+
+    result = calibrate_bcrypt(target_ms=10_000, samples=1, min_rounds=4, max_rounds=6)
+
+    assert [m["bcrypt_rounds"] for m in result["measurements"]] == [4, 5, 6]
+    assert result["choice"]["bcrypt_rounds"] == 6
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import String, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.elemental.exceptions import ForbiddenError
+from app.elemental.security.policies import FieldIs, HasRole, Owner, Policy, Rule
+
+class _Base(DeclarativeBase):
+    pass
+
+class Note(_Base):
+    __tablename__ = "policy_notes"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_by: Mapped[str] = mapped_column(String(36))
+    status: Mapped[str] = mapped_column(String(16))
+
+notes_policy = Policy(
+    "notes",
+    read=FieldIs("status", "published") | Owner() | HasRole("moderator"),
+    update=Owner(),
+)
+
+def _sql(condition) -> str:
+    return str(select(Note).where(condition).compile(compile_kwargs={"literal_binds": True}))
+
+def test_object_checks():
+    """Must evaluate compiled closures on loaded objects."""
+    policy = notes_policy.compile(Note)
+    draft = Note(id="1", created_by="alice", status="draft")
+
+    assert policy.allows("read", {"sub": "alice"}, draft)
+    assert not policy.allows("read", {"sub": "bob"}, draft)
+    assert policy.allows("read", {"sub": "bob", "role": "moderator"}, draft)
+    assert not policy.allows("delete", {"sub": "alice"}, draft)
+
+    with pytest.raises(ForbiddenError):
+        policy.authorize("update", {"sub": "bob", "role": "moderator"}, draft)
+
+def test_query_filters():
+    """Must compile rules into WHERE conditions."""
+    policy = notes_policy.compile(Note)
+
+    sql = _sql(policy.filter("read", {"sub": "bob"}))
+    assert "policy_notes.status = 'published'" in sql
+    assert "policy_notes.created_by = 'bob'" in sql
+
+    assert "WHERE true" in _sql(policy.filter("read", {"sub": "bob", "role": "moderator"}))
+    assert "WHERE false" in _sql(policy.filter("update", {}))
+
+    with pytest.raises(ForbiddenError):
+        policy.filter("delete", {"sub": "bob"})
+
+def test_compile_is_cached():
+    """Must compile once per model."""
+    assert notes_policy.compile(Note) is notes_policy.compile(Note)
+
+def test_incomplete_rule_fails_on_instantiation():
+    """Must reject a rule missing part of the interface when it is built."""
+    class OnlyCheck(Rule):
+        def compile_check(self, model):
+            return lambda payload, obj: True
+
+    with pytest.raises(TypeError):
+        OnlyCheck()
@@ -0,0 +1,51 @@
+import asyncio
+from app.elemental.security.principals import PrincipalState, PrincipalStateCache
+
+def _loader(calls, states):
+    async def loader(subs):
+        calls.append(sorted(subs))
+        return {sub: states[sub] for sub in subs if sub in states}
+    return loader
+
+async def test_misses_are_batched():
+    """Must load concurrent misses with a single loader call."""
+    calls = []
+    states = {"1": PrincipalState(), "2": PrincipalState(is_active=False)}
+    cache = PrincipalStateCache(loader=_loader(calls, states))
+
+    results = await asyncio.gather(cache.get("1"), cache.get("2"), cache.get("1"), cache.get("3"))
+
+    assert calls == [["1", "2", "3"]]
+    assert results[0] is states["1"] and results[2] is states["1"]
+    assert results[1].is_active is False
+    assert results[3] is None
+
+    await cache.get("3")
+    assert len(calls) == 1
+
+async def test_stale_entries_served_while_refreshing():
+    """Must answer from a stale entry and refresh it in the background."""
+    calls = []
+    states = {"1": PrincipalState(token_version=1)}
+    cache = PrincipalStateCache(loader=_loader(calls, states), ttl=0, stale_ttl=60)
+    await cache.get("1")
+
+    states["1"] = PrincipalState(token_version=2)
+    assert (await cache.get("1")).token_version == 1
+
+    await asyncio.sleep(0.02)
+    assert len(calls) == 2
+    assert cache._entries["1"][1].token_version == 2
+
+async def test_invalidate_discards_inflight_load():
+    """Must not cache a load that started before an invalidation."""
+    calls = []
+    states = {"1": PrincipalState()}
+    cache = PrincipalStateCache(loader=_loader(calls, states))
+
+    pending = asyncio.ensure_future(cache.get("1"))
+    await asyncio.sleep(0)
+    cache.invalidate("1")
+
+    assert await pending is states["1"]
+    assert "1" not in cache._entries
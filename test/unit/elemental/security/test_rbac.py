@@ -0,0 +1,60 @@
+import pytest
+from app.elemental.exceptions import ConfigurationError
+from app.elemental.security.rbac import (
+    CompiledRBAC,
+    ElementalRBACSettings,
+    decode_mask,
+    encode_mask
+)
+from app.elemental.security.roles import has_permission, get_user_permissions
+
+@pytest.fixture
+def rbac(monkeypatch):
+    compiled = CompiledRBAC(ElementalRBACSettings(
+        permissions=["posts:read", "posts:write", "users:manage"],
+        roles={
+            "viewer": {"permissions": ["posts:read"]},
+            "editor": {"permissions": ["posts:write"], "inherits": ["viewer"]},
+            "admin": {"permissions": ["users:manage"], "inherits": ["editor"]},
+        }
+    ))
+    monkeypatch.setattr("app.elemental.security.rbac.registry._rbac", compiled)
+    return compiled
+
+def test_mask_round_trip():
+    """Must encode masks compactly and decode them back."""
+    for mask in (0, 1, 0b1011, 1 << 70):
+        assert decode_mask(encode_mask(mask)) == mask
+    assert len(encode_mask(0b111)) == 2
+
+def test_hierarchy_closure(rbac):
+    """Must grant inherited permissions and roles transitively."""
+    admin = {"role": "admin"}
+
+    assert rbac.has_permissions(admin, rbac.permissions_mask(["posts:read", "users:manage"]))
+    assert rbac.has_role(admin, rbac.roles_mask(["viewer"]))
+    assert not rbac.has_role({"role": "viewer"}, rbac.roles_mask(["editor"]))
+
+def test_token_mask_overrides_role(rbac):
+    """Must read permissions from the token mask when present."""
+    claims = rbac.token_claims("viewer", extra_permissions=["users:manage"])
+    payload = {"sub": "1", **claims}
+
+    assert has_permission(payload, "users:manage")
+    assert not has_permission(payload, "posts:write")
+    assert sorted(get_user_permissions(payload)) == ["posts:read", "users:manage"]
+
+def test_ad_hoc_roles_get_bits(rbac):
+    """Must support roles that are not declared in the settings."""
+    required = rbac.roles_mask(["auditor"])
+
+    assert rbac.has_role({"role": "auditor"}, required)
+    assert not rbac.has_role({"role": "admin"}, required)
+
+def test_inheritance_cycle_rejected():
+    """Must refuse cyclic role hierarchies at compile time."""
+    with pytest.raises(ConfigurationError):
+        CompiledRBAC(ElementalRBACSettings(roles={
+            "a": {"inherits": ["b"]},
+            "b": {"inherits": ["a"]},
+        }))
@@ -0,0 +1,60 @@
+import time
+from app.elemental.security.tokens import TokenRevocationStore
+from app.elemental.security.tokens.revocation import BloomFilter
+
+def test_bloom_filter_membership():
+    """Must report every added value and reject most others."""
+    bloom = BloomFilter(100)
+    values = [f"user-{i}" for i in range(100)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    assert sum(f"other-{i}" in bloom for i in range(1000)) < 50
+
+def test_revoke_subject_by_version():
+    """Must reject tokens older than the subject's minimum version."""
+    store = TokenRevocationStore()
+    store.revoke_subject("1", 3)
+
+    assert store.is_revoked({"sub": "1", "version": 2})
+    assert not store.is_revoked({"sub": "1", "version": 3})
+    assert not store.is_revoked({"sub": "2", "version": 1})
+
+def test_revoke_token_until_expiry():
+    """Must reject a revoked jti and forget it once expired."""
+    store = TokenRevocationStore()
+    store.revoke_token("abc", time.time() + 60)
+    store.revoke_token("old", time.time() - 1)
+
+    assert store.is_revoked({"sub": "1", "jti": "abc"})
+    assert not store.is_revoked({"sub": "1", "jti": "old"})
+
+def test_revoke_token_prunes_without_loader(monkeypatch):
+    """Must drop expired jtis as revocations accumulate, with no refresh running."""
+    monkeypatch.setattr(TokenRevocationStore, "PRUNE_FLOOR", 4)
+    store = TokenRevocationStore()
+    now = time.time()
+    for i in range(4):
+        store.revoke_token(f"short-{i}", now + 60)
+
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    for i in range(10):
+        store.revoke_token(f"long-{i}", now + 600)
+
+    assert sorted(store.revoked_jtis) == sorted(f"long-{i}" for i in range(10))
+    assert all(store.is_revoked({"jti": f"long-{i}"}) for i in range(10))
+
+async def test_refresh_merges_loader_snapshot():
+    """Must merge database state without lowering local versions."""
+    async def loader():
+        return {"1": 2, "2": 5}, {"gone": time.time() - 1, "jti-x": time.time() + 60}
+
+    store = TokenRevocationStore(loader=loader)
+    store.revoke_subject("1", 4)
+    await store.refresh()
+
+    assert store.min_versions == {"1": 4, "2": 5}
+    assert list(store.revoked_jtis) == ["jti-x"]
+    assert store.is_revoked({"sub": "2", "version": 4, "jti": "y"})
+    assert store.is_revoked({"sub": "3", "jti": "jti-x"})
@@ -0,0 +1,121 @@
+import time
+import asyncio
+import pytest
+from app.elemental.exceptions import RateLimitError
+from app.elemental.security.throttling import (
+    ElementalLoginProtectionSettings,
+    FailureCounter,
+    FailureLimit,
+    LoginGuard,
+    guarded_verify_password
+)
+from app.elemental.security.throttling import limiter
+
+def _settings(**overrides):
+    return ElementalLoginProtectionSettings(**{
+        "window": 60,
+        "buckets": 6,
+        "account": FailureLimit(free_attempts=2, base_delay=10, max_delay=100),
+        "ip": {"free_attempts": 100},
+        **overrides
+    })
+
+def test_failure_counter_slides_window():
+    """Must forget failures older than the window."""
+    counter = FailureCounter(window=60, buckets=6, max_keys=10)
+    counter.add("a", 1000)
+    counter.add("a", 1030)
+
+    assert counter.state("a", 1035)[0] == 2
+    assert counter.state("a", 1065)[0] == 1
+    assert counter.state("a", 1200)[0] == 0
+
+def test_failure_counter_remove():
+    """Must take back a failure only while its slot is inside the window."""
+    counter = FailureCounter(window=60, buckets=6, max_keys=10)
+    counter.add("a", 1000)
+    counter.add("a", 1030)
+    counter.remove("a", 1030)
+    assert counter.state("a", 1035)[0] == 1
+
+    counter.add("a", 1100)
+    counter.remove("a", 1000)
+    assert counter.state("a", 1100)[0] == 1
+
+def test_failure_counter_is_bounded():
+    """Must evict the least recently touched key."""
+    counter = FailureCounter(window=60, buckets=6, max_keys=2)
+    for key in ("a", "b", "c"):
+        counter.add(key, 1000)
+
+    assert len(counter) == 2
+    assert counter.state("a", 1000)[0] == 0
+
+async def test_guard_backs_off_after_free_attempts():
+    """Must reject before hashing once an account exceeds its free attempts."""
+    guard = LoginGuard(_settings())
+    for _ in range(3):
+        await guard.check("user@example.com", "10.0.0.1")
+
+    with pytest.raises(RateLimitError) as exc:
+        await guard.check("user@example.com", "10.0.0.2")
+    assert exc.value.details["reason"] == "account"
+
+    await guard.check("other@example.com", "10.0.0.1")
+
+async def test_guard_success_clears_account():
+    """Must reset the account counter on a successful login."""
+    guard = LoginGuard(_settings())
+    for _ in range(3):
+        attempted_at = await guard.check("user@example.com", None)
+    guard.record_success("user@example.com", None, attempted_at)
+
+    await guard.check("user@example.com", None)
+
+async def test_concurrent_attempts_are_reserved(monkeypatch):
+    """Must count in-flight attempts, so a burst cannot outrun the backoff."""
+    guard = LoginGuard(_settings())
+    monkeypatch.setattr(limiter, "_guard", guard)
+    started = []
+
+    async def verify(plain, hashed):
+        started.append(plain)
+        await asyncio.sleep(0.01)
+        return False
+
+    results = await asyncio.gather(*(
+        guarded_verify_password("guess", "hash", account="user@example.com", ip="10.0.0.1", verify=verify)
+        for _ in range(10)
+    ), return_exceptions=True)
+
+    assert len(started) == 3
+    assert sum(isinstance(result, RateLimitError) for result in results) == 7
+
+async def test_success_and_errors_release_the_ip(monkeypatch):
+    """Must take back the reserved IP attempt on success or a verification error."""
+    guard = LoginGuard(_settings())
+    monkeypatch.setattr(limiter, "_guard", guard)
+
+    async def valid(plain, hashed):
+        return True
+
+    async def broken(plain, hashed):
+        raise RuntimeError("hasher down")
+
+    assert await guarded_verify_password("right", "hash", account="a", ip="10.0.0.1", verify=valid)
+    with pytest.raises(RuntimeError):
+        await guarded_verify_password("any", "hash", account="b", ip="10.0.0.1", verify=broken)
+
+    now = time.time()
+    assert guard.ips.state("10.0.0.1", now)[0] == 0
+    assert guard.accounts.state("b", now)[0] == 0
+
+async def test_guard_enforces_hashing_budget():
+    """Must reject attempts once the per-worker hashing budget is spent."""
+    guard = LoginGuard(_settings(hashes_per_second=1, burst=2, max_budget_wait=0))
+    await guard.check(None, None)
+    await guard.check(None, None)
+
+    with pytest.raises(RateLimitError) as exc:
+        await guard.check(None, None)
+    assert exc.value.details["reason"] == "budget"
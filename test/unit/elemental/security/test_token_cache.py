@@ -0,0 +1,56 @@
+import time
+from app.elemental.security.tokens import VerifiedTokenCache
+
+def test_cache_hit_returns_copy():
+    """Must serve cached payloads without exposing the stored object."""
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.put("token-a", {"sub": "1", "exp": time.time() + 60})
+
+    payload = cache.get("token-a")
+    payload["sub"] = "tampered"
+
+    assert cache.get("token-a")["sub"] == "1"
+    assert cache.get("token-b") is None
+
+def test_cache_expires_at_exp():
+    """Must drop entries once the token's exp has passed."""
+    cache = VerifiedTokenCache()
+    cache.put("expired", {"sub": "1", "exp": time.time() - 1})
+    cache.put("no-exp", {"sub": "1"})
+
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+    assert len(cache) == 0
+
+def test_cache_is_bounded_lru():
+    """Must evict the least recently used token."""
+    cache = VerifiedTokenCache(max_entries=2)
+    exp = time.time() + 60
+    cache.put("a", {"sub": "1", "exp": exp})
+    cache.put("b", {"sub": "2", "exp": exp})
+    cache.get("a")
+    cache.put("c", {"sub": "3", "exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+def test_cache_invalidation():
+    """Must forget tokens on logout, individually or per subject."""
+    cache = VerifiedTokenCache()
+    exp = time.time() + 60
+    cache.put("a", {"sub": "1", "exp": exp})
+    cache.put("b", {"sub": "1", "exp": exp})
+    cache.put("c", {"sub": "2", "exp": exp})
+
+    assert cache.invalidate("c") is True
+    assert cache.invalidate_subject("1") == 2
+    assert len(cache) == 0
+
+def test_cache_expires_with_the_signing_key():
+    """Must drop an entry when the verifying key retires before the token's exp."""
+    cache = VerifiedTokenCache()
+    cache.put("retiring", {"sub": "1", "exp": time.time() + 600}, verify_until=time.time() - 1)
+    cache.put("kept", {"sub": "1", "exp": time.time() + 600}, verify_until=time.time() + 60)
+
+    assert cache.get("retiring") is None
+    assert cache.get("kept") is not None
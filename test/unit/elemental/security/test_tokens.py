@@ -1,6 +1,6 @@
 import pytest
 import jwt
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from datetime import datetime, timedelta, timezone
 from app.elemental.security.tokens.provider import (
     create_access_token,
@@ -8,6 +8,8 @@ from app.elemental.security.tokens.provider import (
     create_general_token,
     decode_token
 )
+from app.elemental.security.tokens.codec import ElementalTokenCodec
+from app.elemental.security.tokens.keys import KeyRing
 from app.elemental.exceptions.auth import TokenExpiredError, UnauthorizedError
 
 # --- Fixture ---
@@ -15,15 +17,13 @@ from app.elemental.exceptions.auth import TokenExpiredError, UnauthorizedError
 @pytest.fixture
 def mock_token_settings():
     """JWT configuration mock."""
-    with patch("app.elemental.security.tokens.provider._settings") as mock_settings:
-        mock_settings.algorithm = "HS256"
-        mock_settings.secret_key.get_secret_value.return_value = "super-secret-key"
-        
-        # Configure simulated expirations
-        mock_settings.access_token.expire_delta = timedelta(minutes=15)
-        mock_settings.refresh_token.expire_delta = timedelta(days=7)
-        
-        yield mock_settings
+    codec = ElementalTokenCodec(
+        keyring=KeyRing.from_secret("super-secret-key", "HS256"),
+        access_expire_seconds=int(timedelta(minutes=15).total_seconds()),
+        refresh_expire_seconds=int(timedelta(days=7).total_seconds())
+    )
+    with patch("app.elemental.security.tokens.codec._codec", codec):
+        yield codec
 
 # --- Creation Tests ---
 
@@ -107,3 +107,24 @@ def test_decode_token_malformed(mock_token_settings):
     """Must handle malformed tokens."""
     with pytest.raises(UnauthorizedError):
         decode_token("this.is.not.a.token")
+
+def test_encode_many_shares_claims(mock_token_settings):
+    """Must mint one token per item with a shared issue time."""
+    tokens = mock_token_settings.encode_many(
+        [{"id": "1"}, {"id": "2", "email": "b@example.com"}],
+        token_type="invitation",
+        days=2
+    )
+    decoded = [jwt.decode(t, "super-secret-key", algorithms=["HS256"]) for t in tokens]
+
+    assert [d["sub"] for d in decoded] == ["1", "2"]
+    assert decoded[0]["iat"] == decoded[1]["iat"]
+    assert decoded[1]["exp"] - decoded[1]["iat"] == 2 * 86400
+    assert decoded[1]["email"] == "b@example.com"
+
+def test_codec_output_matches_pyjwt(mock_token_settings):
+    """Must produce tokens byte-identical to PyJWT's encoder."""
+    token = create_access_token({"sub": "1"})
+    claims = jwt.decode(token, "super-secret-key", algorithms=["HS256"])
+
+    assert token == jwt.encode(claims, "super-secret-key", algorithm="HS256")
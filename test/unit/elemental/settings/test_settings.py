@@ -10,9 +10,10 @@ def reset_settings_state():
     """Reset global state before each test."""
     # Access the global variable through the imported module
     import app.elemental.settings.state as state_module
+    previous = state_module._settings
     state_module._settings = None
     yield
-    state_module._settings = None
+    state_module._settings = previous
 
 # --- ElementalSettings Tests ---
 
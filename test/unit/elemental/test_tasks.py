@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+from app.elemental.tasks import BackgroundTaskRegistry
+
+async def test_spawn_tracks_until_done():
+    """Must hold the task while it runs and release it when it finishes."""
+    registry = BackgroundTaskRegistry()
+    event = asyncio.Event()
+
+    task = registry.spawn(event.wait(), name="waiter")
+    assert registry.pending == 1
+
+    event.set()
+    await task
+    assert registry.pending == 0
+
+async def test_drain_waits_for_tasks():
+    """Must report no aborted tasks when they finish within the timeout."""
+    registry = BackgroundTaskRegistry()
+    registry.spawn(asyncio.sleep(0.01))
+
+    assert await registry.drain(timeout=1) == 0
+    assert registry.pending == 0
+
+async def test_drain_cancels_on_timeout():
+    """Must cancel and count tasks still running at the deadline."""
+    registry = BackgroundTaskRegistry()
+    task = registry.spawn(asyncio.sleep(10))
+
+    assert await registry.drain(timeout=0.01) == 1
+    assert task.cancelled()
+
+async def test_failed_task_is_released():
+    """Must not keep failed tasks around."""
+    registry = BackgroundTaskRegistry()
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    task = registry.spawn(boom())
+    with pytest.raises(RuntimeError):
+        await task
+    await asyncio.sleep(0)
+    assert registry.pending == 0
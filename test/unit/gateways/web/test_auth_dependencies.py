@@ -0,0 +1,82 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from app.elemental.settings import get_settings
+from app.elemental.security.apikeys import APIKeyAuthenticator, APIKeyRecord
+from app.elemental.security.apikeys import store as apikey_store
+from app.elemental.security.tokens import ElementalTokenTypes, get_token_codec
+from app.gateways.web.auth import dependencies
+from app.gateways.web.auth.dependencies import get_current_active_user, require_roles
+from app.gateways.web.middlewares.responses.exceptions import ExceptionParserMiddleware
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ExceptionParserMiddleware)
+
+    @app.get("/me")
+    async def me(user: dict = Depends(get_current_active_user)):
+        return user
+
+    return TestClient(app)
+
+def _bearer(**claims) -> dict:
+    token = get_token_codec().encode({"sub": "42", "role": "user", **claims}, ElementalTokenTypes.ACCESS)
+    return {"Authorization": f"Bearer {token}"}
+
+def test_active_user_with_default_settings():
+    """Must let a valid token through when no principal loader is configured."""
+    response = _client().get("/me", headers=_bearer())
+
+    assert response.status_code == 200
+    assert response.json()["sub"] == "42"
+
+def test_active_user_enabled_without_loader(monkeypatch):
+    """Must skip the account checks instead of failing when the cache has no loader."""
+    monkeypatch.setattr(get_settings().principals, "enabled", True)
+
+    assert _client().get("/me", headers=_bearer()).status_code == 200
+
+def test_require_roles_accepts_api_keys(monkeypatch):
+    """Must authorize an API-key principal by the role of its record."""
+    authenticator = APIKeyAuthenticator("test-secret-with-some-length")
+    key, prefix, digest = authenticator.generate()
+    records = {prefix: APIKeyRecord(prefix, digest, subject="svc-1", role="reporter")}
+
+    async def loader(p):
+        return records.get(p)
+
+    authenticator.loader = loader
+    monkeypatch.setattr(apikey_store, "_authenticator", authenticator)
+    monkeypatch.setattr(dependencies.optional_api_key_bearer, "enabled", True)
+
+    app = FastAPI()
+    app.add_middleware(ExceptionParserMiddleware)
+
+    @app.get("/reports")
+    async def reports(principal: dict = Depends(require_roles("reporter"))):
+        return {"sub": principal["sub"]}
+
+    @app.get("/admin")
+    async def admin(principal: dict = Depends(require_roles("admin"))):
+        return {"sub": principal["sub"]}
+
+    client = TestClient(app)
+    assert client.get("/reports", headers={"X-API-Key": key}).json() == {"sub": "svc-1"}
+    assert client.get("/admin", headers={"X-API-Key": key}).status_code == 403
+    assert client.get("/reports", headers=_bearer(role="reporter")).status_code == 200
+
+def test_require_roles_ignores_api_key_while_disabled():
+    """Must authorize by the bearer token when a stray API key header is sent with keys disabled."""
+    app = FastAPI()
+    app.add_middleware(ExceptionParserMiddleware)
+
+    @app.get("/reports")
+    async def reports(principal: dict = Depends(require_roles("reporter"))):
+        return {"sub": principal["sub"]}
+
+    client = TestClient(app)
+    headers = {**_bearer(role="reporter"), "X-API-Key": "stray"}
+    assert client.get("/reports", headers=headers).json() == {"sub": "42"}
+    assert client.get("/reports", headers={"X-API-Key": "stray"}).status_code == 401
+
+    schemes = app.openapi()["components"]["securitySchemes"]
+    assert {"APIKeyBearer", "JWTBearer"} <= set(schemes)
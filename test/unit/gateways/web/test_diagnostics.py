@@ -0,0 +1,57 @@
+import asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.elemental.diagnostics import MemoryTracer
+from app.elemental.metrics import get_metrics_registry
+from app.elemental.security.tokens import ElementalTokenTypes, get_token_codec
+from app.gateways.web.middlewares.responses.exceptions import ExceptionParserMiddleware
+from app.gateways.web.middlewares.responses.success import SuccessParserMiddleware
+from app.gateways.web.routers.diagnostics import diagnostics_router
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SuccessParserMiddleware)
+    app.add_middleware(ExceptionParserMiddleware)
+    app.include_router(diagnostics_router)
+    return TestClient(app)
+
+def _bearer(role: str) -> dict:
+    token = get_token_codec().encode({"sub": "1", "role": role}, ElementalTokenTypes.ACCESS)
+    return {"Authorization": f"Bearer {token}"}
+
+def test_metrics_exposition():
+    """Must serve the registry in the Prometheus text format to admins."""
+    get_metrics_registry().counter("test_scrapes_total", "Scrapes seen by the test.").inc()
+
+    response = _client().get("/diagnostics/metrics", headers=_bearer("admin"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE test_scrapes_total counter" in response.text
+    assert "test_scrapes_total 1.0" in response.text
+
+def test_metrics_require_admin():
+    """Must refuse principals without an admin role."""
+    assert _client().get("/diagnostics/metrics", headers=_bearer("user")).status_code == 403
+
+def test_memory_snapshots_run_off_the_event_loop(monkeypatch):
+    """Must take and group snapshots in a worker thread, not on the event loop."""
+    calls = []
+
+    def _record(self, *args):
+        try:
+            asyncio.get_running_loop()
+            calls.append("loop")
+        except RuntimeError:
+            calls.append("thread")
+        return {}
+
+    for method in ("take", "top", "diff"):
+        monkeypatch.setattr(MemoryTracer, method, _record)
+
+    client = _client()
+    headers = _bearer("admin")
+    assert client.post("/diagnostics/memory/snapshots/a", headers=headers).status_code == 200
+    assert client.get("/diagnostics/memory/snapshots/a", headers=headers).status_code == 200
+    assert client.get("/diagnostics/memory/diff?base=a&target=a", headers=headers).status_code == 200
+    assert calls == ["thread"] * 3
@@ -0,0 +1,66 @@
+import time
+import signal
+import asyncio
+import logging
+import uvicorn
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.elemental.settings import WebApplication
+from app.elemental.tasks import get_background_tasks
+from app.gateways.web.lifespan.drain import drain_application
+from app.gateways.web.middlewares import get_inflight_tracker
+from app.gateways.web.middlewares.inflight import InFlightRequestsMiddleware
+from app.gateways.web.workers import DrainingServer, WorkerSupervisor, server_config
+from app.infrastructure.email import send_email_in_background
+
+def test_signal_closes_the_admission_gate():
+    """Must refuse new requests from the moment the shutdown signal arrives."""
+    app = FastAPI()
+    app.add_middleware(InFlightRequestsMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return True
+
+    tracker = get_inflight_tracker()
+    tracker.reset()
+    client = TestClient(app)
+    assert client.get("/ping").status_code == 200
+
+    server = DrainingServer(uvicorn.Config(app))
+    server.handle_exit(signal.SIGTERM, None)
+    try:
+        assert server.should_exit and tracker.draining
+        response = client.get("/ping")
+        assert response.status_code == 503
+        assert response.headers["Connection"] == "close"
+    finally:
+        tracker.reset()
+
+def test_one_setting_bounds_the_shutdown():
+    """Must derive uvicorn's and the supervisor's timeouts from `shutdown.grace_period`."""
+    settings = WebApplication(shutdown={"grace_period": 7.5})
+
+    assert server_config("app:app", settings).timeout_graceful_shutdown == 8
+    assert WorkerSupervisor(settings).kill_timeout == 7.5 + WorkerSupervisor.CLOSE_MARGIN
+
+async def test_drain_counts_from_the_signal():
+    """Must give background work only the grace period left since draining started."""
+    tracker = get_inflight_tracker()
+    tracker.reset()
+    tracker.start_draining()
+    tracker.drain_started -= 0.2
+
+    class _Service:
+        async def send(self, **_):
+            await asyncio.sleep(10)
+
+    task = send_email_in_background(_Service(), "welcome", {}, ["user@example.com"])
+    assert get_background_tasks().pending == 1
+    try:
+        started = time.monotonic()
+        await drain_application(0.25, logging.getLogger("test.draining"))
+        assert time.monotonic() - started < 0.2
+        assert task.cancelled() and get_background_tasks().pending == 0
+    finally:
+        tracker.reset()
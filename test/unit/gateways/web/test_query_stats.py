@@ -0,0 +1,37 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.gateways.web.middlewares.queries import QueryStatsMiddleware
+from app.gateways.web.middlewares.responses.success import SuccessParserMiddleware
+from app.infrastructure.database.sql import get_query_stats
+from app.infrastructure.database.sql.instrumentation import QueryInstrumentation
+
+def _client(header: bool) -> TestClient:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    QueryInstrumentation().install(engine.sync_engine)
+
+    app = FastAPI()
+    app.add_middleware(SuccessParserMiddleware)
+    app.add_middleware(QueryStatsMiddleware, header=header)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        async with engine.connect() as conn:
+            for _ in range(2):
+                await conn.execute(text("SELECT 1"))
+        return {"route": get_query_stats().route}
+
+    return TestClient(app)
+
+def test_header_in_debug():
+    """Must report the request's query count and time through the enveloped response."""
+    response = _client(header=True).get("/items/7")
+
+    assert response.headers["X-DB-Query-Count"] == "2"
+    assert float(response.headers["X-DB-Query-Time"]) >= 0
+    assert response.json()["data"]["route"] == "GET /items/{item_id}"
+
+def test_no_header_by_default():
+    """Must leave the response untouched without debug."""
+    assert "X-DB-Query-Count" not in _client(header=False).get("/items/7").headers
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.gateways.web.middlewares.responses.success import SuccessParserMiddleware
+from app.gateways.web.streaming import RowStreamResponse
+
+async def _rows(count, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("cursor lost")
+        yield {"id": i, "at": datetime(2026, 1, 1)}
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SuccessParserMiddleware)
+
+    @app.get("/export.json")
+    async def export_json(count: int = 3, fail_at: int = None):
+        return RowStreamResponse(_rows(count, fail_at), chunk_size=16)
+
+    @app.get("/export.ndjson")
+    async def export_ndjson(count: int = 3, fail_at: int = None):
+        return RowStreamResponse(_rows(count, fail_at), format="ndjson")
+
+    return TestClient(app)
+
+def test_json_array_with_envelope():
+    """Must stream rows inside the standard envelope, bypassing the success parser."""
+    body = _client().get("/export.json").json()
+
+    assert body["success"] is True and body["error"] is None
+    assert body["path"] == "/export.json" and body["method"] == "GET"
+    assert body["data"] == [{"id": i, "at": "2026-01-01T00:00:00"} for i in range(3)]
+    assert "data" not in body["data"][0]
+
+def test_json_array_reports_failure():
+    """Must close the document and report an error raised mid-stream."""
+    body = _client().get("/export.json", params={"count": 5, "fail_at": 2}).json()
+
+    assert body["success"] is False
+    assert body["error"]["code"] == "STREAM_ABORTED"
+    assert [row["id"] for row in body["data"]] == [0, 1]
+
+def test_ndjson_lines():
+    """Must write one JSON document per line."""
+    response = _client().get("/export.ndjson", params={"count": 4})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 3]
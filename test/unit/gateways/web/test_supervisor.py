@@ -0,0 +1,77 @@
+import os
+from types import SimpleNamespace
+from app.elemental.settings import WebApplication
+from app.gateways.web.workers import supervisor as supervisor_module
+from app.gateways.web.workers.supervisor import WorkerSupervisor, _Worker, read_process_rss
+
+def _supervisor(**workers) -> WorkerSupervisor:
+    return WorkerSupervisor(WebApplication(workers=workers))
+
+def _worker(requests: int = 0, max_requests=None, started_at: float = 0.0) -> _Worker:
+    return _Worker(
+        slot=0,
+        process=SimpleNamespace(pid=os.getpid(), is_alive=lambda: True, exitcode=None),
+        request_counter=SimpleNamespace(value=requests),
+        max_requests=max_requests,
+        started_at=started_at
+    )
+
+def test_recycle_reason_by_requests():
+    """Must recycle once the request count reaches the worker's own limit."""
+    supervisor = _supervisor(max_requests=100)
+
+    assert supervisor.recycle_reason(_worker(requests=99, max_requests=100)) is None
+    assert supervisor.recycle_reason(_worker(requests=100, max_requests=100))[0] == "requests"
+
+def test_recycle_reason_by_rss(monkeypatch):
+    """Must recycle a worker whose RSS is above the limit, and ignore an unknown RSS."""
+    supervisor = _supervisor(max_rss_mb=100)
+
+    monkeypatch.setattr(supervisor_module, "read_process_rss", lambda pid: 101 * 1024 * 1024)
+    assert supervisor.recycle_reason(_worker())[0] == "rss"
+
+    monkeypatch.setattr(supervisor_module, "read_process_rss", lambda pid: 99 * 1024 * 1024)
+    assert supervisor.recycle_reason(_worker()) is None
+
+    monkeypatch.setattr(supervisor_module, "read_process_rss", lambda pid: None)
+    assert supervisor.recycle_reason(_worker()) is None
+
+def test_recycle_reason_by_age(monkeypatch):
+    """Must recycle a worker that has run longer than the maximum age."""
+    supervisor = _supervisor(max_age_seconds=60)
+    monkeypatch.setattr(WorkerSupervisor, "_now", staticmethod(lambda: 1000.0))
+
+    assert supervisor.recycle_reason(_worker(started_at=950.0)) is None
+    assert supervisor.recycle_reason(_worker(started_at=900.0))[0] == "age"
+
+def test_max_requests_jitter_bounds():
+    """Must give each worker a limit between max_requests and max_requests + jitter."""
+    supervisor = _supervisor(max_requests=1000, max_requests_jitter=50)
+    limits = {supervisor._max_requests_for_worker() for _ in range(500)}
+
+    assert min(limits) >= 1000 and max(limits) <= 1050
+    assert len(limits) > 1
+    assert _supervisor()._max_requests_for_worker() is None
+
+def test_check_workers_replaces_exited_and_recycles(monkeypatch):
+    """Must respawn exited workers and recycle one worker at a time."""
+    supervisor = _supervisor(max_requests=10)
+    spawned, terminated = [], []
+    monkeypatch.setattr(supervisor, "_spawn", lambda slot: spawned.append(slot))
+    monkeypatch.setattr(supervisor, "_terminate", lambda worker: terminated.append(worker.slot))
+
+    dead = _worker()
+    dead.slot, dead.process = 0, SimpleNamespace(pid=1, is_alive=lambda: False, exitcode=1)
+    busy = [_worker(requests=10, max_requests=10) for _ in range(2)]
+    busy[0].slot, busy[1].slot = 1, 2
+    supervisor._workers = {0: dead, 1: busy[0], 2: busy[1]}
+
+    supervisor._check_workers()
+
+    assert spawned == [0, 1] and terminated == [1]
+    assert supervisor.recycle_counts == {"exited": 1, "requests": 1}
+
+def test_read_process_rss():
+    """Must read this process's RSS and return None for a pid that does not exist."""
+    assert read_process_rss(os.getpid()) > 0
+    assert read_process_rss(2 ** 31 - 1) is None
@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+@pytest.fixture
+async def engine(request):
+    """In-memory SQLite engine holding the tables of the test module's `_Base`, when it has one."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    base = getattr(request.module, "_Base", None)
+    if base is not None:
+        async with engine.begin() as conn:
+            await conn.run_sync(base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+@pytest.fixture
+def statements(engine) -> list:
+    """SQL text of every statement the engine executes after the tables exist."""
+    recorded = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: recorded.append(args[2]))
+    return recorded
+
+@pytest.fixture
+def session_factory(engine) -> async_sessionmaker:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
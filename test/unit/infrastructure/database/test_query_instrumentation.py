@@ -0,0 +1,56 @@
+import logging
+import pytest
+from sqlalchemy import text
+from app.infrastructure.database.sql import get_query_stats, track_queries
+from app.infrastructure.database.sql.instrumentation import QueryInstrumentation, parameter_shape
+
+def _instrument(engine, **options):
+    logger = logging.getLogger("test.query_instrumentation")
+    instrumentation = QueryInstrumentation(logger=logger, **options)
+    instrumentation.install(engine.sync_engine)
+    return instrumentation
+
+async def test_counts_queries_per_request(engine):
+    """Must accumulate count and time of the statements run inside `track_queries`."""
+    _instrument(engine)
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with track_queries({"method": "GET", "path": "/things"}) as stats:
+            assert get_query_stats() is stats
+            for _ in range(3):
+                await conn.execute(text("SELECT 2"))
+
+    assert get_query_stats() is None
+    assert stats.count == 3 and stats.duration > 0
+    assert stats.templates == {"SELECT 2": 3}
+
+async def test_flags_repeated_statements_once(engine, caplog):
+    """Must log a statement repeated within one request as an N+1 suspect, once."""
+    _instrument(engine, n_plus_one_threshold=3)
+    with caplog.at_level(logging.WARNING, logger="test.query_instrumentation"):
+        async with engine.connect() as conn:
+            with track_queries({"method": "GET", "path": "/orders"}) as stats:
+                for i in range(6):
+                    await conn.execute(text("SELECT :id"), {"id": i})
+
+    assert stats.suspects == {"SELECT ?"}
+    suspects = [record.getMessage() for record in caplog.records if "N+1" in record.getMessage()]
+    assert len(suspects) == 1 and "GET /orders" in suspects[0]
+
+async def test_logs_slow_queries_without_values(engine, caplog):
+    """Must log slow statements with the route and parameter types, never the values."""
+    _instrument(engine, slow_threshold=0)
+    with caplog.at_level(logging.WARNING, logger="test.query_instrumentation"):
+        async with engine.connect() as conn:
+            with track_queries({"method": "POST", "path": "/login"}):
+                await conn.execute(text("SELECT :secret, :n"), {"secret": "hunter2", "n": 1})
+
+    message = caplog.records[-1].getMessage()
+    assert "Slow query" in message and "POST /login" in message
+    assert "(str, int)" in message and "hunter2" not in message
+
+def test_parameter_shape():
+    """Must describe parameters by type, collapsing runs and batches."""
+    assert parameter_shape({"a": 1, "b": "x"}) == "{a: int, b: str}"
+    assert parameter_shape(("x",) * 4 + (1,)) == "(str*4, int)"
+    assert parameter_shape([(1,), (2,)], executemany=True) == "2 x (int)"
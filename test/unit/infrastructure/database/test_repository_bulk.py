@@ -0,0 +1,152 @@
+import uuid
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import String, func, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession, async_sessionmaker
+from app.elemental.exceptions import DuplicateError, ValidationError
+from app.gateways.web.streaming import RowStreamResponse
+from app.infrastructure.database.sql import ElementalRepository, get_session_dependency
+from app.infrastructure.database.sql import manager
+from app.infrastructure.database.sql.orm import repository as repository_module
+
+class _Base(DeclarativeBase):
+    pass
+
+class Product(_Base):
+    __tablename__ = "products"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    sku: Mapped[str] = mapped_column(String(32), unique=True)
+    name: Mapped[str] = mapped_column(String(64))
+
+class Member(_Base):
+    __tablename__ = "members"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    subject: Mapped[str] = mapped_column(String(36))
+
+class MemberRepository(ElementalRepository):
+    principal_key = "subject"
+
+async def _count(session) -> int:
+    return await session.scalar(select(func.count()).select_from(Product))
+
+async def test_bulk_create_returns_rows(session, statements):
+    """Must insert in one statement per chunk and return generated ids."""
+    repository = ElementalRepository(Product, session)
+
+    created = await repository._bulk_create(
+        [{"sku": f"sku-{i}", "name": f"Product {i}"} for i in range(25)] + [Product(sku="extra", name="Extra")],
+        chunk_size=10
+    )
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 3
+    assert len(created) == 26 and all(product.id for product in created)
+    assert await _count(session) == 26
+
+async def test_bulk_create_reports_failed_chunk(session):
+    """Must roll back every chunk and name the one that failed."""
+    repository = ElementalRepository(Product, session)
+    rows = [{"sku": f"sku-{i}", "name": "x"} for i in range(10)] + [{"sku": "sku-0", "name": "dup"}]
+
+    with pytest.raises(DuplicateError) as error:
+        await repository._bulk_create(rows, chunk_size=5)
+
+    assert error.value.details["chunk"] == 2
+    assert error.value.details["offset"] == 10
+    assert await _count(session) == 0
+
+async def test_bulk_update_and_delete(session):
+    """Must update by primary key and delete by id list."""
+    repository = ElementalRepository(Product, session)
+    created = await repository._bulk_create([{"sku": f"sku-{i}", "name": "old"} for i in range(6)])
+
+    updated = await repository._bulk_update([{"id": product.id, "name": "new"} for product in created[:4]], chunk_size=3)
+    assert updated == 4
+    names = (await session.scalars(select(Product.name).order_by(Product.sku))).all()
+    assert names == ["new"] * 4 + ["old"] * 2
+
+    with pytest.raises(ValidationError):
+        await repository._bulk_update([{"name": "no id"}])
+
+    deleted = await repository._bulk_delete([product.id for product in created[:5]], chunk_size=2)
+    assert deleted == 5
+    assert await _count(session) == 1
+
+async def test_stream_yields_every_row(session):
+    """Must yield all rows in batches and release them from the session."""
+    repository = ElementalRepository(Product, session)
+    await repository._bulk_create([{"sku": f"sku-{i}", "name": "x"} for i in range(23)])
+    session.expunge_all()
+
+    seen = [product.sku async for product in repository._stream(batch_size=5)]
+
+    assert sorted(seen) == sorted(f"sku-{i}" for i in range(23))
+    assert len(session.identity_map) == 0
+
+async def test_stream_closes_cursor_when_stopped_early(session, monkeypatch):
+    """Must close the result when the consumer stops before the last row."""
+    closed = []
+    close = AsyncResult.close
+
+    async def _close(self):
+        closed.append(self)
+        await close(self)
+
+    monkeypatch.setattr(AsyncResult, "close", _close)
+    repository = ElementalRepository(Product, session)
+    await repository._bulk_create([{"sku": f"sku-{i}", "name": "x"} for i in range(10)])
+
+    rows = repository._stream(batch_size=2)
+    await anext(rows)
+    await rows.aclose()
+
+    assert len(closed) == 1
+
+async def test_stream_through_session_dependency(engine, monkeypatch):
+    """Must keep the request's session open until the streamed body has been sent."""
+    events = []
+
+    class _Session(AsyncSession):
+        async def close(self):
+            events.append("close")
+            await super().close()
+
+    factory = async_sessionmaker(engine, class_=_Session, expire_on_commit=False)
+    monkeypatch.setattr(manager, "_session_factory", factory)
+    async with factory() as session:
+        await ElementalRepository(Product, session)._bulk_create([{"sku": f"sku-{i}", "name": "x"} for i in range(5)])
+    events.clear()
+
+    def _serialize(product):
+        events.append("row")
+        return {"sku": product.sku}
+
+    app = FastAPI()
+
+    @app.get("/products")
+    async def export(session: AsyncSession = Depends(get_session_dependency)):
+        return RowStreamResponse(ElementalRepository(Product, session)._stream(batch_size=2), serialize=_serialize)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/products")
+
+    assert len(response.json()["data"]) == 5
+    assert events[:5] == ["row"] * 5 and "close" in events[5:]
+
+@pytest.mark.parametrize("returning", [True, False])
+async def test_bulk_delete_invalidates_principals(session, monkeypatch, returning):
+    """Must invalidate the deleted rows' principals by `principal_key`, not by id."""
+    invalidated = []
+    monkeypatch.setattr(repository_module, "invalidate_principal", invalidated.append)
+    monkeypatch.setattr(session.get_bind().dialect, "delete_returning", returning)
+    repository = MemberRepository(Member, session)
+    members = await repository._bulk_create([{"subject": f"user-{i}"} for i in range(4)])
+    invalidated.clear()
+
+    deleted = await repository._bulk_delete([member.id for member in members[:3]] + ["missing"], chunk_size=2)
+
+    assert deleted == 3
+    assert sorted(invalidated) == ["user-0", "user-1", "user-2"]
@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import String, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.elemental.security.policies import Owner, Policy
+from app.infrastructure.database.sql import ElementalRepository, get_count_cache
+
+class _Base(DeclarativeBase):
+    pass
+
+class Ticket(_Base):
+    __tablename__ = "tickets"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_by: Mapped[str] = mapped_column(String(36), index=True)
+
+class TicketRepository(ElementalRepository):
+    policy = Policy("tickets", read=Owner())
+
+@pytest.fixture
+async def context(session, statements):
+    get_count_cache().clear()
+    session.add_all(Ticket(id=f"{i:03d}", created_by="alice" if i % 3 else "bob") for i in range(30))
+    await session.commit()
+    statements.clear()
+    yield TicketRepository(Ticket, session), statements
+    get_count_cache().clear()
+
+async def test_page_and_total_in_one_query(context):
+    """Must return rows and total from a single statement, then reuse the cached total."""
+    repository, statements = context
+
+    page = await repository._get_page_with_total(page=2, page_size=4, principal={"sub": "alice"})
+    assert len(statements) == 1 and "OVER ()" in statements[0]
+    assert page.total == 20 and page.pages == 5 and len(page.items) == 4
+
+    statements.clear()
+    again = await repository._get_page_with_total(page=3, page_size=4, principal={"sub": "alice"})
+    assert again.total == 20
+    assert len(statements) == 1 and "OVER" not in statements[0]
+
+    other = await repository._get_page_with_total(page=1, page_size=4, principal={"sub": "bob"})
+    assert other.total == 10
+
+async def test_total_past_last_page(context):
+    """Must still report the total when the page is empty."""
+    repository, _ = context
+    page = await repository._get_page_with_total(page=50, page_size=10, count="exact")
+    assert page.items == [] and page.total == 30
+
+async def test_estimated_count_from_statistics(context):
+    """Must use planner statistics when available and exact counts otherwise."""
+    repository, _ = context
+
+    page = await repository._get_page_with_total(page=1, page_size=5, count="estimated")
+    assert page.total == 30 and not page.estimated
+
+    await repository.session.execute(text("ANALYZE"))
+    get_count_cache().clear()
+    page = await repository._get_page_with_total(page=1, page_size=5, count="estimated")
+    assert page.total == 30 and page.estimated
+
+async def test_writes_invalidate_cached_totals(context):
+    """Must drop cached totals when the table is written through the repository."""
+    repository, _ = context
+    assert (await repository._get_page_with_total()).total == 30
+
+    await repository._bulk_delete(["000", "001"])
+    assert (await repository._get_page_with_total()).total == 28
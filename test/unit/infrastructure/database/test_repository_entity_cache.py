@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import String, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.infrastructure.database.sql import ElementalCachedMixin, ElementalRepository, EntityCache
+from app.infrastructure.database.sql.orm import entity_cache
+
+class _Base(DeclarativeBase):
+    pass
+
+class Country(ElementalCachedMixin, _Base):
+    __tablename__ = "countries"
+    id: Mapped[str] = mapped_column(String(2), primary_key=True)
+    name: Mapped[str] = mapped_column(String(64))
+
+@pytest.fixture
+async def context(monkeypatch, session_factory, statements):
+    monkeypatch.setattr(entity_cache, "_cache", EntityCache())
+    async with session_factory() as session:
+        session.add_all([Country(id="ar", name="Argentina"), Country(id="cl", name="Chile")])
+        await session.commit()
+    statements.clear()
+    return session_factory, statements
+
+async def test_second_session_is_served_from_cache(context):
+    """Must rebuild a cached row in another session without querying."""
+    factory, statements = context
+    async with factory() as session:
+        assert (await ElementalRepository(Country, session)._get_by_id("ar")).name == "Argentina"
+    statements.clear()
+
+    async with factory() as session:
+        country = await ElementalRepository(Country, session)._get_by_id("ar")
+        assert country.name == "Argentina" and country in session
+        assert statements == []
+
+        # The rebuilt instance is persistent: changes to it flush as an UPDATE.
+        country.name = "Argentine Republic"
+        await session.commit()
+    assert any(statement.startswith("UPDATE") for statement in statements)
+
+async def test_missing_ids_are_cached(context):
+    """Must cache a miss and forget it once the row is created."""
+    factory, statements = context
+    async with factory() as session:
+        repository = ElementalRepository(Country, session)
+        assert await repository._get_by_id("uy") is None
+        assert await repository._get_by_id("uy") is None
+        assert len(statements) == 1
+
+        await repository._create(Country(id="uy", name="Uruguay"))
+
+    async with factory() as session:
+        assert (await ElementalRepository(Country, session)._get_by_id("uy")).name == "Uruguay"
+
+async def test_writes_invalidate_after_commit(context):
+    """Must drop entries written through the session or by UPDATE statements."""
+    factory, _ = context
+    async with factory() as session:
+        repository = ElementalRepository(Country, session)
+        country = await repository._get_by_id("ar")
+        country.name = "Changed"
+        await repository._update(country)
+        await repository._get_by_id("cl")
+        await repository._update_fields("cl", {"name": "Chile (updated)"})
+
+    async with factory() as session:
+        repository = ElementalRepository(Country, session)
+        assert (await repository._get_by_id("ar")).name == "Changed"
+        assert (await repository._get_by_id("cl")).name == "Chile (updated)"
+
+async def test_bypassed_inside_a_write(context):
+    """Must read through to the database while the session has flushed writes."""
+    factory, statements = context
+    async with factory() as session:
+        await ElementalRepository(Country, session)._get_by_id("ar")
+
+    async with factory() as session:
+        session.add(Country(id="pe", name="Peru"))
+        await session.flush()
+        statements.clear()
+        assert (await ElementalRepository(Country, session)._get_by_id("ar")).name == "Argentina"
+        assert len(statements) == 1
+
+async def test_bypassed_after_statement_write(context):
+    """Must read through once the transaction ran an UPDATE statement outside the unit of work."""
+    factory, _ = context
+    async with factory() as session:
+        await ElementalRepository(Country, session)._get_by_id("ar")
+
+    async with factory() as session:
+        await session.execute(update(Country).where(Country.id == "ar").values(name="Changed"))
+        assert (await ElementalRepository(Country, session)._get_by_id("ar")).name == "Changed"
+
+async def test_fill_loses_to_concurrent_invalidation(context):
+    """Must not cache a row loaded before a write that committed while the load ran."""
+    factory, _ = context
+    async with factory() as session:
+        load = session.get
+
+        async def get_then_write(*args, **kwargs):
+            instance = await load(*args, **kwargs)
+            async with factory() as writer:
+                await ElementalRepository(Country, writer)._update_fields("ar", {"name": "Changed"})
+            return instance
+
+        session.get = get_then_write
+        assert (await ElementalRepository(Country, session)._get_by_id("ar")).name == "Argentina"
+
+    async with factory() as session:
+        assert (await ElementalRepository(Country, session)._get_by_id("ar")).name == "Changed"
+
+def test_lru_is_bounded_by_size():
+    """Must evict the least recently used entries past `max_bytes`."""
+    cache = EntityCache(max_bytes=1024)
+    for i in range(100):
+        cache.put(Country, str(i), Country(id=str(i), name="x" * 20))
+
+    assert 0 < len(cache) < 100 and cache.size <= 1024
+    assert cache.get(Country, "99")[0] and not cache.get(Country, "0")[0]
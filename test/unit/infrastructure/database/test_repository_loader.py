@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.infrastructure.database.sql import ElementalRepository
+
+class _Base(DeclarativeBase):
+    pass
+
+class Author(_Base):
+    __tablename__ = "authors"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    name: Mapped[str] = mapped_column(String(64))
+
+@pytest.fixture
+async def context(session, statements):
+    session.add_all(Author(id=str(i), name=f"Author {i}") for i in range(5))
+    await session.commit()
+    statements.clear()
+    return ElementalRepository(Author, session), statements
+
+async def test_concurrent_loads_share_one_query(context):
+    """Must batch and de-duplicate loads issued in the same tick."""
+    repository, statements = context
+
+    authors = await asyncio.gather(*(repository._load(object_id) for object_id in ["1", "3", "1", "9", "0"]))
+
+    assert [author.name if author else None for author in authors] == [
+        "Author 1", "Author 3", "Author 1", None, "Author 0"
+    ]
+    assert len(statements) == 1 and " IN (" in statements[0]
+
+async def test_loads_are_memoized(context):
+    """Must serve repeated ids, including misses, without querying again."""
+    repository, statements = context
+
+    await repository._load_many(["1", "2", "missing"])
+    again = await repository._load_many(["2", "missing"])
+
+    assert again[0].name == "Author 2" and again[1] is None
+    assert len(statements) == 1
+
+async def test_writes_clear_the_memo(context):
+    """Must reload after the model is written through the repository."""
+    repository, statements = context
+    assert (await repository._load("1")).name == "Author 1"
+
+    await repository._update_fields("1", {"name": "Renamed"})
+    statements.clear()
+    assert (await repository._load("1")).name == "Renamed"
+    assert len(statements) == 1
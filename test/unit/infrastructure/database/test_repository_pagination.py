@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+import pytest
+from pydantic import SecretStr
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.elemental.exceptions import ConfigurationError, ValidationError
+from app.elemental.settings import get_settings
+from app.infrastructure.database.sql import (
+    CursorCodec,
+    DatabaseSettings,
+    ElementalRepository,
+    close_database,
+    init_database
+)
+from app.infrastructure.database.sql.orm import pagination
+
+class _Base(DeclarativeBase):
+    pass
+
+class Event(_Base):
+    __tablename__ = "events"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+
+@pytest.fixture
+async def repository(monkeypatch, session):
+    monkeypatch.setattr(pagination, "_codec", CursorCodec("cursor-test-secret"))
+    start = datetime(2026, 1, 1)
+    # Pairs of rows share a timestamp, so the id has to break ties.
+    session.add_all(Event(id=f"{i:03d}", created_at=start + timedelta(minutes=i // 2)) for i in range(25))
+    await session.commit()
+    return ElementalRepository(Event, session)
+
+async def test_forward_and_backward(repository):
+    """Must walk every row once forward and return to the same pages backward."""
+    pages = [await repository._get_page(limit=10)]
+    while pages[-1].has_next:
+        pages.append(await repository._get_page(limit=10, cursor=pages[-1].next_cursor))
+
+    ids = [event.id for page in pages for event in page.items]
+    assert ids == [f"{i:03d}" for i in range(25)]
+    assert not pages[0].has_prev and pages[1].has_prev
+
+    back = await repository._get_page(limit=10, cursor=pages[2].prev_cursor)
+    assert [event.id for event in back.items] == [event.id for event in pages[1].items]
+    first = await repository._get_page(limit=10, cursor=back.prev_cursor)
+    assert [event.id for event in first.items] == [event.id for event in pages[0].items]
+    assert not first.has_prev and first.has_next
+
+async def test_tampered_cursor_rejected(repository):
+    """Must reject cursors that were modified or signed with another key."""
+    page = await repository._get_page(limit=5)
+    body, signature = page.next_cursor.split(".")
+
+    with pytest.raises(ValidationError):
+        await repository._get_page(limit=5, cursor=body[:-2] + "AA." + signature)
+    with pytest.raises(ValidationError):
+        await repository._get_page(limit=5, cursor=CursorCodec("other").encode("events:created_at,id", "next", ["x"]))
+
+async def test_missing_cursor_key_fails_at_startup(monkeypatch):
+    """Must refuse to initialize the database when no key can sign cursors."""
+    monkeypatch.setattr(pagination, "_codec", None)
+    monkeypatch.setattr(get_settings().jwt, "secret_key", None)
+    settings = DatabaseSettings(driver="sqlite+aiosqlite", host="", name=":memory:", user="", password="")
+
+    with pytest.raises(ConfigurationError):
+        await init_database(settings)
+
+    await init_database(settings.model_copy(update={"cursor_secret": SecretStr("cursor-test-secret")}))
+    await close_database()
+    assert pagination._codec is not None
+
+def test_default_cursor_key_is_not_the_jwt_secret(monkeypatch):
+    """Must sign default cursors with a key derived from, not equal to, the JWT secret."""
+    monkeypatch.setattr(pagination, "_codec", None)
+    monkeypatch.setattr(get_settings().jwt, "secret_key", SecretStr("jwt-test-secret"))
+    cursor = pagination.get_cursor_codec().encode("events", "next", ["001"])
+
+    with pytest.raises(ValidationError):
+        CursorCodec("jwt-test-secret").decode("events", cursor)
+    assert CursorCodec(pagination.derive_cursor_secret("jwt-test-secret")).decode("events", cursor)[1] == ["001"]
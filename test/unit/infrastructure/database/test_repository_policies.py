@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.elemental.security.policies import HasRole, Owner, Policy
+from app.infrastructure.database.sql import ElementalRepository
+
+class _Base(DeclarativeBase):
+    pass
+
+class Document(_Base):
+    __tablename__ = "documents"
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_by: Mapped[str] = mapped_column(String(36))
+
+class DocumentRepository(ElementalRepository):
+    policy = Policy("documents", read=Owner() | HasRole("auditor"))
+
+@pytest.fixture(autouse=True)
+async def documents(session):
+    session.add_all([
+        Document(id="1", created_by="alice"),
+        Document(id="2", created_by="bob"),
+        Document(id="3", created_by="alice"),
+    ])
+    await session.commit()
+
+async def test_get_all_filters_in_sql(session):
+    """Must only return rows the principal may read."""
+    repository = DocumentRepository(Document, session)
+
+    mine = await repository._get_all(page=1, page_size=10, principal={"sub": "alice"})
+    assert sorted(doc.id for doc in mine) == ["1", "3"]
+
+    everything = await repository._get_all(page=1, page_size=10, principal={"sub": "x", "role": "auditor"})
+    assert len(everything) == 3
+
+    assert len(await repository._get_all(page=1, page_size=10)) == 3
+
+async def test_get_by_id_hides_foreign_rows(session):
+    """Must read rows outside the policy as missing."""
+    repository = DocumentRepository(Document, session)
+
+    assert await repository._get_by_id("2", principal={"sub": "alice"}) is None
+    assert (await repository._get_by_id("2", principal={"sub": "bob"})).id == "2"
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import String, func, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from app.elemental.exceptions import DuplicateError, ValidationError
+from app.infrastructure.database.sql import ElementalRepository, ElementalTimestampMixin, ElementalUUIDMixin
+
+class _Base(DeclarativeBase):
+    pass
+
+class Subscriber(_Base, ElementalUUIDMixin, ElementalTimestampMixin):
+    __tablename__ = "subscribers"
+    email: Mapped[str] = mapped_column(String(64), unique=True)
+    name: Mapped[str] = mapped_column(String(64))
+
+@pytest.fixture
+def context(session, statements):
+    return ElementalRepository(Subscriber, session), statements
+
+async def test_upsert_inserts_then_updates(context):
+    """Must insert once and update the same row on a unique-column conflict."""
+    repository, statements = context
+
+    created = await repository._upsert({"email": "a@x.io", "name": "A"})
+    statements.clear()
+    updated = await repository._upsert({"email": "a@x.io", "name": "B"})
+
+    assert len(statements) == 1 and "ON CONFLICT (email) DO UPDATE" in statements[0]
+    assert "updated_at" in statements[0]
+    assert updated.id == created.id and updated.name == "B"
+    assert await repository.session.scalar(select(func.count()).select_from(Subscriber)) == 1
+
+async def test_insert_ignore(context):
+    """Must return None instead of failing when the row already exists."""
+    repository, _ = context
+
+    assert (await repository._insert_ignore({"email": "a@x.io", "name": "A"})).name == "A"
+    assert await repository._insert_ignore({"email": "a@x.io", "name": "Other"}) is None
+
+    with pytest.raises(ValidationError):
+        await repository._insert_ignore({"name": "no unique column"})
+
+async def test_uniqueness_probe_uses_exists(context):
+    """Must probe with SELECT EXISTS and exclude the record itself."""
+    repository, statements = context
+    subscriber = await repository._upsert({"email": "a@x.io", "name": "A"})
+
+    statements.clear()
+    assert await repository._check_uniqueness(None, "email", "a@x.io") is False
+    assert "EXISTS" in statements[0]
+    assert await repository._check_uniqueness(subscriber.id, "email", "a@x.io") is True
+    assert await repository._check_uniqueness(None, "email", "b@x.io") is True
+
+async def test_failed_upsert_rolls_back(context):
+    """Must leave the session usable after a constraint outside the conflict target fails."""
+    repository, _ = context
+    await repository._upsert({"email": "a@x.io", "name": "A"})
+
+    with pytest.raises(DuplicateError):
+        await repository._upsert({"id": "other", "email": "a@x.io", "name": "B"}, conflict_on=["id"])
+
+    assert not repository.session.in_transaction()
+    assert (await repository._upsert({"email": "b@x.io", "name": "B"})).name == "B"
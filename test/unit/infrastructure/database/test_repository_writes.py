@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import ForeignKey, String, select, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from app.elemental.exceptions import DuplicateError, NotFoundError
+from app.infrastructure.database.sql import ElementalRepository, ElementalTimestampMixin, ElementalUUIDMixin
+
+class _Base(DeclarativeBase):
+    pass
+
+class Account(_Base, ElementalUUIDMixin, ElementalTimestampMixin):
+    __tablename__ = "accounts"
+    email: Mapped[str] = mapped_column(String(64), unique=True)
+    name: Mapped[str] = mapped_column(String(64))
+
+class Project(_Base, ElementalUUIDMixin):
+    __tablename__ = "projects"
+    name: Mapped[str] = mapped_column(String(64))
+    owner_id: Mapped[Optional[str]] = mapped_column(ForeignKey("accounts.id"))
+    owner: Mapped[Optional[Account]] = relationship()
+
+@pytest.fixture
+def context(session_factory, statements):
+    return session_factory, statements
+
+async def test_create_is_one_statement(context):
+    """Must insert and read server defaults back in a single statement."""
+    factory, statements = context
+    async with factory() as session:
+        statements.clear()
+        account = await ElementalRepository(Account, session)._create(Account(email="a@x.io", name="A"))
+
+    assert len(statements) == 1 and "RETURNING" in statements[0]
+    assert account.created_at is not None and account.updated_at is not None
+
+async def test_update_fields_without_loading(context):
+    """Must update by id in one statement and return the fresh row."""
+    factory, statements = context
+    async with factory() as session:
+        account = await ElementalRepository(Account, session)._create(Account(email="a@x.io", name="A"))
+
+    async with factory() as session:
+        repository = ElementalRepository(Account, session)
+        statements.clear()
+        updated = await repository._update_fields(account.id, {"name": "B"})
+        assert len(statements) == 1 and statements[0].startswith("UPDATE")
+        assert updated.name == "B" and updated.updated_at is not None
+
+        assert await repository._update_fields("missing", {"name": "C"}) is None
+
+async def test_update_detached_instance(context):
+    """Must write a detached instance without the merge SELECT."""
+    factory, statements = context
+    async with factory() as session:
+        repository = ElementalRepository(Account, session)
+        account = await repository._create(Account(email="a@x.io", name="A"))
+        await repository._create(Account(email="b@x.io", name="B"))
+
+    account.name = "Renamed"
+    async with factory() as session:
+        repository = ElementalRepository(Account, session)
+        statements.clear()
+        updated = await repository._update(account)
+        assert len(statements) == 1
+        assert updated.name == "Renamed"
+
+        account.email = "b@x.io"
+        with pytest.raises(DuplicateError):
+            await repository._update(account)
+
+        await repository._delete(updated)
+        with pytest.raises(NotFoundError):
+            await repository._update(account)
+
+async def test_update_transient_instance_merges(context):
+    """Must insert a hand-built instance whose row does not exist, as merge does."""
+    factory, _ = context
+    async with factory() as session:
+        created = await ElementalRepository(Account, session)._update(Account(id="new", email="n@x.io", name="New"))
+        assert created.id == "new"
+
+    async with factory() as session:
+        assert (await session.get(Account, "new")).name == "New"
+
+async def test_update_detached_relationship_change(context):
+    """Must persist a relationship changed on a detached instance through merge."""
+    factory, _ = context
+    async with factory() as session:
+        alice = await ElementalRepository(Account, session)._create(Account(email="a@x.io", name="A"))
+        bob = await ElementalRepository(Account, session)._create(Account(email="b@x.io", name="B"))
+        project = await ElementalRepository(Project, session)._create(Project(name="P", owner=alice))
+
+    project.owner = bob
+    async with factory() as session:
+        await ElementalRepository(Project, session)._update(project)
+
+    async with factory() as session:
+        assert await session.scalar(select(Project.owner_id)) == bob.id
+
+async def test_delete_by_primary_key(context):
+    """Must delete with one statement and no prior load."""
+    factory, statements = context
+    async with factory() as session:
+        repository = ElementalRepository(Account, session)
+        first = await repository._create(Account(email="a@x.io", name="A"))
+        second = await repository._create(Account(email="b@x.io", name="B"))
+
+    async with factory() as session:
+        repository = ElementalRepository(Account, session)
+        statements.clear()
+        assert await repository._delete_by_id(first.id) is True
+        await repository._delete(second)
+        assert [statement.split()[0] for statement in statements] == ["DELETE", "DELETE"]
+
+        assert await repository._delete_by_id(first.id) is False
+        assert await session.get(Account, second.id) is None
+
+async def test_update_detached_sends_only_changes(context):
+    """Must write only modified columns, so `onupdate` timestamps still advance."""
+    factory, statements = context
+    async with factory() as session:
+        account = await ElementalRepository(Account, session)._create(Account(email="a@x.io", name="A"))
+        await session.execute(update(Account).values(updated_at=datetime(2000, 1, 1, tzinfo=timezone.utc)))
+        await session.commit()
+        account = await session.get(Account, account.id, populate_existing=True)
+
+    account.name = "Renamed"
+    async with factory() as session:
+        statements.clear()
+        updated = await ElementalRepository(Account, session)._update(account)
+
+    set_clause = statements[0].split(" SET ")[1].split(" WHERE ")[0]
+    assert "name=" in set_clause and "email" not in set_clause and "created_at" not in set_clause
+    assert updated.updated_at.year > 2000